@@ -0,0 +1,158 @@
+"""
+LLM Response Cache
+==================
+Content-addressable cache for LLM responses so identical requests (same model,
+prompt and input) are never paid for twice - across pages, schools and runs.
+
+Entries are plain JSON files under LLM_CACHE_DIR (default /tmp/llm_cache),
+sharded by the first two hex characters of the SHA256 key. A small in-process
+dict sits in front of the disk so hot keys (e.g. repeated titles) skip file I/O.
+
+Entries older than LLM_CACHE_MAX_AGE seconds (default 30 days, by file mtime) are
+deleted when read, and prune() trims the directory to LLM_CACHE_MAX_ENTRIES files
+(oldest first) so the cache cannot grow without bound.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Bump to invalidate every cached entry (e.g. if the stored value format changes)
+CACHE_VERSION = "v1"
+
+_MISSING = object()
+
+
+class LLMCache:
+    """Plain-JSON disk cache keyed by SHA256 of the request contents"""
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: Optional[bool] = None,
+                 max_age: Optional[float] = None, max_entries: Optional[int] = None):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory for cache files (default: LLM_CACHE_DIR env or /tmp/llm_cache)
+            enabled: Enable caching (default: LLM_CACHE_ENABLED env, true unless set to "false")
+            max_age: Seconds before an entry expires (default: LLM_CACHE_MAX_AGE env or 30 days)
+            max_entries: Files kept by prune() (default: LLM_CACHE_MAX_ENTRIES env or 50000)
+        """
+        if enabled is None:
+            enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() != "false"
+        if max_age is None:
+            max_age = float(os.getenv("LLM_CACHE_MAX_AGE", str(30 * 86400)))
+        if max_entries is None:
+            max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+        self.enabled = enabled
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir or os.getenv("LLM_CACHE_DIR", "/tmp/llm_cache"))
+        # key -> (stored_at, value)
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                print(f"WARNING: LLM cache disabled, cannot create {self.cache_dir}: {e}")
+                self.enabled = False
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from request parts (model, prompt, input, ...)"""
+        digest = hashlib.sha256(CACHE_VERSION.encode("utf-8"))
+        for part in parts:
+            digest.update(b"|")
+            digest.update((part or "").encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _expired(self, stored_at: float) -> bool:
+        return time.time() - stored_at > self.max_age
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on miss or if the entry has expired"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._memory.get(key, _MISSING)
+        if entry is not _MISSING:
+            stored_at, value = entry
+            if not self._expired(stored_at):
+                return value
+            with self._lock:
+                self._memory.pop(key, None)
+
+        path = self._path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if self._expired(stored_at):
+                path.unlink()
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        with self._lock:
+            self._memory[key] = (stored_at, value)
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serializable value under key"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._memory[key] = (time.time(), value)
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so concurrent workers never read a partial entry
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"value": value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"WARNING: Could not write LLM cache entry: {e}")
+
+    def prune(self) -> int:
+        """
+        Delete expired entries, then the oldest ones beyond max_entries
+
+        Returns:
+            Number of files deleted
+        """
+        if not self.enabled or not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        entries.sort(key=lambda e: e[0], reverse=True)
+        deleted = 0
+        for i, (stored_at, path) in enumerate(entries):
+            if i < self.max_entries and not self._expired(stored_at):
+                continue
+            try:
+                path.unlink()
+                deleted += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self._memory.clear()
+        return deleted
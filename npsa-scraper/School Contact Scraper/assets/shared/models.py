@@ -2,13 +2,15 @@
 Shared Data Models for Streaming Pipeline
 ==========================================
 Data classes for passing leads through the pipeline without CSV intermediate steps.
+All models use slots=True (no per-instance __dict__) since they are created by the
+tens of thousands per run; adding ad-hoc attributes to them is not supported.
 """
 
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class School:
     """School data model - output from Step 1"""
     place_id: str
@@ -60,7 +62,7 @@ class School:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Page data model - output from Step 3"""
     url: str
@@ -97,7 +99,7 @@ class Page:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Page content data model - output from Step 4"""
     url: str
@@ -134,7 +136,7 @@ class PageContent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """Contact data model - output from Step 5"""
     first_name: str = ""
@@ -157,6 +159,18 @@ class Contact:
             'source_url': self.source_url,
         }
     
+    def to_row(self) -> tuple:
+        """Convert to a CSV row in to_dict() column order (for csv.writer)"""
+        return (
+            self.first_name,
+            self.last_name,
+            self.title,
+            self.email or '',
+            self.phone or '',
+            self.school_name,
+            self.source_url,
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Contact':
         """Create Contact from dictionary"""
@@ -0,0 +1,51 @@
+"""
+Places Search Cache
+===================
+Disk cache for Google Places Text Search results so re-running discovery over the
+same counties does not pay for identical searches again.
+
+Same sharded plain-JSON layout as LLMCache, under PLACES_CACHE_DIR (default
+/tmp/places_cache). Listings change, so entries expire after PLACES_CACHE_MAX_AGE
+seconds (default 7 days) and prune() keeps at most PLACES_CACHE_MAX_ENTRIES files.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from assets.shared.llm_cache import LLMCache
+
+
+class PlacesCache(LLMCache):
+    """LLMCache whose entries (one query's raw place results) expire after max_age seconds"""
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: Optional[bool] = None,
+                 max_age: Optional[float] = None, max_entries: Optional[int] = None):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory for cache files (default: PLACES_CACHE_DIR env or /tmp/places_cache)
+            enabled: Enable caching (default: PLACES_CACHE_ENABLED env, true unless set to "false")
+            max_age: Seconds before an entry is refetched (default: PLACES_CACHE_MAX_AGE env or 7 days)
+            max_entries: Files kept by prune() (default: PLACES_CACHE_MAX_ENTRIES env or 20000)
+        """
+        if enabled is None:
+            enabled = os.getenv("PLACES_CACHE_ENABLED", "true").lower() != "false"
+        if max_age is None:
+            max_age = float(os.getenv("PLACES_CACHE_MAX_AGE", str(7 * 86400)))
+        if max_entries is None:
+            max_entries = int(os.getenv("PLACES_CACHE_MAX_ENTRIES", "20000"))
+        super().__init__(cache_dir or os.getenv("PLACES_CACHE_DIR", "/tmp/places_cache"), enabled,
+                         max_age=max_age, max_entries=max_entries)
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached place results for key, or None on miss or if the entry is stale"""
+        entry = super().get(key)
+        if not entry:
+            return None
+        return entry["places"]
+
+    def set(self, key: str, value: List[Dict[str, Any]]):
+        """Store one query's place results, stamped with the fetch time"""
+        super().set(key, {"fetched_at": time.time(), "places": value})
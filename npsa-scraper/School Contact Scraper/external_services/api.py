@@ -5,10 +5,12 @@ Processes states county-by-county to avoid timeout issues
 Last updated: 2025-12-13 - Force Railway redeploy
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import subprocess
 import os
+import io
 import json
 from datetime import datetime
 import pandas as pd
@@ -20,8 +22,11 @@ import requests
 import sys
 import gc  # For explicit garbage collection
 from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
 import resource  # For memory monitoring
 import logging  # For logging
+import logging.handlers
+import queue
 import platform  # For OS detection
 import multiprocessing  # For subprocess isolation
 import re  # For regex validation
@@ -35,6 +40,21 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+# Try to import pyarrow for multi-threaded CSV parsing and string kernels during aggregation (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Try to import orjson for faster JSON responses (optional - falls back to Flask's stdlib encoder)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # CRITICAL: Ensure dumb-init is PID 1 for proper process reaping
 # If Railway or another platform overrides the Dockerfile ENTRYPOINT,
 # this check ensures dumb-init still runs as PID 1
@@ -42,8 +62,10 @@ except ImportError:
 
 # Add parent directory to path to import pipeline
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from pipeline import StreamingPipeline
+from pipeline import StreamingPipeline, read_counties_file
 from assets.shared.models import Contact
+from assets.shared.llm_cache import LLMCache
+from assets.shared.places_cache import PlacesCache
 
 # Import authentication module
 from external_services.auth import require_auth, verify_password, generate_token
@@ -68,7 +90,23 @@ step11_contact_splitter = load_module_with_hyphen('step11-contact_splitter.py',
 step12_hunter_io = load_module_with_hyphen('step12-enrichment.py', 'step12_enrichment')
 step13_final_compiler = load_module_with_hyphen('step13-compiler.py', 'step13_compiler')
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; anything orjson rejects goes through the default encoder"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if HAS_ORJSON:
+    # jsonify() on the status endpoints (polled constantly) serializes through orjson
+    app.json = OrjsonProvider(app)
 
 # Verify dumb-init is PID 1 on startup (will only log once when app initializes)
 # Only log success, not warnings (warnings are handled in __main__ block)
@@ -108,13 +146,143 @@ CORS(app,
      automatic_options=True  # Automatically handle OPTIONS requests
 )
 
+class RunRegistry:
+    """
+    Thread-safe in-memory store of pipeline run state, keyed by run_id.
+    
+    Dict-style access (runs[run_id], get, pop, items, ...) is for reads; write fields through
+    update()/append() (a nested runs[run_id][key] = ... write is not seen by the status stream
+    until its next heartbeat) and use snapshot() for anything that is serialized, so readers
+    never see a half-applied update. items()/values() return lists, so
+    iterating is safe while runs are added or removed.
+    
+    Every update()/assignment/pop bumps a per-run version and wakes wait_for_change(), which
+    the status stream uses to push changes instead of being polled.
+    """
+    
+    def __init__(self):
+        # Re-entrant so update() can be called while a caller already holds the lock
+        self.lock = threading.RLock()
+        self._changed = threading.Condition(self.lock)
+        self._runs = {}
+        self._versions = {}
+    
+    def _bump(self, run_id: str):
+        # Caller holds self.lock
+        self._versions[run_id] = self._versions.get(run_id, 0) + 1
+        self._changed.notify_all()
+    
+    def __getitem__(self, run_id: str) -> dict:
+        with self.lock:
+            return self._runs[run_id]
+    
+    def __setitem__(self, run_id: str, run: dict):
+        with self.lock:
+            self._runs[run_id] = run
+            self._bump(run_id)
+    
+    def __contains__(self, run_id) -> bool:
+        with self.lock:
+            return run_id in self._runs
+    
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._runs)
+    
+    def get(self, run_id: str, default=None):
+        with self.lock:
+            return self._runs.get(run_id, default)
+    
+    def pop(self, run_id: str, default=None):
+        with self.lock:
+            run = self._runs.pop(run_id, default)
+            self._bump(run_id)
+            self._versions.pop(run_id, None)
+            return run
+    
+    def items(self) -> list:
+        with self.lock:
+            return list(self._runs.items())
+    
+    def values(self) -> list:
+        with self.lock:
+            return list(self._runs.values())
+    
+    def update(self, run_id: str, **fields):
+        """Update several fields of a run atomically (no-op if the run is gone)"""
+        with self.lock:
+            run = self._runs.get(run_id)
+            if run is not None:
+                run.update(fields)
+                self._bump(run_id)
+    
+    def append(self, run_id: str, **items):
+        """Append one value to each named list field of a run (created if missing; no-op if the run is gone)"""
+        with self.lock:
+            run = self._runs.get(run_id)
+            if run is not None:
+                for key, value in items.items():
+                    run.setdefault(key, []).append(value)
+                self._bump(run_id)
+    
+    def snapshot(self, run_id: str) -> Optional[dict]:
+        """Consistent copy of a run for serialization (lists copied too, since
+        county workers keep appending to them)"""
+        with self.lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return None
+            return {key: list(value) if isinstance(value, list) else value for key, value in run.items()}
+    
+    def version(self, run_id: str) -> int:
+        """Current change counter of a run (0 if unknown)"""
+        with self.lock:
+            return self._versions.get(run_id, 0)
+    
+    def wait_for_change(self, run_id: str, version: int, timeout: float) -> int:
+        """Block until the run's version differs from `version` or timeout passes; returns the current version"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._versions.get(run_id, 0) != version, timeout=timeout)
+            return self._versions.get(run_id, 0)
+
+
 # In-memory storage for pipeline runs (use Redis or database in production)
-pipeline_runs = {}
+pipeline_runs = RunRegistry()
 
 # Track running threads and cancellation flags
 # Format: {run_id: {'thread': Thread, 'cancelled': bool}}
 running_threads = {}
 
+# Finished runs (completed/error/cancelled) are evicted from pipeline_runs after RUN_STATE_MAX_AGE seconds;
+# their CSV stays on the volume, only the in-memory status (including csvData) is dropped
+RUN_STATE_MAX_AGE = int(os.getenv("RUN_STATE_MAX_AGE", "900"))
+RUN_REAPER_INTERVAL = 60
+_FINISHED_STATUSES = ("completed", "error", "cancelled")
+
+
+def _reap_finished_runs():
+    """Background loop: drop finished runs from pipeline_runs (and running_threads) once they are old enough"""
+    while True:
+        time.sleep(RUN_REAPER_INTERVAL)
+        try:
+            now = time.time()
+            for rid, run_data in pipeline_runs.items():
+                if run_data.get("status") not in _FINISHED_STATUSES:
+                    continue
+                finished_at = run_data.get("completedAt")
+                if finished_at is None:
+                    # error/cancelled runs carry no completedAt: start their clock now
+                    pipeline_runs.update(rid, completedAt=now)
+                    continue
+                if now - finished_at > RUN_STATE_MAX_AGE:
+                    pipeline_runs.pop(rid, None)
+                    thread = running_threads.get(rid, {}).get("thread")
+                    if not thread or not thread.is_alive():
+                        running_threads.pop(rid, None)
+                    print(f"[{rid}] Evicted finished run from memory")
+        except Exception as e:
+            print(f"[REAPER] Error evicting finished runs: {e}")
+
 
 def _unique_running_states_after_stale_cleanup() -> set:
     """Expire stale 'running' / old 'finalizing' entries; return set of state slugs still running."""
@@ -125,15 +293,13 @@ def _unique_running_states_after_stale_cleanup() -> set:
             if rid in running_threads:
                 thread = running_threads[rid].get("thread")
                 if not thread or not thread.is_alive():
-                    pipeline_runs[rid]["status"] = "cancelled"
+                    pipeline_runs.update(rid, status="cancelled")
             else:
-                pipeline_runs[rid]["status"] = "cancelled"
+                pipeline_runs.update(rid, status="cancelled")
         elif status == "finalizing":
             finalizing_at = run_data.get("finalizingAt", 0)
             if current_time - finalizing_at >= 120:
-                pipeline_runs[rid]["status"] = "completed"
-                if "completedAt" not in pipeline_runs[rid]:
-                    pipeline_runs[rid]["completedAt"] = current_time
+                pipeline_runs.update(rid, status="completed", completedAt=run_data.get("completedAt", current_time))
     unique: set = set()
     for rid, run_data in pipeline_runs.items():
         if run_data.get("status") != "running":
@@ -236,7 +402,8 @@ CLEANUP_DAYS = int(os.getenv("CLEANUP_DAYS", "7"))
 def cleanup_old_runs():
     """
     Clean up old completed runs to prevent storage exhaustion.
-    Deletes runs older than CLEANUP_DAYS that are completed or cancelled.
+    Deletes runs older than CLEANUP_DAYS that are completed or cancelled,
+    then prunes the LLM and Places response caches.
     """
     try:
         import shutil
@@ -320,6 +487,12 @@ def cleanup_old_runs():
             print(f"[CLEANUP] Cleaned up {deleted_count} old runs, freed ~{freed_mb:.2f} MB")
         else:
             print(f"[CLEANUP] No old runs to clean up (cutoff: {cutoff_date.isoformat()})")
+
+        # Response caches live outside the run dirs - expire and cap them here too
+        for cache in (LLMCache(), PlacesCache()):
+            pruned = cache.prune()
+            if pruned > 0:
+                print(f"[CLEANUP] Pruned {pruned} entries from {cache.cache_dir}")
     except Exception as e:
         print(f"[CLEANUP] Error during cleanup: {e}")
         import traceback
@@ -354,9 +527,36 @@ CHECKPOINT_BATCH_SIZE = int(os.getenv("CHECKPOINT_BATCH_SIZE", "1"))
 # Default to 4 for parallel processing
 MAX_WORKERS = int(os.getenv("MAX_WORKERS", "4"))
 
+# Google Places QPS budget for the whole service; each county worker gets an equal share
+# so parallel counties can't collectively exceed the project quota
+PLACES_MAX_QPS = float(os.getenv("PLACES_MAX_QPS", "10"))
+
+# Headless Chrome budget for the whole service (~500MB each), split evenly across county workers
+# like the Places QPS budget; each worker's pipeline gets at least one driver
+MAX_BROWSERS = int(os.getenv("MAX_BROWSERS", "8"))
+
+# Threads used to read county CSVs in parallel during aggregation
+AGGREGATION_READ_WORKERS = int(os.getenv("AGGREGATION_READ_WORKERS", "8"))
+
+# Per-county log lines from the main process (pool result loop, parallel CSV reads) are enqueued by
+# the calling thread and written to stdout by a single QueueListener thread, so county bookkeeping
+# never blocks on the stdout lock. Tracebacks are logged at DEBUG (COUNTY_LOG_LEVEL=DEBUG to see them).
+# Pool workers are forked children without the listener thread, so code running there keeps print().
+county_logger = logging.getLogger('api.counties')
+if not county_logger.handlers:
+    _county_log_queue = queue.SimpleQueue()
+    _county_stdout_handler = logging.StreamHandler(sys.stdout)
+    _county_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+    county_logger.addHandler(logging.handlers.QueueHandler(_county_log_queue))
+    county_logger.setLevel(os.getenv('COUNTY_LOG_LEVEL', 'INFO').upper())
+    county_logger.propagate = False
+    _county_log_listener = logging.handlers.QueueListener(_county_log_queue, _county_stdout_handler)
+    _county_log_listener.start()
+
 # Thread locks for thread-safe operations
 checkpoint_lock = threading.Lock()
-progress_lock = threading.Lock()
+# Guards pipeline_runs entries (the registry's own re-entrant lock)
+progress_lock = pipeline_runs.lock
 
 # ANSI escape codes for bold text
 BOLD = '\033[1m'
@@ -878,7 +1078,8 @@ def list_all_runs() -> list:
 
 def load_counties_from_state(state: str) -> list:
     """Load counties for a given state from assets/data/state_counties/{state}.txt
-    For Texas, checks for texas_top50.txt first (for faster processing)"""
+    For Texas, checks for texas_top50.txt first (for faster processing).
+    The file read itself is cached per path by pipeline.read_counties_file."""
     state_normalized = state.lower().replace(' ', '_')
     repo_root = Path(__file__).parent.parent
     
@@ -896,14 +1097,7 @@ def load_counties_from_state(state: str) -> list:
     if not state_file.exists():
         raise FileNotFoundError(f"State file not found: {state_file}")
     
-    counties = []
-    with open(state_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            county = line.strip()
-            if county and not county.startswith('#'):
-                counties.append(county)
-    
-    return counties
+    return list(read_counties_file(state_file))
 
 
 def _county_worker(state: str, county: str, run_id: str, county_index: int, total_counties: int, result_file: str):
@@ -943,7 +1137,9 @@ def _county_worker(state: str, county: str, run_id: str, county_index: int, tota
             global_max_api_calls=None,  # No limit for full state runs
             max_pages_per_school=2,  # Reduced from 3 to 2 for faster processing
             state=state,
-            chrome_tmp_dir=str(chrome_tmp_dir)
+            chrome_tmp_dir=str(chrome_tmp_dir),
+            places_max_qps=PLACES_MAX_QPS / max(1, MAX_WORKERS),
+            browser_pool_size=max(1, MAX_BROWSERS // max(1, MAX_WORKERS))
         )
         
         # Run pipeline for this single county - collects all contacts
@@ -953,22 +1149,17 @@ def _county_worker(state: str, county: str, run_id: str, county_index: int, tota
             output_csv=output_csv
         )
         
-        # Pipeline.run() already handles all compilation and writes to output_csv
-        # Just verify the file was created
-        all_contacts = pipeline.all_contacts
-        print(f"[{run_id}] SUCCESS {county}: {len(all_contacts)} contacts")
-        
-        # Count contacts with and without emails
-        contacts_with_emails = [c for c in all_contacts if c.has_email()]
-        contacts_without_emails = [c for c in all_contacts if not c.has_email()]
+        # Pipeline.run() streams contacts to output_csv and counts them in pipeline.stats
+        contacts_total = pipeline.stats.get('contacts_extracted', 0)
+        print(f"[{run_id}] SUCCESS {county}: {contacts_total} contacts")
         
         # Read results
         results = {
             'success': True,
             'schools': pipeline.stats.get('schools_processed', 0),
-            'contacts': len(all_contacts),
-            'contacts_with_emails': len(contacts_with_emails),
-            'contacts_without_emails': len(contacts_without_emails),
+            'contacts': contacts_total,
+            'contacts_with_emails': pipeline.stats.get('contacts_with_emails', 0),
+            'contacts_without_emails': pipeline.stats.get('contacts_without_emails', 0),
             'csv_path': output_csv if os.path.exists(output_csv) else None
         }
         
@@ -1002,8 +1193,10 @@ def _county_worker(state: str, county: str, run_id: str, county_index: int, tota
         print(f"[{run_id}] [{county}] CLEANUP BEFORE: Chrome processes - Active: {before_active}, Zombies: {before_zombies}, Orphaned: {before_orphaned}")
         
         try:
-            # First, try to quit the driver properly
-            if 'pipeline' in locals() and pipeline and hasattr(pipeline, 'content_collector') and pipeline.content_collector:
+            # First, try to quit the drivers properly
+            if 'pipeline' in locals() and pipeline and hasattr(pipeline, 'browser_pool') and pipeline.browser_pool:
+                pipeline.browser_pool.close()
+            elif 'pipeline' in locals() and pipeline and hasattr(pipeline, 'content_collector') and pipeline.content_collector:
                 if pipeline.content_collector.driver:
                     driver = pipeline.content_collector.driver
                     pipeline.content_collector.driver = None
@@ -1048,10 +1241,13 @@ def process_single_county(state: str, county: str, run_id: str, county_index: in
     result_file = str(run_dir / f"{county.replace(' ', '_')}_result.json")
     
     # Update progress
-    pipeline_runs[run_id]["statusMessage"] = f"Processing {county} County ({county_index + 1}/{total_counties})..."
-    pipeline_runs[run_id]["currentCounty"] = county
-    pipeline_runs[run_id]["currentCountyIndex"] = county_index + 1
-    pipeline_runs[run_id]["currentStep"] = 1
+    pipeline_runs.update(
+        run_id,
+        statusMessage=f"Processing {county} County ({county_index + 1}/{total_counties})...",
+        currentCounty=county,
+        currentCountyIndex=county_index + 1,
+        currentStep=1,
+    )
     
     # Start subprocess to run county
     # Use multiprocessing.Process to isolate the county processing
@@ -1136,104 +1332,144 @@ def process_county_worker_multiprocessing(args):
         return (idx, county, {'success': False, 'error': str(e)}, processing_time)
 
 
-def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
+# Contact fields read from county CSVs (pipeline output uses snake_case, older runs used display names)
+CONTACT_CSV_FIELDS = ('first_name', 'last_name', 'title', 'email', 'phone', 'school_name', 'source_url')
+
+
+def _normalize_column(name) -> str:
+    """'First Name' / 'First_Name' / 'first-name' -> 'first_name'"""
+    return str(name).strip().lower().replace(' ', '_').replace('-', '_')
+
+
+def _strip_column(column: pd.Series) -> pd.Series:
+    """Column as stripped strings with missing values as ''.
+    Uses Arrow's utf8_trim_whitespace kernel (one C-level pass, no per-cell Python calls)
+    when pyarrow is installed and the column casts cleanly to strings."""
+    if HAS_PYARROW:
+        try:
+            values = pa.array(column, type=pa.string(), from_pandas=True)
+            trimmed = pc.fill_null(pc.utf8_trim_whitespace(values), '')
+            return trimmed.to_pandas().set_axis(column.index)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return column.fillna('').astype(str).str.strip()
+
+
+def _clean_contact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Reduce a county CSV DataFrame to CONTACT_CSV_FIELDS string columns.
+    Each field is cleaned with one vectorized strip pass per column
+    (first non-empty spelling wins) instead of per-row coercion."""
+    # One pass over the header groups every spelling of each field
+    columns_by_field = {}
+    for column in df.columns:
+        columns_by_field.setdefault(_normalize_column(column), []).append(column)
+    
+    fields = {}
+    for field in CONTACT_CSV_FIELDS:
+        values = pd.Series('', index=df.index, dtype=object)
+        # The exact snake_case column wins; other spellings only fill its blanks
+        for column in sorted(columns_by_field.get(field, ()), key=lambda c: c != field):
+            values = values.where(values != '', _strip_column(df[column]))
+        fields[field] = values
+    
+    return pd.DataFrame(fields, columns=list(CONTACT_CSV_FIELDS))
+
+
+def _contacts_from_frame(df: pd.DataFrame) -> list:
+    """Convert a cleaned contacts DataFrame (see _clean_contact_frame) into Contact objects"""
+    return [
+        Contact(
+            first_name=record['first_name'],
+            last_name=record['last_name'],
+            title=record['title'],
+            email=record['email'] or None,
+            phone=record['phone'],
+            school_name=record['school_name'],
+            source_url=record['source_url']
+        )
+        for record in df.to_dict('records')
+    ]
+
+
+def _aggregation_keys(df: pd.DataFrame) -> pd.Series:
+    """Exact-duplicate key per row of a cleaned contacts frame, used while streaming county results together.
+    Deliberately narrower than FinalCompiler.deduplicate_contacts (normalized email, else the
+    whole row), so it only removes rows step 13 would drop anyway."""
+    email = df['email'].str.lower()
+    row = df[CONTACT_CSV_FIELDS[0]]
+    for field in CONTACT_CSV_FIELDS[1:]:
+        row = row + '\x1f' + df[field]
+    return ('email|' + email).where(email != '', 'row|' + row)
+
+
+def _read_county_csv(run_id: str, county_csv: Path) -> Optional[pd.DataFrame]:
+    """Read one county's final_contacts.csv; None if it is missing or unreadable"""
+    if not county_csv.exists():
+        return None
+    try:
+        # Everything is read as plain strings: no NaN to fill and no float coercion of phone numbers
+        if HAS_PYARROW:
+            try:
+                # Arrow's reader parses each file with multiple threads
+                return pd.read_csv(county_csv, dtype=str, keep_default_na=False, engine="pyarrow")
+            except Exception as e:
+                county_logger.warning("[%s] pyarrow could not parse %s (%s), retrying with the default parser", run_id, county_csv, e)
+        return pd.read_csv(county_csv, dtype=str, keep_default_na=False)
+    except Exception as e:
+        county_logger.warning("[%s] Error reading %s: %s", run_id, county_csv, e)
+        county_logger.debug("[%s] Traceback for %s", run_id, county_csv, exc_info=True)
+        return None
+
+
+def aggregate_final_results(run_id: str, state: str):
     """Aggregate all county results, run global Steps 11-13, and generate final CSV
     
+    Called once the county pool has returned every county (or manually, with whatever
+    county data is available), so there is nothing to wait for here.
+    
     Args:
         run_id: Run ID
         state: State name
-        skip_wait: If True, skip waiting for counties and proceed immediately with available data
     """
     try:
         counties = load_counties_from_state(state)
         run_dir = RUNS_DIR / run_id
         
-        pipeline_runs[run_id]["statusMessage"] = "Waiting for all counties to complete..."
-        
-        # Wait for all counties to complete (check that all CSV files exist)
-        # With multiprocessing pool, counties should complete more reliably, but add timeout as safety
-        # Skip wait if manually triggered (skip_wait=True)
-        if not skip_wait:
-            max_wait_time = 7200  # 2 hours max wait (increased for large states)
-            wait_interval = 5  # Check every 5 seconds
-            elapsed_time = 0
-            
-            while elapsed_time < max_wait_time:
-                all_complete = True
-                missing_counties = []
-                
-                for county in counties:
-                    county_dir = run_dir / county.replace(' ', '_')
-                    county_csv = county_dir / "final_contacts.csv"
-                    if not county_csv.exists():
-                        all_complete = False
-                        missing_counties.append(county)
-                    else:
-                        # File exists, check if empty
-                        file_size = county_csv.stat().st_size if county_csv.exists() else 0
-                        # Skip empty files - they'll be handled during aggregation
-                
-                if all_complete:
-                    print(f"[{run_id}] All {len(counties)} counties completed, proceeding with aggregation...")
-                    break
-                
-                if elapsed_time % 30 == 0:  # Log every 30 seconds
-                    print(f"[{run_id}] Waiting for {len(missing_counties)} counties to complete: {', '.join(missing_counties[:3])}...")
-                
-                time.sleep(wait_interval)
-                elapsed_time += wait_interval
-            
-            if not all_complete:
-                print(f"[{run_id}] WARNING: Some counties did not complete within timeout. Proceeding with available data...")
-        else:
-            # Skip wait - proceed immediately with available data
-            print(f"[{run_id}] Skipping wait - proceeding with available county data...")
-        
-        pipeline_runs[run_id]["statusMessage"] = "Aggregating results from all counties..."
+        pipeline_runs.update(run_id, statusMessage="Aggregating results from all counties...")
+        
+        # Read county CSVs in parallel (pd.read_csv releases the GIL while parsing) and fold each one
+        # into a cleaned contacts frame as it arrives, dropping exact duplicates across counties on the way.
+        # Steps 11-13 then run on DataFrames; only the rows sent to Hunter become Contact objects.
+        county_csvs = [run_dir / county.replace(' ', '_') / "final_contacts.csv" for county in counties]
+        contact_frames = []
+        seen_keys = set()
+        with ThreadPoolExecutor(max_workers=AGGREGATION_READ_WORKERS) as executor:
+            county_frames = executor.map(lambda path: _read_county_csv(run_id, path), county_csvs)
+            for county, df in zip(counties, county_frames):
+                if df is None or len(df) == 0:
+                    continue
+                cleaned = _clean_contact_frame(df)
+                keys = _aggregation_keys(cleaned)
+                fresh = ~keys.isin(seen_keys) & ~keys.duplicated()
+                seen_keys.update(keys[fresh])
+                contact_frames.append(cleaned[fresh])
+                county_logger.info("[%s] Loaded %d contacts from %s County", run_id, len(df), county)
+        del seen_keys
+        all_contacts_df = (
+            pd.concat(contact_frames, ignore_index=True) if contact_frames
+            else pd.DataFrame(columns=list(CONTACT_CSV_FIELDS))
+        )
+        del contact_frames
         
-        # Read and combine all county CSVs into Contact objects
-        all_contacts = []
-        for county in counties:
-            county_dir = run_dir / county.replace(' ', '_')
-            county_csv = county_dir / "final_contacts.csv"
-            
-            if county_csv.exists():
-                try:
-                    df = pd.read_csv(county_csv)
-                    if len(df) > 0:
-                        # Convert DataFrame rows to Contact objects
-                        for _, row in df.iterrows():
-                            # Safe coercion helpers
-                            def sval(val):
-                                return str(val).strip() if val is not None and not (isinstance(val, float) and pd.isna(val)) else ""
-                            
-                            email_raw = row.get('email', '') or row.get('Email', '')
-                            email_val = sval(email_raw)
-                            if not email_val:
-                                email_val = None
-                            
-                            contact = Contact(
-                                first_name=sval(row.get('first_name', '') or row.get('First Name', '')),
-                                last_name=sval(row.get('last_name', '') or row.get('Last Name', '')),
-                                title=sval(row.get('title', '') or row.get('Title', '')),
-                                email=email_val,
-                                phone=sval(row.get('phone', '') or row.get('Phone', '')),
-                                school_name=sval(row.get('school_name', '') or row.get('School Name', '')),
-                                source_url=sval(row.get('source_url', '') or row.get('Source URL', ''))
-                            )
-                            all_contacts.append(contact)
-                        print(f"[{run_id}] Loaded {len(df)} contacts from {county} County")
-                except Exception as e:
-                    print(f"[{run_id}] Error reading {county_csv}: {e}")
-                    import traceback
-                    traceback.print_exc()
-        
-        if not all_contacts:
+        if all_contacts_df.empty:
             print(f"[{run_id}] No contacts found in any county")
             # Set to finalizing for 2-minute cooldown
-            pipeline_runs[run_id]["status"] = "finalizing"
-            pipeline_runs[run_id]["statusMessage"] = "Pipeline completed but no contacts found. Finalizing..."
-            pipeline_runs[run_id]["finalizingAt"] = time.time()
+            pipeline_runs.update(
+                run_id,
+                status="finalizing",
+                statusMessage="Pipeline completed but no contacts found. Finalizing...",
+                finalizingAt=time.time(),
+            )
             
             # Create restart marker for start.sh to detect restart
             try:
@@ -1246,9 +1482,12 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
             def finalize_completion():
                 time.sleep(120)  # 2-minute cooldown
                 if run_id in pipeline_runs and pipeline_runs[run_id].get("status") == "finalizing":
-                    pipeline_runs[run_id]["status"] = "completed"
-                    pipeline_runs[run_id]["statusMessage"] = "Pipeline completed but no contacts found."
-                    pipeline_runs[run_id]["completedAt"] = time.time()
+                    pipeline_runs.update(
+                        run_id,
+                        status="completed",
+                        statusMessage="Pipeline completed but no contacts found.",
+                        completedAt=time.time(),
+                    )
                     # Final data saved - clean up ephemeral run data
                     cleanup_ephemeral_run(run_id)
                     if not pipeline_runs[run_id].get("notify_sent"):
@@ -1256,36 +1495,41 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
                         send_run_complete_email(
                             run_id, state, len(counties), len(counties), 0, 0, duration
                         )
-                        pipeline_runs[run_id]["notify_sent"] = True
+                        pipeline_runs.update(run_id, notify_sent=True)
             
             finalize_thread = threading.Thread(target=finalize_completion, daemon=True)
             finalize_thread.start()
-            pipeline_runs[run_id]["totalContacts"] = 0
-            pipeline_runs[run_id]["completedAt"] = time.time()
+            pipeline_runs.update(
+                run_id,
+                totalContacts=0,
+                completedAt=time.time(),
+            )
             return
         
-        print(f"[{run_id}] Total contacts collected: {len(all_contacts)}")
+        print(f"[{run_id}] Total contacts collected: {len(all_contacts_df)}")
         
         # STEP 11: Split contacts into with/without emails
-        pipeline_runs[run_id]["statusMessage"] = "Step 11: Splitting contacts..."
+        pipeline_runs.update(run_id, statusMessage="Step 11: Splitting contacts...")
         splitter = step11_contact_splitter.ContactSplitter()
-        contacts_with_emails, contacts_without_emails = splitter.split_contacts(all_contacts)
+        contacts_with_emails_df, contacts_without_emails_df = splitter.split_frame(all_contacts_df)
         
-        print(f"[{run_id}] Step 11 complete: {len(contacts_with_emails)} with emails, {len(contacts_without_emails)} without emails")
+        print(f"[{run_id}] Step 11 complete: {len(contacts_with_emails_df)} with emails, {len(contacts_without_emails_df)} without emails")
         
         # Deduplicate BEFORE enrichment (saves Hunter credits)
         compiler = step13_final_compiler.FinalCompiler()
-        deduplicated = compiler.deduplicate_contacts_only(contacts_with_emails, contacts_without_emails)
-        contacts_with_emails_deduped = [c for c in deduplicated if c.has_email()]
-        contacts_without_emails_deduped = [c for c in deduplicated if not c.has_email()]
-        print(f"[{run_id}] Deduplication: {len(contacts_with_emails) + len(contacts_without_emails)} -> {len(deduplicated)} (before Hunter)")
+        deduplicated_df = compiler.deduplicate_contacts(all_contacts_df)
+        has_email = deduplicated_df['email'].str.strip() != ''
+        contacts_with_emails_deduped_df = deduplicated_df[has_email]
+        contacts_without_emails_deduped = _contacts_from_frame(deduplicated_df[~has_email])
+        print(f"[{run_id}] Deduplication: {len(all_contacts_df)} -> {len(deduplicated_df)} (before Hunter)")
+        del all_contacts_df, contacts_with_emails_df, contacts_without_emails_df
         
         # STEP 12: Email Enrichment with Hunter.io (optional, on deduplicated contacts only)
         contacts_enriched = []
         hunter_io_enabled = os.getenv('HUNTER_IO_API_KEY') is not None
         
         if hunter_io_enabled and contacts_without_emails_deduped:
-            pipeline_runs[run_id]["statusMessage"] = f"Step 12: Enriching {len(contacts_without_emails_deduped)} contacts with Hunter.io..."
+            pipeline_runs.update(run_id, statusMessage=f"Step 12: Enriching {len(contacts_without_emails_deduped)} contacts with Hunter.io...")
             try:
                 enricher = step12_hunter_io.HunterIOEnricher(
                     api_key=os.getenv('HUNTER_IO_API_KEY'),
@@ -1309,12 +1553,17 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
             print(f"[{run_id}] Step 12 skipped: No contacts without emails to enrich")
         
         # STEP 13: Compile final CSV (already deduplicated)
-        pipeline_runs[run_id]["statusMessage"] = "Step 13: Compiling final CSV..."
+        pipeline_runs.update(run_id, statusMessage="Step 13: Compiling final CSV...")
         final_output_csv = str(run_dir / f"{state.title()}_leads_final.csv")
         
-        final_csv_path = compiler.compile_contacts_to_csv(
-            contacts_with_emails=contacts_with_emails_deduped,
-            contacts_enriched=contacts_enriched,
+        print(f"[{run_id}] Step 13: Compiling {len(contacts_with_emails_deduped_df)} with emails, {len(contacts_enriched)} enriched")
+        final_contacts_df = pd.concat(
+            [contacts_with_emails_deduped_df,
+             pd.DataFrame([c.to_dict() for c in contacts_enriched], columns=list(CONTACT_CSV_FIELDS))],
+            ignore_index=True
+        )
+        final_csv_path = compiler.compile_frame_to_csv(
+            final_contacts_df,
             output_csv=final_output_csv,
             state=state,
             already_deduplicated=True
@@ -1325,12 +1574,15 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
         # Read final CSV and copy to volume (only persistent storage)
         final_data_saved_to_volume = False
         if os.path.exists(final_csv_path):
-            with open(final_csv_path, 'r') as f:
-                csv_content = f.read()
+            # Read the compiled CSV once: the same text backs csvData and the final counts below
+            csv_content = Path(final_csv_path).read_text(encoding='utf-8')
             
             csv_filename = f"{state.title()}_leads_{run_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            pipeline_runs[run_id]["csvData"] = csv_content
-            pipeline_runs[run_id]["csvFilename"] = csv_filename
+            pipeline_runs.update(
+                run_id,
+                csvData=csv_content,
+                csvFilename=csv_filename,
+            )
         
             # Copy final CSV to volume (only thing persisted)
             volume_csv_path = VOLUME_DIR / csv_filename
@@ -1344,18 +1596,23 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
                 print(f"[{run_id}] WARNING: Could not copy final CSV to volume: {e}")
         
             # Count final contacts
-            final_df = pd.read_csv(final_csv_path)
+            final_df = pd.read_csv(io.StringIO(csv_content), dtype=str, keep_default_na=False)
             email_col = 'email' if 'email' in final_df.columns else 'Email'
-            if email_col in final_df.columns:
-                contacts_with_emails_final = final_df[final_df[email_col].notna() & (final_df[email_col] != '') & (final_df[email_col].str.strip() != '')]
-                contacts_without_emails_final = final_df[final_df[email_col].isna() | (final_df[email_col] == '') | (final_df[email_col].str.strip() == '')]
+            if final_df.empty or email_col not in final_df.columns:
+                total_with_emails = 0
             else:
-                contacts_with_emails_final = pd.DataFrame()
-                contacts_without_emails_final = final_df
+                # Single mask: an email counts if it is non-blank after stripping
+                # (Arrow string kernels when pyarrow is installed)
+                emails = final_df[email_col].astype('string[pyarrow]' if HAS_PYARROW else str)
+                total_with_emails = int((emails.str.strip() != '').sum())
+            total_without_emails = len(final_df) - total_with_emails
             
-            pipeline_runs[run_id]["totalContacts"] = len(final_df)
-            pipeline_runs[run_id]["totalContactsWithEmails"] = len(contacts_with_emails_final)
-            pipeline_runs[run_id]["totalContactsWithoutEmails"] = len(contacts_without_emails_final)
+            pipeline_runs.update(
+                run_id,
+                totalContacts=len(final_df),
+                totalContactsWithEmails=total_with_emails,
+                totalContactsWithoutEmails=total_without_emails,
+            )
             
             # Save metadata (ephemeral) - final_csv_path on volume for reference
             metadata = load_run_metadata(run_id) or {}
@@ -1363,8 +1620,8 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
                 "final_csv_path": str(volume_csv_path) if volume_saved else final_csv_path,
                 "csv_filename": csv_filename,
                 "total_contacts": len(final_df),
-                "total_contacts_with_emails": len(contacts_with_emails_final),
-                "total_contacts_without_emails": len(contacts_without_emails_final),
+                "total_contacts_with_emails": total_with_emails,
+                "total_contacts_without_emails": total_without_emails,
                 "status": "finalizing"  # Will be updated to "completed" after 2-minute cooldown
             })
             if not metadata.get("display_name"):
@@ -1372,17 +1629,23 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
             save_run_metadata(run_id, metadata)
         else:
             print(f"[{run_id}] ERROR: Final CSV not created at {final_csv_path}")
-            pipeline_runs[run_id]["totalContacts"] = len(deduplicated)
-            pipeline_runs[run_id]["totalContactsWithEmails"] = len(contacts_with_emails_deduped) + len(contacts_enriched)
-            pipeline_runs[run_id]["totalContactsWithoutEmails"] = len(contacts_without_emails_deduped) - len(contacts_enriched)
+            pipeline_runs.update(
+                run_id,
+                totalContacts=len(deduplicated_df),
+                totalContactsWithEmails=len(contacts_with_emails_deduped_df) + len(contacts_enriched),
+                totalContactsWithoutEmails=len(contacts_without_emails_deduped) - len(contacts_enriched),
+            )
         
         # Update final stats - set to finalizing for 2-minute cooldown
-        pipeline_runs[run_id]["status"] = "finalizing"
-        pipeline_runs[run_id]["statusMessage"] = f"Pipeline completed! Processed {len(counties)} counties. Enriched {len(contacts_enriched)} contacts. Finalizing..."
-        pipeline_runs[run_id]["currentStep"] = 13
-        pipeline_runs[run_id]["progress"] = 100
-        pipeline_runs[run_id]["countiesProcessed"] = len(counties)
-        pipeline_runs[run_id]["finalizingAt"] = time.time()  # Track when finalizing started
+        pipeline_runs.update(
+            run_id,
+            status="finalizing",
+            statusMessage=f"Pipeline completed! Processed {len(counties)} counties. Enriched {len(contacts_enriched)} contacts. Finalizing...",
+            currentStep=13,
+            progress=100,
+            countiesProcessed=len(counties),
+            finalizingAt=time.time(),  # Track when finalizing started
+        )
         
         # Create restart marker for start.sh to detect restart
         try:
@@ -1395,9 +1658,12 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
         def finalize_completion():
             time.sleep(120)  # 2-minute cooldown
             if run_id in pipeline_runs and pipeline_runs[run_id].get("status") == "finalizing":
-                pipeline_runs[run_id]["status"] = "completed"
-                pipeline_runs[run_id]["statusMessage"] = f"Pipeline completed! Processed {len(counties)} counties. Enriched {len(contacts_enriched)} contacts."
-                pipeline_runs[run_id]["completedAt"] = time.time()
+                pipeline_runs.update(
+                    run_id,
+                    status="completed",
+                    statusMessage=f"Pipeline completed! Processed {len(counties)} counties. Enriched {len(contacts_enriched)} contacts.",
+                    completedAt=time.time(),
+                )
                 
                 # Update metadata to mark as completed (so it appears in Finished tab)
                 metadata = load_run_metadata(run_id) or {}
@@ -1420,7 +1686,7 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
                         pipeline_runs[run_id].get("totalContactsWithEmails", 0),
                         duration,
                     )
-                    pipeline_runs[run_id]["notify_sent"] = True
+                    pipeline_runs.update(run_id, notify_sent=True)
         
         # Clean up ephemeral run data only after final CSV successfully saved to volume
         if final_data_saved_to_volume:
@@ -1430,9 +1696,12 @@ def aggregate_final_results(run_id: str, state: str, skip_wait: bool = False):
         finalize_thread.start()
         
     except Exception as e:
-        pipeline_runs[run_id]["status"] = "error"
-        pipeline_runs[run_id]["error"] = str(e)
-        pipeline_runs[run_id]["statusMessage"] = f"Failed to aggregate results: {str(e)}"
+        pipeline_runs.update(
+            run_id,
+            status="error",
+            error=str(e),
+            statusMessage=f"Failed to aggregate results: {str(e)}",
+        )
         import traceback
         traceback.print_exc()
 
@@ -1562,10 +1831,13 @@ def run_streaming_pipeline(
                 print(f"[{run_id}] New run started: {total_counties} counties to process")
             
             # Update progress tracking with county info
-            pipeline_runs[run_id]["totalCounties"] = total_counties
-            pipeline_runs[run_id]["statusMessage"] = f"Processing {state} ({len(completed_counties)}/{total_counties} counties completed)..."
-            pipeline_runs[run_id]["currentCounty"] = "Starting..." if not completed_counties else f"Resuming from {len(completed_counties)}/{total_counties}"
-            pipeline_runs[run_id]["countiesProcessed"] = len(completed_counties)
+            pipeline_runs.update(
+                run_id,
+                totalCounties=total_counties,
+                statusMessage=f"Processing {state} ({len(completed_counties)}/{total_counties} counties completed)...",
+                currentCounty="Starting..." if not completed_counties else f"Resuming from {len(completed_counties)}/{total_counties}",
+                countiesProcessed=len(completed_counties),
+            )
             
             # Calculate static initial estimated time remaining (only if not already set)
             # Average county time: 871 seconds (~14.5 minutes) based on Arkansas run analysis
@@ -1575,7 +1847,7 @@ def run_streaming_pipeline(
                 # Account for parallel processing (MAX_WORKERS)
                 effective_remaining = max(1, remaining_counties / MAX_WORKERS)
                 initial_estimate = effective_remaining * avg_time_per_county
-                pipeline_runs[run_id]["initialEstimatedTimeRemaining"] = int(initial_estimate)
+                pipeline_runs.update(run_id, initialEstimatedTimeRemaining=int(initial_estimate))
             
             # Determine processing mode message
             remaining_count = total_counties - len(completed_counties)
@@ -1590,9 +1862,12 @@ def run_streaming_pipeline(
             if not remaining_counties:
                 print(f"[{run_id}] All counties already completed!")
                 # Update progress to show all complete
-                pipeline_runs[run_id]["progress"] = 100
-                pipeline_runs[run_id]["countiesProcessed"] = total_counties
-                pipeline_runs[run_id]["statusMessage"] = f"All {total_counties} counties already completed"
+                pipeline_runs.update(
+                    run_id,
+                    progress=100,
+                    countiesProcessed=total_counties,
+                    statusMessage=f"All {total_counties} counties already completed",
+                )
                 # Continue to aggregation - skip the pool processing
             else:
                 # UNIFIED PROCESSING: Use Pool for both sequential (MAX_WORKERS=1) and parallel (MAX_WORKERS>1)
@@ -1611,15 +1886,18 @@ def run_streaming_pipeline(
                             if running_threads.get(run_id, {}).get('cancelled', False):
                                 pool.terminate()  # Force kill all workers
                                 pool.join()
-                                pipeline_runs[run_id]["status"] = "cancelled"
-                                pipeline_runs[run_id]["statusMessage"] = "Pipeline cancelled by user"
+                                pipeline_runs.update(
+                                    run_id,
+                                    status="cancelled",
+                                    statusMessage="Pipeline cancelled by user",
+                                )
                                 print(f"[{run_id}] Pipeline cancelled during processing")
                                 return
                             
                             # Handle worker failures gracefully - continue processing other counties
                             if not result.get('success', False):
                                 error_msg = result.get('error', 'Unknown error')
-                                print(f"[{run_id}] WARNING: {county} County failed: {error_msg}")
+                                county_logger.warning("[%s] WARNING: %s County failed: %s", run_id, county, error_msg)
                                 failed_counties.append(county)
                                 # Still mark as completed to avoid infinite retry, but log the failure
                                 with checkpoint_lock:
@@ -1637,34 +1915,35 @@ def run_streaming_pipeline(
                             
                             # Update pipeline_runs state
                             with progress_lock:
-                                pipeline_runs[run_id]["progress"] = progress_pct
-                                pipeline_runs[run_id]["statusMessage"] = f"Processing {completed}/{total_counties} counties..."
-                                pipeline_runs[run_id]["countiesProcessed"] = completed
+                                pipeline_runs.update(
+                                    run_id,
+                                    progress=progress_pct,
+                                    statusMessage=f"Processing {completed}/{total_counties} counties...",
+                                    countiesProcessed=completed,
+                                )
                                 # Set currentCounty to show progress (since we're processing in parallel, show the count)
                                 # This replaces "Initializing..." with actual progress
                                 if completed < total_counties:
-                                    pipeline_runs[run_id]["currentCounty"] = f"Processing {completed}/{total_counties} counties"
+                                    current_county = f"Processing {completed}/{total_counties} counties"
                                 else:
-                                    pipeline_runs[run_id]["currentCounty"] = f"All {total_counties} counties completed"
-                                pipeline_runs[run_id]["schoolsFound"] = pipeline_runs[run_id].get("schoolsFound", 0) + result.get('schools', 0)
-                                pipeline_runs[run_id]["schoolsProcessed"] = pipeline_runs[run_id].get("schoolsProcessed", 0) + result.get('schools', 0)
-                                
-                                # Track county timing for average calculation
-                                if "countyTimes" not in pipeline_runs[run_id]:
-                                    pipeline_runs[run_id]["countyTimes"] = []
-                                pipeline_runs[run_id]["countyTimes"].append(processing_time)
-                                
-                                # Track per-county contacts and schools for graphs
-                                if "countyContacts" not in pipeline_runs[run_id]:
-                                    pipeline_runs[run_id]["countyContacts"] = []
-                                if "countySchools" not in pipeline_runs[run_id]:
-                                    pipeline_runs[run_id]["countySchools"] = []
+                                    current_county = f"All {total_counties} counties completed"
+                                pipeline_runs.update(
+                                    run_id,
+                                    currentCounty=current_county,
+                                    schoolsFound=pipeline_runs[run_id].get("schoolsFound", 0) + result.get('schools', 0),
+                                    schoolsProcessed=pipeline_runs[run_id].get("schoolsProcessed", 0) + result.get('schools', 0),
+                                )
                                 
-                                pipeline_runs[run_id]["countyContacts"].append(result.get('contacts', 0))
-                                pipeline_runs[run_id]["countySchools"].append(result.get('schools', 0))
+                                # Track county timing for average calculation, and per-county contacts and schools for graphs
+                                pipeline_runs.append(
+                                    run_id,
+                                    countyTimes=processing_time,
+                                    countyContacts=result.get('contacts', 0),
+                                    countySchools=result.get('schools', 0),
+                                )
                             
-                            print(f"[{run_id}] Completed {county} County in {processing_time:.1f} seconds")
-                            print(f"[{run_id}] Progress: {completed}/{total_counties} counties completed")
+                            county_logger.info("[%s] Completed %s County in %.1f seconds", run_id, county, processing_time)
+                            county_logger.info("[%s] Progress: %d/%d counties completed", run_id, completed, total_counties)
                             
                             # Save checkpoint after every county (CHECKPOINT_BATCH_SIZE=1) or at completion
                             # This is for progress tracking only - runs always start fresh, no resume logic
@@ -1694,7 +1973,7 @@ def run_streaming_pipeline(
                                     metadata["display_name"] = _run_display_name(state, "school")
                                 save_run_metadata(run_id, metadata)
                                 
-                                print(f"[{run_id}] Checkpoint saved after {completed} counties")
+                                county_logger.info("[%s] Checkpoint saved after %d counties", run_id, completed)
                             
                             # Health check after each county (lists remaining processes)
                             check_health()
@@ -1704,10 +1983,6 @@ def run_streaming_pipeline(
                             
                             # EXPLICIT GARBAGE COLLECTION: Force cleanup after each county
                             gc.collect()
-                            
-                            # 2-second delay between counties to provide buffer for cleanup
-                            if completed < total_counties:
-                                time.sleep(2.0)
                     
                     except KeyboardInterrupt:
                         print(f"[{run_id}] Interrupted by user, cleaning up...")
@@ -1715,8 +1990,11 @@ def run_streaming_pipeline(
                         pool.join()
                         # Save checkpoint before exiting
                         save_checkpoint(run_id, state, completed_counties, start_index + len(completed_counties), total_counties)
-                        pipeline_runs[run_id]["status"] = "cancelled"
-                        pipeline_runs[run_id]["statusMessage"] = "Pipeline cancelled by user"
+                        pipeline_runs.update(
+                            run_id,
+                            status="cancelled",
+                            statusMessage="Pipeline cancelled by user",
+                        )
                         return
                     except Exception as e:
                         print(f"[{run_id}] Error in pool processing: {e}")
@@ -1732,18 +2010,22 @@ def run_streaming_pipeline(
                         else:
                             # No progress made, mark as error
                             if run_id in pipeline_runs:
-                                pipeline_runs[run_id]["status"] = "error"
-                                pipeline_runs[run_id]["error"] = f"Pool processing failed: {str(e)}"
-                                pipeline_runs[run_id]["statusMessage"] = f"Pipeline failed: {str(e)}"
+                                pipeline_runs.update(
+                                    run_id,
+                                    status="error",
+                                    error=f"Pool processing failed: {str(e)}",
+                                    statusMessage=f"Pipeline failed: {str(e)}",
+                                )
                     
                     # Log any failed counties after all processing completes
                     if failed_counties:
                         print(f"[{run_id}] WARNING: {len(failed_counties)} counties failed: {', '.join(failed_counties)}")
                         if run_id in pipeline_runs:
-                            pipeline_runs[run_id]["statusMessage"] = f"Completed with {len(failed_counties)} failures"
+                            pipeline_runs.update(run_id, statusMessage=f"Completed with {len(failed_counties)} failures")
                             return
             
-            # All counties completed, aggregate results
+            # All counties completed, aggregate results. The pool has returned every county's result,
+            # so there is nothing left to wait for (counties with no contacts never write a CSV).
             print(f"[{run_id}] All counties completed ({len(completed_counties)}/{total_counties}), starting aggregation...")
             try:
                 aggregate_final_results(run_id, state)
@@ -1753,8 +2035,11 @@ def run_streaming_pipeline(
                 traceback.print_exc()
                 # Still mark as completed if we have results
                 if run_id in pipeline_runs:
-                    pipeline_runs[run_id]["status"] = "error"
-                    pipeline_runs[run_id]["error"] = f"Aggregation failed: {str(e)}"
+                    pipeline_runs.update(
+                        run_id,
+                        status="error",
+                        error=f"Aggregation failed: {str(e)}",
+                    )
             
             # Final checkpoint - mark as completed (always save, even if aggregation failed)
             save_checkpoint(run_id, state, completed_counties, len(counties), total_counties)
@@ -1776,10 +2061,13 @@ def run_streaming_pipeline(
             # Final status update - set to finalizing for 2-minute cooldown
             if run_id in pipeline_runs:
                 if pipeline_runs[run_id].get("status") != "error":
-                    pipeline_runs[run_id]["status"] = "finalizing"
-                    pipeline_runs[run_id]["statusMessage"] = f"Pipeline completed: {len(completed_counties)}/{total_counties} counties processed. Finalizing..."
-                    pipeline_runs[run_id]["finalizingAt"] = time.time()
-                    pipeline_runs[run_id]["containerResetRequested"] = True
+                    pipeline_runs.update(
+                        run_id,
+                        status="finalizing",
+                        statusMessage=f"Pipeline completed: {len(completed_counties)}/{total_counties} counties processed. Finalizing...",
+                        finalizingAt=time.time(),
+                        containerResetRequested=True,
+                    )
                     
                     # Create restart marker for start.sh to detect restart
                     try:
@@ -1792,9 +2080,12 @@ def run_streaming_pipeline(
                     def finalize_completion():
                         time.sleep(120)  # 2-minute cooldown
                         if run_id in pipeline_runs and pipeline_runs[run_id].get("status") == "finalizing":
-                            pipeline_runs[run_id]["status"] = "completed"
-                            pipeline_runs[run_id]["statusMessage"] = f"Pipeline completed: {len(completed_counties)}/{total_counties} counties processed"
-                            pipeline_runs[run_id]["completedAt"] = time.time()
+                            pipeline_runs.update(
+                                run_id,
+                                status="completed",
+                                statusMessage=f"Pipeline completed: {len(completed_counties)}/{total_counties} counties processed",
+                                completedAt=time.time(),
+                            )
                             if not pipeline_runs[run_id].get("notify_sent"):
                                 duration = time.time() - pipeline_runs[run_id].get("startTime", time.time())
                                 send_run_complete_email(
@@ -1806,7 +2097,7 @@ def run_streaming_pipeline(
                                     pipeline_runs[run_id].get("totalContactsWithEmails", 0),
                                     duration,
                                 )
-                                pipeline_runs[run_id]["notify_sent"] = True
+                                pipeline_runs.update(run_id, notify_sent=True)
                     
                     finalize_thread = threading.Thread(target=finalize_completion, daemon=True)
                     finalize_thread.start()
@@ -1816,7 +2107,7 @@ def run_streaming_pipeline(
                     # This prevents Railway from logging crashes and allows the container to handle multiple runs
                     print(f"[{run_id}] Pipeline run complete: {len(completed_counties)}/{total_counties} counties processed")
                     print(f"[{run_id}] Container will remain running and ready for next run")
-                    pipeline_runs[run_id]["progress"] = 100
+                    pipeline_runs.update(run_id, progress=100)
             else:
                 print(f"[{run_id}] Pipeline run complete: {len(completed_counties)}/{total_counties} counties processed")
         
@@ -1825,9 +2116,12 @@ def run_streaming_pipeline(
             error_msg = f"State file not found. Please ensure assets/data/state_counties/{state.lower().replace(' ', '_')}.txt exists in the repository."
             # Only update pipeline_runs if run_id still exists (may have been cleaned up)
             if run_id in pipeline_runs:
-                pipeline_runs[run_id]["status"] = "error"
-                pipeline_runs[run_id]["error"] = error_msg
-                pipeline_runs[run_id]["statusMessage"] = f"Pipeline failed: {error_msg}"
+                pipeline_runs.update(
+                    run_id,
+                    status="error",
+                    error=error_msg,
+                    statusMessage=f"Pipeline failed: {error_msg}",
+                )
             import traceback
             traceback.print_exc()
         except Exception as e:
@@ -1851,9 +2145,12 @@ def run_streaming_pipeline(
             
             # Only update pipeline_runs if run_id still exists (may have been cleaned up)
             if run_id in pipeline_runs:
-                pipeline_runs[run_id]["status"] = "error"
-                pipeline_runs[run_id]["error"] = error_msg
-                pipeline_runs[run_id]["statusMessage"] = f"Pipeline failed: {error_msg}"
+                pipeline_runs.update(
+                    run_id,
+                    status="error",
+                    error=error_msg,
+                    statusMessage=f"Pipeline failed: {error_msg}",
+                )
     
     # Wrapper to ensure thread always completes and updates status
     def process_all_counties_with_error_handling():
@@ -1865,9 +2162,12 @@ def run_streaming_pipeline(
             traceback.print_exc()
             # Ensure status is updated even on unhandled exceptions
             if run_id in pipeline_runs:
-                pipeline_runs[run_id]["status"] = "error"
-                pipeline_runs[run_id]["error"] = f"Unhandled exception: {str(e)}"
-                pipeline_runs[run_id]["statusMessage"] = f"Pipeline crashed: {str(e)}"
+                pipeline_runs.update(
+                    run_id,
+                    status="error",
+                    error=f"Unhandled exception: {str(e)}",
+                    statusMessage=f"Pipeline crashed: {str(e)}",
+                )
         finally:
             if queue_store.is_enabled() and pipeline_runs.get(run_id, {}).get("queue_job_id") is not None:
                 pst = pipeline_runs.get(run_id, {}).get("status", "error")
@@ -1923,9 +2223,6 @@ def notify_test_email():
     """Send a dummy email via Resend to NOTIFY_EMAIL (no scrape). Auth required."""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", ALLOWED_ORIGIN if ALLOWED_ORIGIN != "*" else "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     r = send_test_notification_email("School Scraper")
     if r.get("ok"):
@@ -1933,10 +2230,8 @@ def notify_test_email():
             "status": "ok",
             "message": "Test email sent to NOTIFY_EMAIL (check inbox and spam).",
         })
-        resp.headers.add("Access-Control-Allow-Origin", "*")
         return resp, 200
     err = jsonify({"status": "error", "error": r.get("error", "Unknown error")})
-    err.headers.add("Access-Control-Allow-Origin", "*")
     return err, 400
 
 
@@ -1946,9 +2241,6 @@ def debug_volume():
     """List /data (persistent volume) contents - runs, CSVs, metadata. Auth required."""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", ALLOWED_ORIGIN if ALLOWED_ORIGIN != "*" else "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "GET, OPTIONS")
         return response, 200
     try:
         data_path = Path(os.getenv("PERSISTENT_DATA_DIR", "/data"))
@@ -2055,9 +2347,6 @@ def login():
     """Login endpoint - authenticate user and return JWT token"""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", ALLOWED_ORIGIN if ALLOWED_ORIGIN != "*" else "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     
     try:
@@ -2094,7 +2383,6 @@ def login():
             "token": token,
             "username": username
         })
-        response.headers.add("Access-Control-Allow-Origin", ALLOWED_ORIGIN if ALLOWED_ORIGIN != "*" else "*")
         return response, 200
         
     except Exception as e:
@@ -2102,7 +2390,6 @@ def login():
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", ALLOWED_ORIGIN if ALLOWED_ORIGIN != "*" else "*")
         return error_response, 500
 
 
@@ -2165,7 +2452,7 @@ def run_pipeline():
                             active_runs_same_state.append(rid)
                 else:
                     # Thread missing but status is running - mark as stale
-                    pipeline_runs[rid]["status"] = "cancelled"
+                    pipeline_runs.update(rid, status="cancelled")
             
             # Check for finalizing runs (2-minute cooldown)
             elif status == "finalizing":
@@ -2176,9 +2463,7 @@ def run_pipeline():
                         finalizing_runs_same_state.append(rid)
                 else:
                     # Cooldown expired, mark as completed
-                    pipeline_runs[rid]["status"] = "completed"
-                    if "completedAt" not in pipeline_runs[rid]:
-                        pipeline_runs[rid]["completedAt"] = current_time
+                    pipeline_runs.update(rid, status="completed", completedAt=run_data.get("completedAt", current_time))
         
         # Enforce maximum 2 concurrent states cap
         unique_active_states = set()
@@ -2216,7 +2501,6 @@ def run_pipeline():
                     "message": f"Queued: {len(unique_active_states)} states already running ({', '.join(sorted(unique_active_states))})",
                     "activeStates": sorted(unique_active_states),
                 })
-                resp.headers.add("Access-Control-Allow-Origin", "*")
                 return resp, 202
             return jsonify({
                 "status": "error",
@@ -2239,7 +2523,6 @@ def run_pipeline():
             "runId": run_id,
             "message": "Pipeline started"
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
         
     except Exception as e:
@@ -2247,7 +2530,6 @@ def run_pipeline():
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2257,9 +2539,6 @@ def school_queue_list():
     """List SQLite queue jobs for this scraper (requires SQLITE_PATH)."""
     if request.method == "OPTIONS":
         r = jsonify({})
-        r.headers.add("Access-Control-Allow-Origin", "*")
-        r.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        r.headers.add("Access-Control-Allow-Methods", "GET, OPTIONS")
         return r, 200
     if not queue_store.is_enabled():
         return jsonify({
@@ -2268,7 +2547,6 @@ def school_queue_list():
         }), 503
     jobs = queue_store.list_jobs(SCRAPER_TYPE)
     resp = jsonify({"status": "ok", "jobs": jobs, "count": len(jobs)})
-    resp.headers.add("Access-Control-Allow-Origin", "*")
     return resp, 200
 
 
@@ -2278,9 +2556,6 @@ def school_queue_cancel(job_id: int):
     """Cancel a queued (not yet running) job."""
     if request.method == "OPTIONS":
         r = jsonify({})
-        r.headers.add("Access-Control-Allow-Origin", "*")
-        r.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        r.headers.add("Access-Control-Allow-Methods", "DELETE, OPTIONS")
         return r, 200
     if not queue_store.is_enabled():
         return jsonify({"status": "error", "error": "Queue not configured."}), 503
@@ -2292,13 +2567,54 @@ def school_queue_cancel(job_id: int):
             "jobId": job_id,
         }), 404
     resp = jsonify({"status": "ok", "message": "Job cancelled", "jobId": job_id})
-    resp.headers.add("Access-Control-Allow-Origin", "*")
     return resp, 200
 
 
 # Removed /process-county endpoint - no longer needed with multiprocessing pool approach
 
 
+def _add_time_estimates(run_data: dict) -> dict:
+    """Add server-side elapsedTime and estimatedTimeRemaining to a run snapshot (in place)"""
+    # Calculate server-side elapsed time
+    start_time = run_data.get("startTime")
+    if start_time:
+        elapsed_seconds = time.time() - start_time
+        run_data["elapsedTime"] = int(elapsed_seconds)
+    else:
+        run_data["elapsedTime"] = 0
+    
+    # Calculate static estimated time remaining (ticks down minute by minute)
+    # Estimate is calculated once at start and decreases as time passes
+    if run_data["status"] == "running":
+        initial_estimate = run_data.get("initialEstimatedTimeRemaining")
+        elapsed_seconds = run_data.get("elapsedTime", 0)
+        
+        if initial_estimate is not None and initial_estimate > 0:
+            # Calculate remaining as initial estimate minus elapsed time
+            remaining_seconds = max(0, initial_estimate - elapsed_seconds)
+            # Round to minutes (no seconds) - round up to nearest minute for display
+            remaining_minutes = int((remaining_seconds + 59) // 60)  # Round up to nearest minute
+            run_data["estimatedTimeRemaining"] = remaining_minutes * 60  # Convert back to seconds for consistency
+        else:
+            # Fallback: calculate dynamically if initial estimate not set (for old runs)
+            counties_processed = run_data.get("countiesProcessed", 0)
+            total_counties = run_data.get("totalCounties", 0)
+            
+            if total_counties > 0:
+                remaining_counties = max(0, total_counties - counties_processed)
+                avg_time_per_county = 871  # 14.5 minutes average from log analysis
+                effective_remaining = max(1, remaining_counties / MAX_WORKERS)
+                estimated_remaining = effective_remaining * avg_time_per_county
+                # Round to minutes
+                remaining_minutes = int((estimated_remaining + 59) // 60)
+                run_data["estimatedTimeRemaining"] = remaining_minutes * 60
+            else:
+                run_data["estimatedTimeRemaining"] = 0
+    else:
+        run_data["estimatedTimeRemaining"] = 0
+    return run_data
+
+
 @app.route("/pipeline-status/<run_id>", methods=["GET"])
 @require_auth
 def pipeline_status(run_id):
@@ -2338,7 +2654,12 @@ def pipeline_status(run_id):
             "error": "Run ID not found"
         }), 404
     
-    run_data = pipeline_runs[run_id].copy()
+    run_data = pipeline_runs.snapshot(run_id)
+    if run_data is None:
+        return jsonify({
+            "status": "error",
+            "error": "Run ID not found"
+        }), 404
     
     # If run is completed, return 410 Gone after grace period to stop polling
     # Allow a 2-minute grace period for the final status fetch, then return 410 Gone
@@ -2355,49 +2676,70 @@ def pipeline_status(run_id):
                     "message": "Run completed. Status no longer available."
                 }), 410  # Gone status code
     
-    # Calculate server-side elapsed time
-    start_time = run_data.get("startTime")
-    if start_time:
-        elapsed_seconds = time.time() - start_time
-        run_data["elapsedTime"] = int(elapsed_seconds)
-    else:
-        run_data["elapsedTime"] = 0
-    
-    # Calculate static estimated time remaining (ticks down minute by minute)
-    # Estimate is calculated once at start and decreases as time passes
-    if run_data["status"] == "running":
-        initial_estimate = run_data.get("initialEstimatedTimeRemaining")
-        elapsed_seconds = run_data.get("elapsedTime", 0)
-        
-        if initial_estimate is not None and initial_estimate > 0:
-            # Calculate remaining as initial estimate minus elapsed time
-            remaining_seconds = max(0, initial_estimate - elapsed_seconds)
-            # Round to minutes (no seconds) - round up to nearest minute for display
-            remaining_minutes = int((remaining_seconds + 59) // 60)  # Round up to nearest minute
-            run_data["estimatedTimeRemaining"] = remaining_minutes * 60  # Convert back to seconds for consistency
-        else:
-            # Fallback: calculate dynamically if initial estimate not set (for old runs)
-            counties_processed = run_data.get("countiesProcessed", 0)
-            total_counties = run_data.get("totalCounties", 0)
-            
-            if total_counties > 0:
-                remaining_counties = max(0, total_counties - counties_processed)
-                avg_time_per_county = 871  # 14.5 minutes average from log analysis
-                effective_remaining = max(1, remaining_counties / MAX_WORKERS)
-                estimated_remaining = effective_remaining * avg_time_per_county
-                # Round to minutes
-                remaining_minutes = int((estimated_remaining + 59) // 60)
-                run_data["estimatedTimeRemaining"] = remaining_minutes * 60
-            else:
-                run_data["estimatedTimeRemaining"] = 0
-    else:
-        run_data["estimatedTimeRemaining"] = 0
+    _add_time_estimates(run_data)
     
     response = jsonify(run_data)
-    response.headers.add("Access-Control-Allow-Origin", "*")
     return response, 200
 
 
+# Seconds between keep-alive events on an idle status stream (also refreshes elapsed/remaining time)
+STATUS_STREAM_HEARTBEAT = 15
+# Each open stream holds a waitress thread, so streams close after this many seconds (the client
+# opens a new one if the run is still going), letting queued requests through
+STATUS_STREAM_MAX_AGE = 300
+# Waitress worker threads (start.sh uses the same WAITRESS_THREADS default): open status
+# streams occupy threads too, so keep headroom above the expected number of open tabs
+WAITRESS_THREADS = int(os.getenv("WAITRESS_THREADS", "16"))
+
+
+@app.route("/pipeline-status-stream/<run_id>", methods=["GET"])
+@require_auth
+def pipeline_status_stream(run_id):
+    """
+    Stream status of a running pipeline in Server-Sent Events format.
+    Sends the same payload as /pipeline-status whenever the run changes (at least every
+    STATUS_STREAM_HEARTBEAT seconds) and closes once the run finishes, or after
+    STATUS_STREAM_MAX_AGE seconds - the client re-requests the stream if the run is still going.
+    
+    Like every other endpoint this needs the Authorization header, which a browser EventSource
+    cannot send: read it with fetch() and a streaming response body. /pipeline-status (polled by
+    the frontend) stays the default.
+    """
+    # Security: Validate run_id to prevent path traversal
+    if not validate_run_id(run_id):
+        return jsonify({
+            "status": "error",
+            "error": "Invalid run ID format"
+        }), 400
+    
+    if run_id not in pipeline_runs:
+        return jsonify({
+            "status": "error",
+            "error": "Run ID not found"
+        }), 404
+    
+    def generate():
+        version = pipeline_runs.version(run_id)
+        deadline = time.monotonic() + STATUS_STREAM_MAX_AGE
+        while True:
+            run_data = pipeline_runs.snapshot(run_id)
+            if run_data is None:
+                yield 'event: gone\ndata: {"status": "error", "error": "Run ID not found"}\n\n'
+                return
+            yield f"data: {app.json.dumps(_add_time_estimates(run_data), default=str)}\n\n"
+            if run_data.get("status") in ("completed", "error", "cancelled"):
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return  # Free this waitress thread; the client re-requests the stream
+            version = pipeline_runs.wait_for_change(run_id, version, timeout=min(STATUS_STREAM_HEARTBEAT, remaining))
+    
+    return Response(generate(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # Keep proxies from buffering the stream
+    })
+
+
 # Error handler for 405 Method Not Allowed
 @app.errorhandler(405)
 def method_not_allowed(e):
@@ -2408,10 +2750,6 @@ def method_not_allowed(e):
         "received_method": request.method,
         "allowed_methods": ["POST", "OPTIONS"] if "/run-pipeline" in request.path else ["GET"]
     })
-    response.headers.add("Access-Control-Allow-Origin", ALLOWED_ORIGIN if ALLOWED_ORIGIN != "*" else "*")
-    if "/run-pipeline" in request.path:
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
     return response, 405
 
 # Error handler for 404 Not Found
@@ -2451,9 +2789,6 @@ def stop_run(run_id: str):
     """Stop a running pipeline"""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     
     # Security: Validate run_id to prevent path traversal
@@ -2486,8 +2821,7 @@ def stop_run(run_id: str):
         
         # Update in-memory status if present
         if run_id in pipeline_runs:
-            pipeline_runs[run_id]["status"] = "cancelled"
-            pipeline_runs[run_id]["statusMessage"] = "Pipeline cancelled by user"
+            pipeline_runs.update(run_id, status="cancelled", statusMessage="Pipeline cancelled by user")
         
         # Update metadata
         metadata.update({
@@ -2502,14 +2836,12 @@ def stop_run(run_id: str):
             "status": "success",
             "message": "Pipeline stop requested"
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
     except Exception as e:
         error_response = jsonify({
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2519,9 +2851,6 @@ def resume_run(run_id: str):
     """Resume a run from checkpoint. Loads checkpoint and skips counties that have data files."""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     
     # Security: Validate run_id to prevent path traversal
@@ -2618,7 +2947,6 @@ def resume_run(run_id: str):
             "runId": run_id,
             "message": f"Run resumed from checkpoint: {len(completed_counties)}/{total_counties} counties already completed"
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
         
     except Exception as e:
@@ -2626,7 +2954,6 @@ def resume_run(run_id: str):
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2636,9 +2963,6 @@ def aggregate_run(run_id: str):
     """Manually trigger aggregation for a run, skipping wait for incomplete counties."""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     
     # Security: Validate run_id to prevent path traversal
@@ -2695,21 +3019,23 @@ def aggregate_run(run_id: str):
                 "startTime": metadata.get("start_time", time.time())
             }
         else:
-            pipeline_runs[run_id]["status"] = "finalizing"
-            pipeline_runs[run_id]["statusMessage"] = "Manually triggering aggregation..."
+            pipeline_runs.update(run_id, status="finalizing", statusMessage="Manually triggering aggregation...")
         
-        # Run aggregation in background thread with skip_wait=True
+        # Run aggregation in background thread with the county data available now
         def run_aggregation():
             try:
-                aggregate_final_results(run_id, state, skip_wait=True)
+                aggregate_final_results(run_id, state)
             except Exception as e:
                 print(f"[{run_id}] Error during manual aggregation: {e}")
                 import traceback
                 traceback.print_exc()
                 if run_id in pipeline_runs:
-                    pipeline_runs[run_id]["status"] = "error"
-                    pipeline_runs[run_id]["error"] = f"Aggregation failed: {str(e)}"
-                    pipeline_runs[run_id]["statusMessage"] = f"Failed to aggregate: {str(e)}"
+                    pipeline_runs.update(
+                        run_id,
+                        status="error",
+                        error=f"Aggregation failed: {str(e)}",
+                        statusMessage=f"Failed to aggregate: {str(e)}",
+                    )
         
         aggregation_thread = threading.Thread(target=run_aggregation, daemon=True)
         aggregation_thread.start()
@@ -2720,7 +3046,6 @@ def aggregate_run(run_id: str):
             "state": state,
             "message": "Aggregation started. This will proceed with available county data, skipping incomplete counties."
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
         
     except Exception as e:
@@ -2728,7 +3053,6 @@ def aggregate_run(run_id: str):
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2740,9 +3064,6 @@ def delete_run(run_id: str):
     if request.method == "OPTIONS":
         response = jsonify({})
         # CORS preflight: allow auth header for DELETE requests
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Methods", "DELETE, OPTIONS")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
         return response, 200
     
     # Security: Validate run_id to prevent path traversal
@@ -2770,8 +3091,7 @@ def delete_run(run_id: str):
             
             # Update in-memory status if present
             if run_id in pipeline_runs:
-                pipeline_runs[run_id]["status"] = "cancelled"
-                pipeline_runs[run_id]["statusMessage"] = "Pipeline cancelled by user"
+                pipeline_runs.update(run_id, status="cancelled", statusMessage="Pipeline cancelled by user")
             
             # Update metadata to cancelled first
             metadata["status"] = "cancelled"
@@ -2819,14 +3139,12 @@ def delete_run(run_id: str):
             "status": "success",
             "message": "Run deleted successfully"
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
     except Exception as e:
         error_response = jsonify({
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2836,9 +3154,6 @@ def archive_run(run_id: str):
     """Archive a completed run"""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     
     # Security: Validate run_id to prevent path traversal
@@ -2873,14 +3188,12 @@ def archive_run(run_id: str):
             "status": "success",
             "message": "Run archived successfully"
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
     except Exception as e:
         error_response = jsonify({
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2890,9 +3203,6 @@ def unarchive_run(run_id: str):
     """Unarchive a run"""
     if request.method == "OPTIONS":
         response = jsonify({})
-        response.headers.add("Access-Control-Allow-Origin", "*")
-        response.headers.add("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        response.headers.add("Access-Control-Allow-Methods", "POST, OPTIONS")
         return response, 200
     
     # Security: Validate run_id to prevent path traversal
@@ -2927,14 +3237,12 @@ def unarchive_run(run_id: str):
             "status": "success",
             "message": "Run unarchived successfully"
         })
-        response.headers.add("Access-Control-Allow-Origin", "*")
         return response, 200
     except Exception as e:
         error_response = jsonify({
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -2986,7 +3294,6 @@ def download_run_csv(run_id: str):
             "status": "error",
             "error": str(e)
         })
-        error_response.headers.add("Access-Control-Allow-Origin", "*")
         return error_response, 500
 
 
@@ -3002,6 +3309,8 @@ def not_found(e):
 print("[STARTUP] Running cleanup of old runs...")
 cleanup_old_runs()
 
+threading.Thread(target=_reap_finished_runs, daemon=True).start()
+
 if queue_store.init_db():
     _school_q_thread = threading.Thread(target=_school_queue_worker_loop, daemon=True)
     _school_q_thread.start()
@@ -3046,7 +3355,7 @@ if __name__ == "__main__":
                 'waitress-serve',
                 '--host=0.0.0.0',
                 f'--port={port}',
-                '--threads=4',
+                f'--threads={WAITRESS_THREADS}',
                 '--channel-timeout=300',
                 'external_services.api:app'
             ])
@@ -3059,7 +3368,7 @@ if __name__ == "__main__":
         sys.executable, "-m", "waitress",
         "--host=0.0.0.0",
         f"--port={port}",
-        "--threads=4",
+        f"--threads={WAITRESS_THREADS}",
         "--channel-timeout=300",
         "external_services.api:app"
     ])
@@ -12,15 +12,52 @@ import os
 import sys
 import csv
 import argparse
-import time
-from typing import List, Iterator, Optional, Dict
+import logging
+import re
+import asyncio
+import threading
+from typing import List, Iterator, Optional, Dict, Tuple
 from datetime import datetime
 from pathlib import Path
 import traceback
 import importlib.util
+from functools import lru_cache
+
+import pandas as pd
+import requests
+
+# Optional: google-re2 gives linear-time matching on large/malformed HTML (falls back to re)
+try:
+    import re2 as _re_engine
+    HAS_RE2 = True
+except ImportError:
+    _re_engine = re
+    HAS_RE2 = False
 
 # Import shared models
 from assets.shared.models import School, Page, PageContent, Contact
+from assets.shared.places_cache import PlacesCache
+
+# Per-school progress goes through this logger (message-only on stdout, same output as the old prints).
+# Level comes from PIPELINE_LOG_LEVEL (default INFO); --quiet on the CLI raises it to WARNING.
+logger = logging.getLogger('pipeline')
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_log_handler)
+    logger.setLevel(os.getenv('PIPELINE_LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+
+# Contact fields produced by steps 8-9 (per-page contact dicts)
+CONTACT_FIELDS = ['first_name', 'last_name', 'title', 'email', 'phone']
+
+# Cheap pre-screen run before HTML reduction / LLM parsing: pages with none of these signals can't yield contacts
+_CONTACT_SIGNAL_RE = _re_engine.compile(r'(?i)@|staff|faculty|principal|director|head of school|administrat|contact us|our team')
+# Pages without emails must at least mention an administrative title to be worth an LLM call
+_ADMIN_TITLE_RE = _re_engine.compile(r'(?i)principal|superintendent|head of school|director|dean|administrat|president|chancellor|provost')
+
+# Columns of the per-county output CSV (same order as Contact.to_row)
+CSV_FIELDNAMES = ['first_name', 'last_name', 'title', 'email', 'phone', 'school_name', 'source_url']
 
 # Import streaming steps
 # Handle hyphens in filenames using importlib.util
@@ -64,19 +101,26 @@ def load_counties_from_state(state: str) -> List[str]:
             f"Please create assets/data/state_counties/{state_normalized}.txt with one county per line"
         )
     
-    counties = []
-    with open(state_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            county = line.strip()
-            # Skip empty lines and comments
-            if county and not county.startswith('#'):
-                counties.append(county)
+    counties = list(read_counties_file(state_file))
     
     if not counties:
         raise ValueError(f"No counties found in {state_file}")
     
     return counties
 
+
+@lru_cache(maxsize=None)
+def read_counties_file(state_file: Path) -> Tuple[str, ...]:
+    """
+    Read a state counties file once per process (skips empty lines and # comments)
+    
+    Cached by path, so repeated lookups for the same state (pipeline runs, API
+    requests, aggregation) never touch the disk again. Returns a tuple so the
+    cached value can't be mutated by callers.
+    """
+    lines = state_file.read_text(encoding='utf-8').splitlines()
+    return tuple(county for county in (line.strip() for line in lines) if county and not county.startswith('#'))
+
 # Import step classes (will need to refactor these to support streaming)
 # For now, we'll import the existing classes and wrap them
 # Handle hyphens in filenames using importlib.util
@@ -111,7 +155,11 @@ class StreamingPipeline:
         max_pages_per_school: int = 3,
         state: str = 'Texas',
         max_schools: int = None,
-        chrome_tmp_dir: Optional[str] = None
+        chrome_tmp_dir: Optional[str] = None,
+        max_concurrent_schools: int = 4,
+        browser_pool_size: Optional[int] = None,
+        places_max_qps: Optional[float] = None,
+        use_places_cache: bool = True
     ):
         self.google_api_key = google_api_key
         self.openai_api_key = openai_api_key
@@ -119,12 +167,20 @@ class StreamingPipeline:
         self.max_pages_per_school = max_pages_per_school
         self._state = state
         self.max_schools = max_schools
+        # Number of schools processed concurrently (discovery + LLM calls overlap; Selenium bounded by the browser pool)
+        self.max_concurrent_schools = max(1, max_concurrent_schools or 1)
+        
+        # Locks for components that are not safe to share across worker threads
+        self._filter_lock = threading.Lock()      # LLMSchoolFilter keeps a pending batch list and cache
+        self._stats_lock = threading.Lock()
         
         # Initialize step processors
         # Debug: Verify API key is being passed
         if not google_api_key or len(google_api_key) < 10:
-            print(f"WARNING: Google API key appears invalid in Pipeline (length: {len(google_api_key) if google_api_key else 0})")
-        self.school_searcher = SchoolSearcher(google_api_key, global_max_api_calls, max_schools=max_schools, target_state=state)
+            logger.warning("WARNING: Google API key appears invalid in Pipeline (length: %d)", len(google_api_key) if google_api_key else 0)
+        self.school_searcher = SchoolSearcher(google_api_key, global_max_api_calls, max_schools=max_schools, target_state=state,
+                                              places_max_qps=places_max_qps,
+                                              places_cache=None if use_places_cache else PlacesCache(enabled=False))
         
         # Initialize LLM school filter if OpenAI key provided
         if openai_api_key:
@@ -136,19 +192,50 @@ class StreamingPipeline:
                     batch_size=20
                 )
             except Exception as e:
-                print(f"WARNING: Could not initialize LLM school filter: {e}")
+                logger.warning("WARNING: Could not initialize LLM school filter: %s", e)
                 self.llm_school_filter = None
         else:
             self.llm_school_filter = None
         
-        self.page_discoverer = step3.PageDiscoverer(timeout=10, max_retries=3)
-        # ContentCollector will create Selenium driver on init
-        # Driver will be recycled after each county to prevent resource accumulation
+        # One pooled HTTP session shared by page discovery and content collection (keep-alive across schools)
+        self._http = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self._http.mount('http://', http_adapter)
+        self._http.mount('https://', http_adapter)
+        
+        self.page_discoverer = step3.PageDiscoverer(timeout=10, max_retries=3, session=self._http)
+        # Pool of pre-warmed ContentCollectors (one Selenium driver each), recycled every 50 pages
+        # Every page of every in-flight school checks out a collector, so the pool defaults to one driver per
+        # concurrent school (a smaller pool serializes step 4). Each Chrome costs ~500MB: set BROWSER_POOL_SIZE
+        # (or browser_pool_size) to cap it where memory is tight
         # chrome_tmp_dir: use volume path to avoid ephemeral storage exhaustion ( Railway file limit)
-        self.content_collector = step4.ContentCollector(timeout=10, max_retries=3, use_selenium=True, chrome_user_data_dir=chrome_tmp_dir)
+        if browser_pool_size is None:
+            browser_pool_size = int(os.getenv('BROWSER_POOL_SIZE', str(self.max_concurrent_schools)))
+        self.browser_pool = step4.BrowserPool(
+            size=min(browser_pool_size, self.max_concurrent_schools),
+            max_uses=50,
+            timeout=10,
+            max_retries=3,
+            use_selenium=True,
+            chrome_user_data_dir=chrome_tmp_dir,
+            session=self._http
+        )
+        # Kept for callers that inspect a single collector/driver (e.g. API worker cleanup)
+        self.content_collector = self.browser_pool.primary
+        # Driverless collector for static fetches and page checks; it borrows a pooled driver
+        # only when a page actually needs the Selenium tier
+        self.page_collector = step4.ContentCollector(
+            timeout=10,
+            max_retries=3,
+            session=self._http,
+            selenium_fetcher=self.browser_pool.fetch_with_selenium
+        )
         self.html_reducer = step5.HTMLReducer()
         self.html_chunker = step6.HTMLChunker()
         self.llm_parser = step7.LLMParser(openai_api_key, model="gpt-4o-mini")
+        # Caps in-flight OpenAI requests across all schools; created per event loop by _openai_semaphore()
+        self._openai_sem: Optional[asyncio.BoundedSemaphore] = None
+        self._openai_sem_loop = None
         self.csv_parser = step8.CSVParser()
         self.deduplicator = step9.ContactDeduplicator(email_cleaner=self.csv_parser.clean_email)
         self.title_filter = step10.TitleFilter(openai_api_key, model="gpt-4o-mini")
@@ -156,8 +243,14 @@ class StreamingPipeline:
         self.final_compiler = step13_final_compiler.FinalCompiler()
         self.enable_hunter_io = os.getenv('HUNTER_IO_API_KEY') is not None
         
-        # Results accumulator
-        self.all_contacts = []
+        # Title-filter decisions for this run, keyed by normalized title (each unique title is decided once)
+        self._title_decision_cache: Dict[str, bool] = {}
+        
+        # Contacts are streamed to the output CSV as each school finishes (see _open_output_csv)
+        self._output_csv = None
+        self._csv_file = None
+        self._csv_writer = None
+        
         # Track unique contacts for progress display (key: normalized contact identifier)
         self.unique_contacts_set = set()
         self.stats = {
@@ -166,11 +259,13 @@ class StreamingPipeline:
             'schools_processed': 0,
             'pages_discovered': 0,
             'pages_collected': 0,
+            'pages_skipped_prescreen': 0,
             'contacts_extracted': 0,
             'contacts_with_emails': 0,
+            'contacts_without_emails': 0,
         }
     
-    def _get_contact_key(self, contact: Contact) -> str:
+    def _get_contact_key(self, contact: Contact) -> Tuple[str, ...]:
         """
         Generate a unique key for a contact for deduplication tracking.
         Uses email if available, otherwise name + school.
@@ -179,105 +274,125 @@ class StreamingPipeline:
             contact: Contact object
             
         Returns:
-            Normalized string key for uniqueness tracking
+            Normalized tuple key for uniqueness tracking (tuples hash without
+            building an intermediate formatted string)
         """
+        return self._contact_key(contact.email, contact.first_name, contact.last_name, contact.school_name, contact.title)
+    
+    @staticmethod
+    def _contact_key(email: Optional[str], first_name: Optional[str], last_name: Optional[str],
+                     school_name: Optional[str], title: Optional[str]) -> Tuple[str, ...]:
+        """Build the _get_contact_key tuple from raw fields (usable before a Contact exists)"""
         # If contact has email, use that as the key (normalized)
-        if contact.email:
-            email_key = contact.email.lower().strip()
+        if email:
+            email_key = email.strip().lower()
             if email_key:
-                return f"email:{email_key}"
+                return ('email', email_key)
         
         # Otherwise, use name + school (normalized)
-        first_name = (contact.first_name or '').lower().strip()
-        last_name = (contact.last_name or '').lower().strip()
-        school_name = (contact.school_name or '').lower().strip()
+        first_name = (first_name or '').strip().lower()
+        last_name = (last_name or '').strip().lower()
+        school_name = (school_name or '').strip().lower()
         
         # Only create key if we have at least first or last name
         if first_name or last_name:
-            return f"name:{first_name}|{last_name}|{school_name}"
+            return ('name', first_name, last_name, school_name)
         
         # Fallback: use all available fields
-        return f"fallback:{first_name}|{last_name}|{school_name}|{contact.title or ''}"
+        return ('fallback', first_name, last_name, school_name, title or '')
+    
+    def _incr_stat(self, key: str, amount: int = 1):
+        """Increment a stats counter (safe to call from worker threads)"""
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
     
-    def process_single_lead(self, school: School) -> List[Contact]:
+    async def process_single_lead_async(self, school: School) -> List[Contact]:
         """
-        Process one school through all steps.
+        Process one school (already through step 2) through all remaining steps.
         Returns list of Contact objects extracted from this school.
+        Each blocking step runs in a worker thread so several schools can wait on
+        network I/O (page discovery, fetches, LLM calls) at the same time.
         """
-        print(f"Processing: {school.name} ({school.county})")
+        logger.info("Processing: %s (%s)", school.name, school.county)
         
-        # Step 2: Filter school
-        filter_result = filter_school(school, target_state=self._state, llm_filter=self.llm_school_filter)
-        if isinstance(filter_result, tuple):
-            filtered_school, filter_reason = filter_result
-        else:
-            # Backward compatibility
-            filtered_school, filter_reason = filter_result, None
-        
-        if not filtered_school:
-            # Format filter reason as key/value
-            if filter_reason:
-                if "LLM rejected" in filter_reason:
-                    print(f"  [FILTER] reason=\"LLM rejected\" detail=\"{filter_reason.replace('LLM rejected (', '').replace(')', '')}\"")
-                elif "failed pre-filters" in filter_reason:
-                    detail = filter_reason.replace("failed pre-filters (", "").replace(")", "")
-                    print(f"  [FILTER] reason=\"pre-filter failed\" detail=\"{detail}\"")
-                else:
-                    print(f"  [FILTER] reason=\"{filter_reason}\"")
-            else:
-                print(f"  [FILTER] reason=\"unknown\"")
-            self.stats['schools_filtered_out'] += 1
-            return []
-        
-        if not filtered_school.website:
-            print("  [SKIP] No website")
+        if not school.website:
+            logger.info("  [SKIP] %s: No website", school.name)
             return []
         
         # Step 3: Discover pages
-        try:
-            pages = self._discover_pages_for_school(filtered_school)
-            self.stats['pages_discovered'] += len(pages)
-            
-            if not pages:
-                print("  [SKIP] No pages found")
-                return []
-        except Exception as e:
-            print(f"  [ERROR] Error: {e}")
-            traceback.print_exc()
+        pages = await asyncio.to_thread(self._discover_pages_for_school, school)
+        self._incr_stat('pages_discovered', len(pages))
+        if not pages:
+            logger.info("  [SKIP] %s: No pages found", school.name)
             return []
         
-        # Step 4: Collect content
-        page_contents = []
-        for page in pages[:self.max_pages_per_school]:  # Limit pages per school
-            try:
-                content = self._collect_content_for_page(page)
-                if content:
-                    page_contents.append(content)
-                    self.stats['pages_collected'] += 1
-            except Exception as e:
-                continue
+        # Step 4: Collect content - fetch static HTML for all pages at once, then
+        # finish each page (relevance checks / Selenium fallback) concurrently
+        target_pages = pages[:self.max_pages_per_school]
+        prefetched = await self.page_collector.fetch_all([page.url for page in target_pages])
+        collected = await asyncio.gather(
+            *(asyncio.to_thread(self._collect_content_for_page, page, prefetched.get(page.url)) for page in target_pages)
+        )
+        page_contents = [content for content in collected if content]
+        self._incr_stat('pages_collected', len(page_contents))
         
         if not page_contents:
-            print("  [SKIP] No content collected")
+            logger.info("  [SKIP] %s: No content collected", school.name)
             return []
         
-        # Step 5: Parse content with LLM
-        all_contacts = []
-        for page_content in page_contents:
-            try:
-                contacts = self._parse_content_with_llm(page_content, filtered_school)
-                all_contacts.extend(contacts)
-            except Exception as e:
-                continue
+        # Step 5: Parse content with LLM (all pages of the school at once)
+        page_results = await asyncio.gather(
+            *(self._parse_content_with_llm_async(page_content, school) for page_content in page_contents)
+        )
+        all_contacts = [contact for contacts in page_results for contact in contacts]
         
         if all_contacts:
-            print(f"  [SUCCESS] Contacts extracted: {len(all_contacts)}")
+            logger.info("  [SUCCESS] %s: Contacts extracted: %d", school.name, len(all_contacts))
         else:
-            print("  [SKIP] No contacts")
+            logger.info("  [SKIP] %s: No contacts", school.name)
         
-        self.stats['schools_processed'] += 1
+        self._incr_stat('schools_processed')
         return all_contacts
     
+    def _passes_cheap_filters(self, school: School) -> bool:
+        """Step 2 state check and pre-filters (no LLM); logs and counts schools that fail"""
+        filtered_school, filter_reason = filter_school(school, target_state=self._state, llm_filter=None)
+        if filtered_school:
+            return True
+        logger.info("  [FILTER] %s: reason=\"%s\"", school.name, filter_reason or 'unknown')
+        self._incr_stat('schools_filtered_out')
+        return False
+    
+    def _llm_filter_schools(self, schools: List[School]) -> List[School]:
+        """Step 2 LLM filter for schools that passed the cheap checks (one OpenAI call per batch_size names)"""
+        with self._filter_lock:
+            verdicts = self.llm_school_filter.filter_batch(schools)
+        accepted = []
+        for school in schools:
+            if school.name and verdicts.get(school.name.lower().strip(), False):
+                accepted.append(school)
+            else:
+                logger.info("  [FILTER] %s: reason=\"LLM rejected (not private Christian/Catholic)\"", school.name)
+                self._incr_stat('schools_filtered_out')
+        return accepted
+    
+    def _openai_semaphore(self) -> asyncio.BoundedSemaphore:
+        """Return the OpenAI semaphore bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._openai_sem is None or self._openai_sem_loop is not loop:
+            self._openai_sem = asyncio.BoundedSemaphore(8)
+            self._openai_sem_loop = loop
+        return self._openai_sem
+    
+    async def _bounded(self, sem: asyncio.BoundedSemaphore, school: School) -> List[Contact]:
+        """Process one school while holding a slot in the concurrency semaphore"""
+        async with sem:
+            try:
+                return await self.process_single_lead_async(school)
+            except Exception as e:
+                logger.error("  [ERROR] %s: %s", school.name, e, exc_info=True)
+                return []
+    
     def _discover_pages_for_school(self, school: School) -> List[Page]:
         """
         Discover pages for a single school using step3's discover_pages method.
@@ -308,19 +423,18 @@ class StreamingPipeline:
                     discovered_via=page_dict.get('url')  # Could enhance this
                 ))
         except Exception as e:
-            print(f"    Error in page discovery: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("    Error in page discovery: %s", e, exc_info=True)
         
         return pages
     
-    def _collect_content_for_page(self, page: Page) -> Optional[PageContent]:
+    def _collect_content_for_page(self, page: Page, prefetched_html: Optional[str] = None) -> Optional[PageContent]:
         """
         Collect content for a single page using step4's collect_page_content method.
         """
         try:
-            # Use step4's collect_page_content method (requires school_name and url)
-            result = self.content_collector.collect_page_content(page.school_name, page.url)
+            # Use step4's collect_page_content method (requires school_name and url); a browser
+            # is checked out of the pool only if the page falls through to Selenium
+            result = self.page_collector.collect_page_content(page.school_name, page.url, prefetched_html=prefetched_html)
             
             if not result:
                 return None
@@ -339,82 +453,147 @@ class StreamingPipeline:
                 collection_method=fetch_method
             )
         except Exception as e:
-            print(f"    Error collecting content: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("    Error collecting content: %s", e, exc_info=True)
             return None
     
-    def _parse_content_with_llm(self, page_content: PageContent, school: School) -> List[Contact]:
-        """
-        Parse content with LLM using step5's reduction and chunking logic.
-        """
+    def _has_contact_signals(self, page_content: PageContent) -> bool:
+        """Regex pre-screen: does the page look like it could contain staff contacts?"""
+        html = page_content.html_content
+        if not _CONTACT_SIGNAL_RE.search(html):
+            return False
+        if page_content.email_count == 0 and not _ADMIN_TITLE_RE.search(html):
+            return False
+        return True
+    
+    def _chunk_page_content(self, page_content: PageContent) -> List[str]:
+        """Steps 5-6: reduce HTML to contact-focused sections and chunk it for the LLM"""
         if not page_content.html_content:
             return []
         
+        # Skip reduction and the LLM entirely for pages with no contact signals
+        if not self._has_contact_signals(page_content):
+            self._incr_stat('pages_skipped_prescreen')
+            return []
+        
+        # Step 5: Reduce HTML to contact-focused sections
+        reduced_html = self.html_reducer.reduce_html(page_content.html_content)
+        if not reduced_html:
+            return []
+        
+        # Step 6: Chunk HTML if needed
+        return self.html_chunker.chunk_html(reduced_html, max_chunk_size=50000)  # Increased from 20k to 50k for cost optimization
+    
+    def _dedupe_llm_responses(self, csv_texts: List[str], page_content: PageContent, school: School) -> List[Dict]:
+        """Steps 8-9: parse LLM CSV responses and deduplicate contacts from one page"""
+        page_contacts_dicts = []
+        for csv_text in csv_texts:
+            if csv_text:
+                chunk_contacts = self.csv_parser.parse_csv_response(csv_text)
+                for contact in chunk_contacts:
+                    contact['school_name'] = school.name
+                    contact['source_url'] = page_content.url
+                page_contacts_dicts.extend(chunk_contacts)
+        
+        if not page_contacts_dicts:
+            return []
+        
+        return self.deduplicator.deduplicate_contacts(page_contacts_dicts)
+    
+    def _contacts_frame(self, deduped_contacts: List[Dict]) -> pd.DataFrame:
+        """Load page contacts into a DataFrame with stripped fields and a normalized title_key"""
+        df = pd.DataFrame(deduped_contacts, columns=CONTACT_FIELDS).fillna('')
+        for col in CONTACT_FIELDS:
+            df[col] = df[col].astype(str).str.strip()
+        # "  Head  of School" -> "head of school"
+        df['title_key'] = df['title'].str.lower().str.replace(r'\s+', ' ', regex=True)
+        return df
+    
+    def _drop_seen_contacts(self, df: pd.DataFrame, school: School) -> pd.DataFrame:
+        """
+        Drop page contacts already recorded earlier in this run (same key as
+        _get_contact_key), so they never reach the title filter or the output CSV.
+        """
+        seen = self.unique_contacts_set
+        if not seen:
+            return df
+        contact_key = self._contact_key
+        is_new = [
+            contact_key(email, first_name, last_name, school.name, title) not in seen
+            for email, first_name, last_name, title in zip(df['email'], df['first_name'], df['last_name'], df['title'])
+        ]
+        return df.loc[is_new]
+    
+    def _resolve_title_decisions(self, df: pd.DataFrame):
+        """
+        Step 10: make sure every title_key in df has a keep/exclude decision in the per-run memo.
+        Unseen titles are sent to the title filter in one batched call. Only real KEEP/EXCLUDE
+        decisions are memoized; titles the filter could not decide (API error, 429) stay unseen,
+        so they are excluded on this page but asked again for the next one.
+        """
+        unseen = df.loc[
+            (df['title_key'] != '') & df['title_key'].map(self._title_decision_cache).isna(),
+            ['title_key', 'title']
+        ].drop_duplicates('title_key')
+        if unseen.empty:
+            return
+        
+        batch_decisions = self.title_filter.filter_titles_batch(unseen['title'].tolist(), max_retries=1)
+        self._title_decision_cache.update(
+            (title_key, keep) for title_key, keep in zip(unseen['title_key'], batch_decisions) if keep is not None
+        )
+    
+    def _build_contacts(self, df: pd.DataFrame, page_content: PageContent, school: School) -> List[Contact]:
+        """Keep contacts whose title was accepted and convert them into Contact objects"""
+        keep = df['title_key'].map(self._title_decision_cache).fillna(False).astype(bool)
+        kept = df.loc[keep, ['first_name', 'last_name', 'title', 'email', 'phone']]
+        
+        return [
+            Contact(
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                title=row['title'],
+                email=row['email'] or None,
+                phone=row['phone'] or None,
+                school_name=school.name,
+                source_url=page_content.url
+            )
+            for row in kept.to_dict('records')
+        ]
+    
+    async def _parse_content_with_llm_async(self, page_content: PageContent, school: School) -> List[Contact]:
+        """
+        Parse content with LLM using step5's reduction and chunking logic.
+        All chunks of a page (and their title-filter checks) are sent to OpenAI concurrently,
+        bounded by the shared OpenAI semaphore instead of a fixed sleep between calls.
+        """
         try:
-            # Step 5: Reduce HTML to contact-focused sections
-            reduced_html = self.html_reducer.reduce_html(page_content.html_content)
-            if not reduced_html:
+            chunks = await asyncio.to_thread(self._chunk_page_content, page_content)
+            if not chunks:
                 return []
             
-            # Step 6: Chunk HTML if needed
-            chunks = self.html_chunker.chunk_html(reduced_html, max_chunk_size=50000)  # Increased from 20k to 50k for cost optimization
+            # Step 7: LLM parsing (gathered)
+            async def parse_chunk(chunk: str) -> str:
+                async with self._openai_semaphore():
+                    return await self.llm_parser.parse_with_llm_async(chunk, school.name, page_content.url, max_retries=1)
             
-            # Step 7-8: LLM parsing + CSV parsing
-            page_contacts_dicts = []
-            for chunk_idx, chunk in enumerate(chunks):
-                csv_text = self.llm_parser.parse_with_llm(
-                    chunk,
-                    school.name,
-                    page_content.url,
-                    max_retries=1
-                )
-                
-                if csv_text:
-                    chunk_contacts = self.csv_parser.parse_csv_response(csv_text)
-                    for contact in chunk_contacts:
-                        contact['school_name'] = school.name
-                        contact['source_url'] = page_content.url
-                    page_contacts_dicts.extend(chunk_contacts)
-                
-                if chunk_idx < len(chunks) - 1:
-                    time.sleep(1.0)
+            results = await asyncio.gather(*(parse_chunk(chunk) for chunk in chunks), return_exceptions=True)
+            csv_texts = [r for r in results if isinstance(r, str)]
             
-            if not page_contacts_dicts:
+            # Steps 8-9: CSV parsing + deduplication
+            deduped_contacts = await asyncio.to_thread(self._dedupe_llm_responses, csv_texts, page_content, school)
+            if not deduped_contacts:
                 return []
             
-            # Step 9: Deduplicate contacts from this page
-            deduped_contacts = self.deduplicator.deduplicate_contacts(page_contacts_dicts)
-            
-            # Step 10 (previously Step 11): Filter contacts by title
-            filtered_contacts = []
-            for contact_dict in deduped_contacts:
-                filter_payload = {
-                    'first_name': contact_dict.get('first_name', ''),
-                    'last_name': contact_dict.get('last_name', ''),
-                    'title': contact_dict.get('title', ''),
-                    'email': contact_dict.get('email', ''),
-                    'phone': contact_dict.get('phone', '')
-                }
-                
-                should_keep = self.title_filter.filter_contact(filter_payload, max_retries=1)
-                if should_keep:
-                    contact = Contact(
-                        first_name=contact_dict.get('first_name', '').strip(),
-                        last_name=contact_dict.get('last_name', '').strip(),
-                        title=contact_dict.get('title', ''),
-                        email=contact_dict.get('email') or None,
-                        phone=contact_dict.get('phone') or None,
-                        school_name=school.name,
-                        source_url=page_content.url
-                    )
-                    filtered_contacts.append(contact)
-            
-            return filtered_contacts
+            # Step 10: Filter contacts by title (one batched call for the page's unseen titles;
+            # contacts seen earlier in the run are dropped first)
+            df = self._drop_seen_contacts(self._contacts_frame(deduped_contacts), school)
+            if df.empty:
+                return []
+            async with self._openai_semaphore():
+                await asyncio.to_thread(self._resolve_title_decisions, df)
+            return self._build_contacts(df, page_content, school)
         except Exception as e:
-            print(f"  [ERROR] LLM parsing error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("  [ERROR] LLM parsing error: %s", e, exc_info=True)
             return []
     
     def run(
@@ -425,14 +604,13 @@ class StreamingPipeline:
     ):
         """
         Run the streaming pipeline.
-        Processes schools one at a time through all steps.
+        Processes schools through all steps, up to max_concurrent_schools at a time.
         """
         print(f"\nPipeline started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Output: {output_csv}\n")
         
         # Step 1: Discover schools (generator - yields one at a time)
         print("Discovering schools...")
-        schools_discovered = 0
         
         # Load counties from state file if not provided
         if not counties:
@@ -450,78 +628,126 @@ class StreamingPipeline:
             max_search_terms=max_search_terms_per_county
         )
         
-        first_school = True
-        for school in school_generator:
-            schools_discovered += 1
-            self.stats['schools_discovered'] = schools_discovered
-            
-            # Add blank line between schools (except before first)
-            if not first_school:
-                print()
-            first_school = False
-            
-            # Process this school through all steps
-            contacts = self.process_single_lead(school)
-            
-            # Track unique contacts as we add them
-            unique_before = len(self.unique_contacts_set)
-            new_unique_count = 0
-            for contact in contacts:
-                contact_key = self._get_contact_key(contact)
-                if contact_key not in self.unique_contacts_set:
-                    self.unique_contacts_set.add(contact_key)
-                    new_unique_count += 1
-            
-            # Accumulate contacts (keep full list for final deduplication)
-            self.all_contacts.extend(contacts)
-            
-            # Print progress with unique count (standardized format)
-            total_contacts = len(self.all_contacts)
-            unique_contacts = len(self.unique_contacts_set)
-            processed = self.stats['schools_processed']
-            delta_str = f" (+{new_unique_count})" if new_unique_count > 0 else ""
-            print(f"Progress: {schools_discovered} schools | {processed}/{schools_discovered} processed | {unique_contacts} contacts{delta_str}")
+        # Generate filename for county-level output (will be aggregated later)
+        if not output_csv:
+            output_csv = "final_contacts.csv"
         
-        # Flush any pending LLM filter batches
-        if self.llm_school_filter:
-            self.llm_school_filter.flush()
+        # Raw contacts are streamed to CSV as each school finishes (Steps 11, 12, 13 run globally
+        # after all counties complete). This is per-county output that will be aggregated and enriched later
+        self._open_output_csv(output_csv)
+        try:
+            # Process schools concurrently (bounded); bookkeeping stays on the event loop thread
+            asyncio.run(self._run_schools_async(school_generator))
+        finally:
+            self._close_output_csv()
         
         # Blank line before final summary
         print()
         
-        # Generate filename for county-level output (will be aggregated later)
-        if not output_csv or output_csv == "final_contacts.csv":
-            output_csv = "final_contacts.csv"
-        
-        # Write raw contacts to CSV (Steps 11, 12, 13 will run globally after all counties complete)
-        # This is per-county output that will be aggregated and enriched later
-        if self.all_contacts:
-            self._write_final_csv(self.all_contacts, output_csv)
-        else:
-            print(f"No contacts to write to {output_csv}")
-        
-        # Update stats
-        self.stats['contacts_extracted'] = len(self.all_contacts)
+        # Update stats (contacts_extracted / contacts_with_emails are counted as rows are written)
         self.stats['unique_contacts'] = len(self.unique_contacts_set)
-        
-        # Count contacts with/without emails for stats (but don't process them yet)
-        contacts_with_emails = [c for c in self.all_contacts if c.has_email()]
-        contacts_without_emails = [c for c in self.all_contacts if not c.has_email()]
-        self.stats['contacts_with_emails'] = len(contacts_with_emails)
-        self.stats['contacts_without_emails'] = len(contacts_without_emails)
+        self.stats['contacts_without_emails'] = self.stats['contacts_extracted'] - self.stats['contacts_with_emails']
         
         # Print final summary
         self._print_summary()
     
+    async def _run_schools_async(self, school_generator: Iterator[School]):
+        """
+        Pull schools from the discovery generator and process up to
+        max_concurrent_schools of them at once. Results are recorded serially
+        as each school finishes so unique-contact tracking needs no locking.
+        
+        Schools that pass the cheap step 2 checks queue for the LLM filter, which is
+        called once per batch_size schools - or with whatever has queued once discovery
+        ends or no school is being filtered or processed, so workers never sit idle.
+        """
+        sem = asyncio.BoundedSemaphore(self.max_concurrent_schools)
+        schools_discovered = 0
+        
+        llm_filter = self.llm_school_filter
+        awaiting_filter: List[School] = []
+        filtering = set()
+        discovering = True
+        
+        # The generator makes blocking Places API calls, so advance it in a worker thread
+        next_school = asyncio.ensure_future(asyncio.to_thread(next, school_generator, None))
+        pending = {next_school}
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is next_school:
+                    school = task.result()
+                    if school is None:
+                        discovering = False
+                        continue
+                    schools_discovered += 1
+                    self.stats['schools_discovered'] = schools_discovered
+                    if self._passes_cheap_filters(school):
+                        if llm_filter:
+                            awaiting_filter.append(school)
+                        else:
+                            pending.add(asyncio.ensure_future(self._bounded(sem, school)))
+                    next_school = asyncio.ensure_future(asyncio.to_thread(next, school_generator, None))
+                    pending.add(next_school)
+                elif task in filtering:
+                    filtering.discard(task)
+                    for school in task.result():
+                        pending.add(asyncio.ensure_future(self._bounded(sem, school)))
+                else:
+                    self._record_school_contacts(task.result())
+            
+            if awaiting_filter and (
+                len(awaiting_filter) >= llm_filter.batch_size
+                or not discovering
+                or pending <= {next_school}
+            ):
+                filter_task = asyncio.ensure_future(asyncio.to_thread(self._llm_filter_schools, awaiting_filter))
+                awaiting_filter = []
+                filtering.add(filter_task)
+                pending.add(filter_task)
+    
+    def _record_school_contacts(self, contacts: List[Contact]):
+        """Record one finished school's contacts (new ones only) and print progress"""
+        # Per-county dedup at write time: only contacts with a key not seen earlier in this run are
+        # written, so the county CSV is already unique and aggregation dedups a much smaller set
+        seen = self.unique_contacts_set
+        get_key = self._get_contact_key
+        new_contacts = []
+        for contact in contacts:
+            key = get_key(contact)
+            if key not in seen:
+                seen.add(key)
+                new_contacts.append(contact)
+        new_unique_count = len(new_contacts)
+        
+        # Stream rows to the output CSV
+        if new_contacts:
+            self._csv_writer.writerows(contact.to_row() for contact in new_contacts)
+            self._csv_file.flush()
+            self.stats['contacts_extracted'] += new_unique_count
+            self.stats['contacts_with_emails'] += sum(1 for contact in new_contacts if contact.has_email())
+        
+        # Print progress with unique count (standardized format)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        schools_discovered = self.stats['schools_discovered']
+        unique_contacts = len(self.unique_contacts_set)
+        processed = self.stats['schools_processed']
+        delta_str = f" (+{new_unique_count})" if new_unique_count > 0 else ""
+        logger.info("Progress: %d schools | %d/%d processed | %d contacts%s", schools_discovered, processed, schools_discovered, unique_contacts, delta_str)
+    
     def cleanup(self):
         """
-        Basic cleanup: quit Selenium driver if it exists.
+        Basic cleanup: quit all pooled Selenium drivers and close the HTTP sessions.
         """
         try:
-            if hasattr(self, 'content_collector') and self.content_collector:
-                if self.content_collector.driver:
-                    self.content_collector.driver.quit()
-                    self.content_collector.driver = None
+            if hasattr(self, 'browser_pool') and self.browser_pool:
+                self.browser_pool.close()
+            if hasattr(self, '_http') and self._http:
+                self._http.close()
+            if hasattr(self, 'school_searcher') and self.school_searcher:
+                self.school_searcher.close()
         except Exception:
             pass  # Ignore cleanup errors
     
@@ -533,25 +759,29 @@ class StreamingPipeline:
             # Ignore errors in destructor
             pass
     
-    def _write_final_csv(self, contacts: List[Contact], filename: str):
-        """Write contacts to final CSV file"""
-        if not contacts:
-            print(f"No contacts to write to {filename}")
+    def _open_output_csv(self, filename: str):
+        """Open the output CSV and write the header; rows are appended per school"""
+        self._output_csv = filename
+        self._csv_file = open(filename, 'w', newline='', encoding='utf-8')
+        # Plain csv.writer with row tuples (Contact.to_row) - no per-row dict building/lookup
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(CSV_FIELDNAMES)
+    
+    def _close_output_csv(self):
+        """Close the output CSV (removed again if no contacts were written)"""
+        if not self._csv_file:
             return
+        self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
         
-        fieldnames = ['first_name', 'last_name', 'title', 'email', 'phone', 
-                     'school_name', 'source_url']
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for contact in contacts:
-                writer.writerow(contact.to_dict())
-        
-        from pathlib import Path
-        filename_only = Path(filename).name
-        print(f"[SAVE] Wrote {len(contacts)} contacts -> \"{filename_only}\"")
-    
+        filename_only = Path(self._output_csv).name
+        if self.stats['contacts_extracted']:
+            print(f"[SAVE] Wrote {self.stats['contacts_extracted']} contacts -> \"{filename_only}\"")
+        else:
+            # Keep previous behaviour: no file for a county without contacts
+            Path(self._output_csv).unlink(missing_ok=True)
+            print(f"No contacts to write to {self._output_csv}")
     
     def _print_summary(self):
         """Print final pipeline summary"""
@@ -571,10 +801,16 @@ if __name__ == "__main__":
     parser.add_argument('--county', action='append', default=None, help='County to process (e.g., "Denton"). Can be specified multiple times for multiple counties. If not provided, processes all counties in state.')
     parser.add_argument('--batch-size', type=int, default=0, help='Number of counties to search (0 = all counties in state)')
     parser.add_argument('--max-pages-per-school', type=int, default=3, help='Max pages per school (default: 3)')
+    parser.add_argument('--max-concurrent-schools', type=int, default=4, help='Schools processed concurrently (default: 4)')
+    parser.add_argument('--quiet', action='store_true', help='Only print warnings/errors and the final summary (no per-school progress)')
+    parser.add_argument('--no-places-cache', action='store_true', help='Always query the Places API (ignore cached search results)')
     parser.add_argument('--output', default=None, help='Output CSV. If not provided, will generate based on state name (e.g., "Texas leads.csv")')
     
     args = parser.parse_args()
     
+    if args.quiet:
+        logger.setLevel(logging.WARNING)
+    
     # Get API keys from environment variables only
     google_api_key = os.getenv("GOOGLE_PLACES_API_KEY", "")
     openai_api_key = os.getenv("OPENAI_API_KEY", "")
@@ -595,7 +831,9 @@ if __name__ == "__main__":
         global_max_api_calls=args.global_max_api_calls,
         max_pages_per_school=args.max_pages_per_school,
         state=args.state,
-        max_schools=args.max_schools
+        max_schools=args.max_schools,
+        max_concurrent_schools=args.max_concurrent_schools,
+        use_places_cache=not args.no_places_cache
     )
     
     # Determine counties to process
@@ -616,13 +854,8 @@ if __name__ == "__main__":
         )
     except KeyboardInterrupt:
         print("\n\nPipeline interrupted by user.")
-        print(f"Partial results: {len(pipeline.all_contacts)} contacts extracted")
-        if pipeline.all_contacts:
-            partial_output = args.output or f"partial_{pipeline._state or 'Texas'}_leads.csv"
-            pipeline._write_final_csv(
-                pipeline.all_contacts,
-                partial_output
-            )
+        # Rows are written as each school finishes, so the output CSV already holds the partial results
+        print(f"Partial results: {pipeline.stats['contacts_extracted']} contacts written")
     except Exception as e:
         print(f"\n\nPipeline failed: {e}")
         traceback.print_exc()
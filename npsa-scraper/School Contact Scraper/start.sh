@@ -43,4 +43,4 @@ PORT=${PORT:-8080}
 
 # Exec waitress-serve (exec replaces this shell process, so waitress becomes child of dumb-init)
 # This ensures waitress is a direct child of dumb-init for proper signal handling
-exec waitress-serve --host=0.0.0.0 --port=$PORT --threads=4 --channel-timeout=300 external_services.api:app
+exec waitress-serve --host=0.0.0.0 --port=$PORT --threads=${WAITRESS_THREADS:-16} --channel-timeout=300 external_services.api:app
@@ -10,13 +10,27 @@ Uses New Places API Essentials tier (cost-effective): places.googleapis.com/v1/p
 Only requests Essentials-tier fields to ensure lowest pricing.
 """
 
+import os
 import requests
+import requests.adapters
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 from typing import Iterator, List, Dict, Tuple, Optional
 import random
 import re
+from urllib3.util.retry import Retry
 from assets.shared.models import School
+from assets.shared.places_cache import PlacesCache
+
+# Optional: orjson decodes the Places pages (arrays of place dicts) faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # ANSI escape codes for bold text
 BOLD = '\033[1m'
@@ -26,10 +40,83 @@ def bold(text: str) -> str:
     """Make text bold in terminal output"""
     return f"{BOLD}{text}{RESET}"
 
+
+def _response_json(response: requests.Response):
+    """Decode a Places response body (orjson when available)"""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+# State abbreviation followed by a ZIP code in a formatted address (", TX 78701"), run on every Places result
+_STATE_ZIP_RE = re.compile(r',\s*([A-Z]{2})\s+\d{5}')
+
+# State name to abbreviation mapping (read-only; shared by every SchoolSearcher)
+_STATE_ABBREVIATIONS = MappingProxyType({
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
+    'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
+    'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
+    'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new_hampshire': 'NH', 'new_jersey': 'NJ', 'new_mexico': 'NM', 'new_york': 'NY',
+    'north_carolina': 'NC', 'north_dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
+    'oregon': 'OR', 'pennsylvania': 'PA', 'rhode_island': 'RI', 'south_carolina': 'SC',
+    'south_dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
+    'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west_virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY'
+})
+
+# Essentials-tier field mask (only request fields available in Essentials tier)
+# This ensures we're billed at Essentials pricing, not Pro/Enterprise
+# Field names must use 'places.' prefix for New Places API; only what _parse_new_result reads is requested
+ESSENTIALS_FIELDS = (
+    "places.id",
+    "places.displayName",
+    "places.formattedAddress",
+    "places.websiteUri",
+    "places.nationalPhoneNumber",
+    "places.internationalPhoneNumber",
+    "places.businessStatus",
+    "places.types",
+    "places.primaryType"
+)
+# Joined once: sent as the X-Goog-FieldMask header on every Text Search request
+_ESSENTIALS_FIELDMASK = ','.join(ESSENTIALS_FIELDS)
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    acquire() blocks until a token is available, allowing short bursts up to
+    `burst` requests while holding the long-run rate at `rate` per second.
+    """
+    
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class SchoolSearcher:
     """Search for schools using New Google Places API Essentials tier, yields School objects"""
     
-    def __init__(self, api_key: str, global_max_api_calls: int = None, max_schools: int = None, target_state: str = 'texas'):
+    def __init__(self, api_key: str, global_max_api_calls: int = None, max_schools: int = None, target_state: str = 'texas',
+                 places_max_qps: float = None, places_cache: Optional[PlacesCache] = None):
         # Debug: Verify API key is received
         if not api_key or len(api_key) < 10:
             print(f"WARNING: API key appears invalid in SchoolSearcher.__init__ (length: {len(api_key) if api_key else 0})")
@@ -43,22 +130,8 @@ class SchoolSearcher:
         # Check if the base name (before underscore) is a valid state
         base_state = normalized.split('_')[0] if '_' in normalized else normalized
         
-        # State name to abbreviation mapping
-        self.STATE_ABBREVIATIONS = {
-            'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
-            'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
-            'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
-            'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
-            'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
-            'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
-            'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
-            'new_hampshire': 'NH', 'new_jersey': 'NJ', 'new_mexico': 'NM', 'new_york': 'NY',
-            'north_carolina': 'NC', 'north_dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
-            'oregon': 'OR', 'pennsylvania': 'PA', 'rhode_island': 'RI', 'south_carolina': 'SC',
-            'south_dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
-            'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west_virginia': 'WV',
-            'wisconsin': 'WI', 'wyoming': 'WY'
-        }
+        # State name to abbreviation mapping (shared read-only module constant)
+        self.STATE_ABBREVIATIONS = _STATE_ABBREVIATIONS
         
         # Use base_state for abbreviation lookup (e.g., "texas" not "texas_ultra_test")
         # If base_state is not in the mapping, try the full normalized name
@@ -74,21 +147,36 @@ class SchoolSearcher:
         self.place_details_url_template = "https://places.googleapis.com/v1/places/{}"
         self.seen_place_ids = set()
         
-        # Essentials-tier field mask (only request fields available in Essentials tier)
-        # This ensures we're billed at Essentials pricing, not Pro/Enterprise
-        # Field names must use 'places.' prefix for New Places API
-        self.essentials_fields = [
-            "places.id",
-            "places.displayName",
-            "places.formattedAddress",
-            "places.location",
-            "places.websiteUri",
-            "places.nationalPhoneNumber",
-            "places.internationalPhoneNumber",
-            "places.businessStatus",
-            "places.types",
-            "places.primaryType"
-        ]
+        self.essentials_fields = ESSENTIALS_FIELDS
+        # Places limits are QPS-based: pace calls with a token bucket (places_max_qps, else PLACES_MAX_QPS,
+        # default 10/s) and count them against global_max_api_calls under a lock
+        if places_max_qps is None:
+            places_max_qps = float(os.getenv('PLACES_MAX_QPS', '10'))
+        self._places_limiter = TokenBucket(rate=places_max_qps)
+        self._api_calls_lock = threading.Lock()
+        
+        # One keep-alive session for all Places calls (no TLS handshake per query); the headers never
+        # change, so they are set once. Transient 429/5xx responses are retried with backoff.
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'X-Goog-Api-Key': self.api_key,
+            'X-Goog-FieldMask': _ESSENTIALS_FIELDMASK  # Only Essentials-tier fields
+        })
+        places_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'POST'}),  # Text Search is a read-only POST
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', places_adapter)
+        # Completed query results are cached on disk, so re-running the same counties is free
+        self.places_cache = places_cache if places_cache is not None else PlacesCache()
         self.stats = {
             'counties_searched': 0,
             'total_api_calls': 0,
@@ -100,6 +188,14 @@ class SchoolSearcher:
         # Get state info using normalized target_state
         self.state_abbrev = self.STATE_ABBREVIATIONS.get(self.target_state, '')
         self.full_state_name = self.target_state.replace('_', ' ').title()
+        
+        # Precomputed forms used by _is_state_result on every Places result
+        self._state_aliases = frozenset(
+            alias for alias in (self.state_abbrev.lower(), self.target_state, self.full_state_name.lower()) if alias
+        )
+        self._abbrev_in_address = f', {self.state_abbrev} ' if self.state_abbrev else None
+        self._abbrev_at_end = f', {self.state_abbrev}' if self.state_abbrev else None
+        self._full_state_in_address = f' {self.full_state_name.upper()}'
 
     def _hit_global_limit(self) -> bool:
         """Check if global API call limit or school limit has been reached"""
@@ -113,6 +209,25 @@ class SchoolSearcher:
         )
         return api_limit_hit or school_limit_hit
 
+    def _reserve_api_call(self) -> bool:
+        """Atomically count one API call against the global cap; False if the cap is reached"""
+        with self._api_calls_lock:
+            if self.global_max_api_calls is not None and self.stats['total_api_calls'] >= self.global_max_api_calls:
+                return False
+            self.stats['total_api_calls'] += 1
+            return True
+
+    def _post_places(self, body: Dict) -> Optional[requests.Response]:
+        """POST to Places Text Search over the shared session, paced by the token bucket. None if the API cap is reached."""
+        if not self._reserve_api_call():
+            return None
+        self._places_limiter.acquire()
+        return self.session.post(self.text_search_url, json=body, timeout=60)
+
+    def close(self):
+        """Close the pooled Places session"""
+        self.session.close()
+
     def _extract_state_and_county_new(self, address: str, location: Dict = None) -> Tuple[str, str]:
         """
         Extract state and county from New API response.
@@ -124,7 +239,7 @@ class SchoolSearcher:
         # Parse formatted address (e.g., "123 Main St, Austin, TX 78701, USA")
         if address:
             # Look for state abbreviation pattern
-            state_match = re.search(r',\s*([A-Z]{2})\s+\d{5}', address)
+            state_match = _STATE_ZIP_RE.search(address)
             if state_match:
                 state_value = state_match.group(1)
             
@@ -141,36 +256,36 @@ class SchoolSearcher:
 
     def _is_state_result(self, detected_state: str, formatted_address: str) -> bool:
         """Determine if the result belongs to the target state"""
-        if detected_state:
-            normalized_state = detected_state.strip().lower()
-            # Check against abbreviation, normalized name, or full name
-            if normalized_state == self.state_abbrev.lower() or normalized_state == self.target_state or normalized_state == self.full_state_name.lower():
-                return True
+        # Check against abbreviation, normalized name, or full name
+        if detected_state and detected_state.strip().lower() in self._state_aliases:
+            return True
 
-        address_upper = (formatted_address or '').upper()
+        if not formatted_address:
+            return False
+        address_upper = formatted_address.upper()
         
         # Check for state abbreviation in address
-        if self.state_abbrev:
-            if f', {self.state_abbrev} ' in address_upper or address_upper.endswith(f', {self.state_abbrev}'):
-                return True
+        if self._abbrev_in_address and (self._abbrev_in_address in address_upper or address_upper.endswith(self._abbrev_at_end)):
+            return True
         
         # Check for full state name in address
-        if f' {self.full_state_name.upper()}' in address_upper:
+        if self._full_state_in_address in address_upper:
             return True
 
         # Last fallback: look for state abbreviation pattern
         if self.state_abbrev:
-            match = re.search(r',\s*([A-Z]{2})\s+\d{5}', formatted_address or '')
+            match = _STATE_ZIP_RE.search(formatted_address)
             if match and match.group(1) == self.state_abbrev:
                 return True
 
         return False
 
-    def _parse_new_result(self, result: Dict, location: str, search_term: str) -> Optional[School]:
+    def _parse_new_result(self, result: Dict, location: str, search_term: str, found_via: str = None) -> Optional[School]:
         """
         Parse a single result from New Places API into a School object.
         Returns None if duplicate or not Texas.
         Only uses Essentials-tier fields to ensure lowest pricing.
+        found_via: search term prefix (before " in "); derived from search_term if not given.
         """
         place_id = result.get('id', '')
         if not place_id:
@@ -181,17 +296,18 @@ class SchoolSearcher:
             return None
         self.seen_place_ids.add(place_id)
         
+        # Validate state-only from the address alone before extracting anything else
+        # (the detected state comes from the same address, so this rejects the same places)
+        formatted_address = result.get('formattedAddress', '')
+        if not self._is_state_result(None, formatted_address):
+            self.stats['non_state_skipped'] += 1
+            return None
+        
         # Extract data from New API format (Essentials-tier fields only)
         display_name = result.get('displayName', {}).get('text', '') if isinstance(result.get('displayName'), dict) else result.get('displayName', '')
-        formatted_address = result.get('formattedAddress', '')
         
         # Extract state and county from address
-        detected_state, detected_county = self._extract_state_and_county_new(formatted_address, result.get('location'))
-        
-        # Validate state-only
-        if not self._is_state_result(detected_state, formatted_address):
-            self.stats['non_state_skipped'] += 1
-            return None
+        detected_state, detected_county = self._extract_state_and_county_new(formatted_address)
         
         # New API Text Search includes websiteUri and phone in response (Essentials tier)
         # We request these fields in the field mask, so they should be in the response
@@ -220,7 +336,7 @@ class SchoolSearcher:
             state=self.full_state_name,
             detected_state=detected_state or '',
             detected_county=detected_county or '',
-            found_via=search_term.split(' in ')[0] if ' in ' in search_term else search_term
+            found_via=found_via if found_via is not None else search_term.split(' in ', 1)[0]
         )
         
         # Update stats
@@ -230,6 +346,50 @@ class SchoolSearcher:
         
         return school
 
+    def _county_search_terms(self, county: str, state: str, max_search_terms: int = None) -> List[str]:
+        """Text Search queries for one county (lean set: original 5 + Episcopal for impact)"""
+        search_terms = [
+            f"Christian schools in {county} County, {state}",
+            f"Catholic schools in {county} County, {state}",
+            f"Episcopal schools in {county} County, {state}",
+            f"private schools in {county} County, {state}",
+            f"academy in {county} County, {state}",
+            f"prep school in {county} County, {state}"
+        ]
+        if max_search_terms is not None:
+            search_terms = search_terms[:max(0, max_search_terms)]
+        return search_terms
+
+    def _submit_county(self, executor: ThreadPoolExecutor, county: str, search_terms: List[str]) -> List[Tuple[str, Optional[Future]]]:
+        """
+        Start fetching every query for a county on the executor; returns (query, future) pairs in term order.
+        With max_schools set nothing is submitted (future is None): the cap can be reached after the first
+        term, and queries already sent are billed, so each term is fetched only once it is reached.
+        """
+        if self.max_schools is not None:
+            return [(query, None) for query in search_terms]
+        return [(query, executor.submit(self._fetch_query_results, county, query)) for query in search_terms]
+
+    def _parse_county_results(self, county: str, pending: List[Tuple[str, Optional[Future]]]) -> Iterator[School]:
+        """
+        Parse fetched results in term order, so dedup and found_via stay deterministic
+        no matter which query finished first.
+        """
+        for query, future in pending:
+            if self._reached_max_schools():
+                return
+            results = future.result() if future is not None else self._fetch_query_results(county, query)
+            found_via = query.split(' in ', 1)[0]  # Same for every result of this query
+            for result in results:
+                if self._reached_max_schools():
+                    return
+                school = self._parse_new_result(result, county, query, found_via)
+                if school:
+                    yield school
+
+    def _reached_max_schools(self) -> bool:
+        return self.max_schools is not None and self.stats['total_schools_found'] >= self.max_schools
+
     def search_county(
         self,
         county: str,
@@ -243,137 +403,113 @@ class SchoolSearcher:
         # Use target_state if state not provided
         if state is None:
             state = self.full_state_name
-        # Define search terms (lean set: original 5 + Episcopal for impact)
-        search_terms = [
-            f"Christian schools in {county} County, {state}",
-            f"Catholic schools in {county} County, {state}",
-            f"Episcopal schools in {county} County, {state}",
-            f"private schools in {county} County, {state}",
-            f"academy in {county} County, {state}",
-            f"prep school in {county} County, {state}"
-        ]
+        search_terms = self._county_search_terms(county, state, max_search_terms)
+        if not search_terms:
+            return
 
-        if max_search_terms is not None:
-            search_terms = search_terms[:max(0, max_search_terms)]
+        # Debug: Check if API key is set
+        if not self.api_key or len(self.api_key) < 10:
+            print(f"    WARNING: API key appears invalid (length: {len(self.api_key) if self.api_key else 0})")
+
+        # Run all search terms for the county concurrently (pacing is left to the token bucket);
+        # with max_schools set they run one at a time and stop at the cap
+        with ThreadPoolExecutor(max_workers=len(search_terms)) as executor:
+            yield from self._parse_county_results(county, self._submit_county(executor, county, search_terms))
+
+    def _fetch_query_results(self, county: str, query: str) -> List[Dict]:
+        """
+        Run one Text Search query (following pagination) and return the raw place results.
+        Safe to call from worker threads: only touches the locked API-call counter, the rate limiter
+        and the (locked) places cache.
+        """
+        # Keyed on the field mask too, so changing the requested fields invalidates old entries
+        cache_key = PlacesCache.make_key(_ESSENTIALS_FIELDMASK, query)
+        cached = self.places_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        all_results = []
+        complete = False  # Only a fully paginated (or empty) result set is cached
 
-        for query in search_terms:
-            # Check global limit before each API call
-            if self._hit_global_limit():
+        # Check global limit before each API call
+        if self._hit_global_limit():
+            print(f"    Global API call limit reached. Stopping {county} County search.")
+            return all_results
+
+        try:
+            # Request body for Text Search (New Places API format)
+            request_body = {
+                'textQuery': query,
+                'maxResultCount': 20,  # Max results per request
+                'languageCode': 'en'
+            }
+
+            response = self._post_places(request_body)
+            if response is None:
                 print(f"    Global API call limit reached. Stopping {county} County search.")
-                break
+                return all_results
 
-            try:
-                self.stats['total_api_calls'] += 1
-                
-                # NEW Places API: POST request with JSON body (Essentials tier)
-                headers = {
-                    'Content-Type': 'application/json',
-                    'X-Goog-Api-Key': self.api_key,
-                    'X-Goog-FieldMask': ','.join(self.essentials_fields)  # Only Essentials-tier fields
-                }
-                
-                # Request body for Text Search (New Places API format)
-                request_body = {
-                    'textQuery': query,
-                    'maxResultCount': 20,  # Max results per request
-                    'languageCode': 'en'
-                }
-                
-                # Debug: Check if API key is set
-                if not self.api_key or len(self.api_key) < 10:
-                    print(f"    WARNING: API key appears invalid (length: {len(self.api_key) if self.api_key else 0})")
-                
-                response = requests.post(self.text_search_url, headers=headers, json=request_body, timeout=60)
-                
-                # Debug: Log response for errors
-                if response.status_code != 200:
-                    try:
-                        error_data = response.json() if response.content else {}
-                        error_msg = error_data.get('error', {}).get('message', 'Unknown error')
-                        error_details = error_data.get('error', {}).get('details', [])
-                        if response.status_code == 400:
-                            print(f"    DEBUG: Error details: {error_details}")
-                            print(f"    DEBUG: Full error response: {error_data}")
-                    except Exception as e:
-                        print(f"    DEBUG: Could not parse error response: {e}")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # New API returns 'places' array directly
-                    results = data.get('places', [])
-                    
-                    # Yield each school found (check school limit)
-                    for result in results:
-                        if self.max_schools is not None and self.stats['total_schools_found'] >= self.max_schools:
-                            break
-                        school = self._parse_new_result(result, county, query)
-                        if school:
-                            yield school
-                        # Check again after yielding (in case limit was reached)
-                        if self.max_schools is not None and self.stats['total_schools_found'] >= self.max_schools:
-                            break
-                    
-                    # Check for next page token (pagination)
-                    next_page_token = data.get('nextPageToken')
-                    while next_page_token and not self._hit_global_limit():
-                        # Wait 2 seconds before next page (Google requirement)
-                        time.sleep(2)
-                        self.stats['total_api_calls'] += 1
-                        
-                        # Pagination request
-                        pagination_body = {
-                            'pageToken': next_page_token
-                        }
-                        
-                        response_page = requests.post(self.text_search_url, headers=headers, json=pagination_body, timeout=60)
-                        if response_page.status_code == 200:
-                            page_data = response_page.json()
-                            page_results = page_data.get('places', [])
-                            if page_results:
-                                for result in page_results:
-                                    if self.max_schools is not None and self.stats['total_schools_found'] >= self.max_schools:
-                                        break
-                                    school = self._parse_new_result(result, county, query)
-                                    if school:
-                                        yield school
-                                    # Check again after yielding (in case limit was reached)
-                                    if self.max_schools is not None and self.stats['total_schools_found'] >= self.max_schools:
-                                        break
-                                # Break out of pagination loop if limit reached
-                                if self.max_schools is not None and self.stats['total_schools_found'] >= self.max_schools:
-                                    break
-                            next_page_token = page_data.get('nextPageToken')
-                        else:
-                            break
-                elif response.status_code == 204:
-                    # Success but no results
-                    pass
-                else:
-                    # API error - get detailed error message
-                    try:
-                        error_data = response.json() if response.content else {}
-                        error_msg = error_data.get('error', {}).get('message', 'Unknown error')
-                        if response.status_code == 403:
-                            print(f"    API authentication error for query '{query}': {error_msg}")
-                            print(f"    Check: 1) Places API (New) is enabled in your Google Cloud project")
-                            print(f"           2) API key has no restrictions blocking this request")
-                            print(f"           3) API key is valid and not expired")
-                        else:
-                            print(f"    API error for query '{query}': HTTP {response.status_code} - {error_msg}")
-                    except:
-                        print(f"    API error for query '{query}': HTTP {response.status_code} - {response.text[:200]}")
-                
-                # Rate limiting (New API has similar limits)
-                time.sleep(0.1)  # 100ms between requests
-                
-            except Exception as e:
-                print(f"    Error on query '{query}': {e}")
-                time.sleep(2)
-            
-            # Check global limit again after query
-            if self._hit_global_limit():
-                break
+            # Debug: Log response for errors
+            if response.status_code != 200:
+                try:
+                    error_data = _response_json(response) if response.content else {}
+                    error_msg = error_data.get('error', {}).get('message', 'Unknown error')
+                    error_details = error_data.get('error', {}).get('details', [])
+                    if response.status_code == 400:
+                        print(f"    DEBUG: Error details: {error_details}")
+                        print(f"    DEBUG: Full error response: {error_data}")
+                except Exception as e:
+                    print(f"    DEBUG: Could not parse error response: {e}")
+
+            if response.status_code == 200:
+                data = _response_json(response)
+
+                # New API returns 'places' array directly
+                all_results.extend(data.get('places', []))
+
+                # Check for next page token (pagination)
+                next_page_token = data.get('nextPageToken')
+                while next_page_token and not self._hit_global_limit():
+                    # Wait 2 seconds before next page (Google requirement)
+                    time.sleep(2)
+
+                    # Pagination request
+                    pagination_body = {
+                        'pageToken': next_page_token
+                    }
+
+                    response_page = self._post_places(pagination_body)
+                    if response_page is not None and response_page.status_code == 200:
+                        page_data = _response_json(response_page)
+                        all_results.extend(page_data.get('places', []))
+                        next_page_token = page_data.get('nextPageToken')
+                    else:
+                        break
+                complete = not next_page_token
+            elif response.status_code == 204:
+                # Success but no results
+                complete = True
+            else:
+                # API error - get detailed error message
+                try:
+                    error_data = _response_json(response) if response.content else {}
+                    error_msg = error_data.get('error', {}).get('message', 'Unknown error')
+                    if response.status_code == 403:
+                        print(f"    API authentication error for query '{query}': {error_msg}")
+                        print(f"    Check: 1) Places API (New) is enabled in your Google Cloud project")
+                        print(f"           2) API key has no restrictions blocking this request")
+                        print(f"           3) API key is valid and not expired")
+                    else:
+                        print(f"    API error for query '{query}': HTTP {response.status_code} - {error_msg}")
+                except:
+                    print(f"    API error for query '{query}': HTTP {response.status_code} - {response.text[:200]}")
+
+        except Exception as e:
+            print(f"    Error on query '{query}': {e}")
+
+        if complete:
+            self.places_cache.set(cache_key, all_results)
+        return all_results
 
     def discover_schools(
         self,
@@ -396,39 +532,64 @@ class SchoolSearcher:
         if state is None:
             state = self.full_state_name
         
-        # Shuffle counties for randomness
-        shuffled_counties = counties.copy()
-        random.shuffle(shuffled_counties)
-        
+        # Shuffle counties for randomness (sample() draws the shuffled batch directly, no full copy first)
         if batch_size and 0 < batch_size < len(counties):
-            counties_to_search = shuffled_counties[:batch_size]
+            counties_to_search = random.sample(counties, batch_size)
         else:
-            counties_to_search = shuffled_counties
+            counties_to_search = random.sample(counties, len(counties))
         print(f"{bold('[STEP 1]')} Starting discovery: {len(counties_to_search)} counties, API cap: {self.global_max_api_calls or 'None'}")
         
         start_time = time.time()
         
-        for i, county in enumerate(counties_to_search, 1):
-            if self._hit_global_limit():
-                print(f"Global API call cap reached after {i-1} counties.")
-                break
-            
-            print(f"[{i}/{len(counties_to_search)}] Searching {county} County...")
-            county_start = time.time()
-            
-            schools_found = 0
-            # Yield schools one at a time from this county
-            for school in self.search_county(county, state, max_search_terms):
-                schools_found += 1
-                self.stats['counties_searched'] = i
-                yield school
-            
-            county_time = time.time() - county_start
-            if schools_found > 0 or (i % 5 == 0):
-                print(f"{bold('[STEP 1]')} {county}: {schools_found} schools ({county_time:.1f}s) | Total: {self.stats['total_schools_found']} schools, {self.stats['total_api_calls']} API calls")
-            
-            if self._hit_global_limit():
-                break
+        # Debug: Check if API key is set
+        if not self.api_key or len(self.api_key) < 10:
+            print(f"    WARNING: API key appears invalid (length: {len(self.api_key) if self.api_key else 0})")
+        
+        terms_by_county = [self._county_search_terms(county, state, max_search_terms) for county in counties_to_search]
+        
+        # Counties are pipelined: the next county's queries are already in flight while this
+        # county's schools are parsed and consumed.
+        # All requests still go through the shared token bucket, so the API rate is unchanged.
+        # With max_schools set there is no look-ahead: the cap can be reached partway through a
+        # county, and look-ahead queries already sent are billed even if never consumed. For the
+        # same reason a capped county's terms are fetched one at a time (see _submit_county).
+        lookahead = self.max_schools is None
+        max_workers = max((len(terms) for terms in terms_by_county), default=1) * 2
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        try:
+            pending = []
+            for i, county in enumerate(counties_to_search, 1):
+                if self._hit_global_limit() and not pending:
+                    print(f"Global API call cap reached after {i-1} counties.")
+                    break
+                
+                print(f"[{i}/{len(counties_to_search)}] Searching {county} County...")
+                county_start = time.time()
+                if not pending:
+                    pending = self._submit_county(executor, county, terms_by_county[i - 1])
+                
+                # Look ahead one county unless this one already exhausts the API cap
+                next_pending = []
+                if lookahead and i < len(counties_to_search) and not self._hit_global_limit():
+                    next_pending = self._submit_county(executor, counties_to_search[i], terms_by_county[i])
+                
+                schools_found = 0
+                # Yield schools one at a time from this county
+                for school in self._parse_county_results(county, pending):
+                    schools_found += 1
+                    self.stats['counties_searched'] = i
+                    yield school
+                pending = next_pending
+                
+                county_time = time.time() - county_start
+                if schools_found > 0 or (i % 5 == 0):
+                    print(f"{bold('[STEP 1]')} {county}: {schools_found} schools ({county_time:.1f}s) | Total: {self.stats['total_schools_found']} schools, {self.stats['total_api_calls']} API calls")
+                
+                if (self._hit_global_limit() and not pending) or self._reached_max_schools():
+                    break
+        finally:
+            # Don't wait on a lookahead county nobody will consume
+            executor.shutdown(wait=False, cancel_futures=True)
         
         elapsed = time.time() - start_time
         print(f"{bold('[STEP 1]')} Complete: {self.stats['counties_searched']} counties, {self.stats['total_schools_found']} schools, {self.stats['total_api_calls']} API calls, {elapsed/60:.1f} min")
@@ -13,12 +13,22 @@ from openai import OpenAI
 import pandas as pd
 import csv
 import io
+import json
 import time
 import os
 import sys
 from typing import List, Dict, Optional
 import re
 
+from assets.shared.llm_cache import LLMCache
+
+# Use orjson for decoding LLM JSON responses if available (falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # ANSI escape codes for bold text
 BOLD = '\033[1m'
 RESET = '\033[0m'
@@ -35,7 +45,7 @@ You are a title classifier for school administrative contacts.
 Your job is to determine if a contact's title indicates they are an ADMINISTRATIVE/LEADERSHIP role at a school.
 
 INPUT:
-- A contact with: First Name, Last Name, Title, Email (optional), Phone (optional)
+- A contact's Title
 
 OUTPUT:
 Return ONLY one word: "KEEP" or "EXCLUDE"
@@ -97,21 +107,33 @@ OUTPUT:
 Return ONLY "KEEP" or "EXCLUDE" - nothing else.
 """
 
+# Appended to TITLE_FILTERING_PROMPT for batched requests (replaces the single-word OUTPUT rule)
+TITLE_BATCH_INSTRUCTIONS = """
+
+BATCH MODE (overrides OUTPUT above):
+You will receive a numbered list of titles, one per line.
+Apply the same rules to each title independently.
+Return ONLY a JSON object of the form {"decisions": ["KEEP", "EXCLUDE", ...]}
+with exactly one entry per title, in the same order as the input.
+"""
+
 
 class TitleFilter:
     """Filter contacts by title using LLM"""
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", cache: Optional[LLMCache] = None):
         """
         Initialize title filter
         
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini)
+            cache: Decision cache (default: shared on-disk LLMCache)
         """
         self.api_key = api_key
         self.model = model
         self.client = OpenAI(api_key=api_key)
+        self.cache = cache if cache is not None else LLMCache()
     
     def filter_contact(self, contact: Dict, max_retries: int = 3) -> bool:
         """
@@ -136,13 +158,38 @@ class TitleFilter:
         if not first_name or not last_name:
             return False
         
+        return self.filter_title(title, max_retries=max_retries)
+    
+    def filter_title(self, title: str, max_retries: int = 3) -> bool:
+        """
+        Determine if a title is administrative (the keep decision depends only on the title)
+        
+        Args:
+            title: Contact title
+            max_retries: Maximum retry attempts
+        
+        Returns:
+            True if contacts with this title should be kept, False if excluded (or undecided)
+        """
+        return bool(self._decide_title(title, max_retries))
+    
+    def _decide_title(self, title: str, max_retries: int) -> Optional[bool]:
+        """filter_title's decision, or None when the LLM gave no usable answer (error, 429, unclear reply)"""
+        title = (title or '').strip()
+        if not title:
+            return False
+        
+        # Only the title is sent - names/email/phone don't affect the decision and cost tokens
+        user_message = f"Title: {title}"
+        
+        # Decisions are keyed on the title, so repeated titles hit the cache across schools and runs
+        cache_key = self.cache.make_key(self.model, TITLE_FILTERING_PROMPT, user_message)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         for attempt in range(max_retries):
             try:
-                # Build user message with contact info
-                user_message = f"""First Name: {first_name}
-Last Name: {last_name}
-Title: {title}"""
-                
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=[
@@ -158,49 +205,137 @@ Title: {title}"""
         
                 # Parse response
                 if "KEEP" in response_text:
+                    self.cache.set(cache_key, True)
                     return True
                 elif "EXCLUDE" in response_text:
+                    self.cache.set(cache_key, False)
                     return False
                 else:
-                    # Default to exclude if unclear
-                    print(f"      WARNING: Unexpected LLM response for {first_name} {last_name}: {response_text}")
-                    return False
+                    # Unclear: not a decision (callers exclude it for now)
+                    print(f"      WARNING: Unexpected LLM response for title \"{title}\": {response_text}")
+                    return None
                 
             except Exception as e:
-                error_str = str(e)
-                is_rate_limit = '429' in error_str or 'rate_limit' in error_str.lower()
+                wait_seconds = self._retry_wait(e, attempt, max_retries)
+                if wait_seconds is None:
+                    return None
+                time.sleep(wait_seconds)
+        
+        return None
+    
+    def filter_titles_batch(self, titles: List[str], max_retries: int = 3, batch_size: int = 50) -> List[Optional[bool]]:
+        """
+        Decide keep/exclude for many titles with one LLM call per batch of up to batch_size titles
+        
+        Args:
+            titles: Contact titles
+            max_retries: Maximum retry attempts per batch
+            batch_size: Titles per request (default: 50)
+        
+        Returns:
+            List of keep decisions, aligned with titles; None where no decision could be made
+            (API error, rate limit, unclear reply), so callers can retry instead of remembering False
+        """
+        decisions: List[Optional[bool]] = [None] * len(titles)
+        pending: Dict[str, List[int]] = {}  # stripped title -> positions still needing a decision
+        
+        for i, title in enumerate(titles):
+            title = (title or '').strip()
+            if not title:
+                decisions[i] = False
+                continue
+            # Same cache key as filter_title, so single and batch decisions are shared
+            cached = self.cache.get(self.cache.make_key(self.model, TITLE_FILTERING_PROMPT, f"Title: {title}"))
+            if cached is not None:
+                decisions[i] = cached
+            else:
+                pending.setdefault(title, []).append(i)
+        
+        pending_titles = list(pending)
+        for start in range(0, len(pending_titles), batch_size):
+            batch = pending_titles[start:start + batch_size]
+            for title, keep in zip(batch, self._filter_titles_request(batch, max_retries)):
+                for i in pending[title]:
+                    decisions[i] = keep
+        
+        return decisions
+    
+    def _filter_titles_request(self, titles: List[str], max_retries: int) -> List[Optional[bool]]:
+        """Send one batch of titles and return their decisions (None for any that fail)"""
+        user_message = "\n".join(f"{n}) {title}" for n, title in enumerate(titles, 1))
+        
+        for attempt in range(max_retries):
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": TITLE_FILTERING_PROMPT + TITLE_BATCH_INSTRUCTIONS},
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=0.0,
+                    max_tokens=20 * len(titles) + 50,
+                    response_format={"type": "json_object"}
+                )
+                
+                raw_decisions = _json_loads(response.choices[0].message.content).get("decisions", [])
+                if len(raw_decisions) != len(titles):
+                    print(f"      WARNING: Title batch returned {len(raw_decisions)} decisions for {len(titles)} titles")
                 
-                if is_rate_limit:
-                    wait_seconds = 1.0
-                    import re
-                    wait_match = re.search(r'Please try again in (\d+)(ms|s)', error_str, re.IGNORECASE)
-                    if wait_match:
-                        wait_value = int(wait_match.group(1))
-                        wait_unit = wait_match.group(2).lower()
-                        if wait_unit == 'ms':
-                            wait_seconds = (wait_value / 1000.0) + 0.5
-                        else:
-                            wait_seconds = wait_value + 0.5
-                    
-                    if attempt < max_retries - 1:
-                        print(f"      {bold('[LLM]')} Rate limit hit (attempt {attempt + 1}/{max_retries}), waiting {wait_seconds:.1f}s...")
-                        time.sleep(wait_seconds)
-                        continue
+                results = []
+                for i, title in enumerate(titles):
+                    decision = str(raw_decisions[i]).strip().upper() if i < len(raw_decisions) else ''
+                    if decision in ("KEEP", "EXCLUDE"):
+                        keep = decision == "KEEP"
+                        self.cache.set(self.cache.make_key(self.model, TITLE_FILTERING_PROMPT, f"Title: {title}"), keep)
+                        results.append(keep)
                     else:
-                        print(f"      {bold('[LLM]')} Rate limit exceeded. Excluding contact.")
-                        return False
+                        # Missing/unclear entry - decide this title on its own
+                        results.append(self._decide_title(title, max_retries))
+                return results
+                
+            except Exception as e:
+                wait_seconds = self._retry_wait(e, attempt, max_retries)
+                if wait_seconds is None:
+                    return [None] * len(titles)
+                time.sleep(wait_seconds)
+        
+        return [None] * len(titles)
+    
+    def _retry_wait(self, e: Exception, attempt: int, max_retries: int) -> Optional[float]:
+        """
+        Decide whether a failed request should be retried
+        
+        Returns:
+            Seconds to wait before retrying, or None to give up (exclude)
+        """
+        error_str = str(e)
+        is_rate_limit = '429' in error_str or 'rate_limit' in error_str.lower()
+        
+        if is_rate_limit:
+            wait_seconds = 1.0
+            wait_match = re.search(r'Please try again in (\d+)(ms|s)', error_str, re.IGNORECASE)
+            if wait_match:
+                wait_value = int(wait_match.group(1))
+                wait_unit = wait_match.group(2).lower()
+                if wait_unit == 'ms':
+                    wait_seconds = (wait_value / 1000.0) + 0.5
                 else:
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"      WARNING: LLM error (attempt {attempt + 1}/{max_retries}): {e}, retrying in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    print(f"      ERROR: LLM error: {e}")
-                    return False
+                    wait_seconds = wait_value + 0.5
+            
+            if attempt < max_retries - 1:
+                print(f"      {bold('[LLM]')} Rate limit hit (attempt {attempt + 1}/{max_retries}), waiting {wait_seconds:.1f}s...")
+                return wait_seconds
+            print(f"      {bold('[LLM]')} Rate limit exceeded. Excluding title.")
+            return None
         
-        return False
+        if attempt < max_retries - 1:
+            wait_time = 2 ** attempt
+            print(f"      WARNING: LLM error (attempt {attempt + 1}/{max_retries}): {e}, retrying in {wait_time}s...")
+            return wait_time
+        print(f"      ERROR: LLM error: {e}")
+        return None
     
-    def filter_contacts(self, input_csv: str, output_csv: str, output_excluded_csv: str = None):
+    def filter_contacts(self, input_csv: str, output_csv: str, output_excluded_csv: str = None, chunksize: int = 5000):
         """
         Filter contacts from Step 9 to keep only administrative roles
         
@@ -208,54 +343,50 @@ Title: {title}"""
             input_csv: CSV from Step 9 with all contacts
             output_csv: Output CSV with filtered contacts (administrative only)
             output_excluded_csv: Optional CSV with excluded contacts (for review)
+            chunksize: Rows read and written per chunk (memory stays bounded on large CSVs)
         """
-        # Read contacts from Step 9
-        df = pd.read_csv(input_csv)
-        print(f"{bold('[STEP 10]')} Processing {len(df)} contacts")
+        columns = ['first_name', 'last_name', 'title', 'email', 'phone', 'school_name', 'source_url']
         
-        kept_contacts = []
-        excluded_contacts = []
+        # Header-only output first (also the result when nothing is kept); kept rows are appended per chunk
+        pd.DataFrame(columns=columns).to_csv(output_csv, index=False)
+        excluded_written = False
+        total = kept_total = excluded_total = 0
         
-        for idx, row in df.iterrows():
-            contact = {
-                'first_name': row.get('first_name', ''),
-                'last_name': row.get('last_name', ''),
-                'title': row.get('title', ''),
-                'email': row.get('email', ''),
-                'phone': row.get('phone', ''),
-                'school_name': row.get('school_name', ''),
-                'source_url': row.get('source_url', '')
-            }
-            
-            if (idx + 1) % 50 == 0:
-                print(f"{bold('[STEP 10]')} Progress: {idx + 1}/{len(df)} contacts")
-            
-            # Filter by title
-            should_keep = self.filter_contact(contact, max_retries=5)
+        print(f"{bold('[STEP 10]')} Processing contacts from {input_csv}")
+        
+        # Read contacts from Step 9 a chunk at a time instead of loading the whole CSV
+        for chunk in pd.read_csv(input_csv, chunksize=chunksize):
+            kept_contacts = []
+            excluded_contacts = []
             
-            if should_keep:
-                kept_contacts.append(contact)
-            else:
-                excluded_contacts.append(contact)
+            for row in chunk.to_dict('records'):
+                contact = {field: row.get(field, '') for field in columns}
+                
+                # Rate limiting - small delay between contacts
+                if total > 0:
+                    time.sleep(0.1)
+                total += 1
+                if total % 50 == 0:
+                    print(f"{bold('[STEP 10]')} Progress: {total} contacts")
+                
+                # Filter by title
+                if self.filter_contact(contact, max_retries=5):
+                    kept_contacts.append(contact)
+                else:
+                    excluded_contacts.append(contact)
             
-            # Rate limiting - small delay between contacts
-            if idx < len(df) - 1:
-                time.sleep(0.1)
-        
-        # Save results
-        if kept_contacts:
-            df_kept = pd.DataFrame(kept_contacts)
-            df_kept.to_csv(output_csv, index=False)
-        else:
-            # Create empty CSV with headers
-            pd.DataFrame(columns=['first_name', 'last_name', 'title', 'email', 'phone', 'school_name', 'source_url']).to_csv(output_csv, index=False)
-        
-        if output_excluded_csv and excluded_contacts:
-            df_excluded = pd.DataFrame(excluded_contacts)
-            df_excluded.to_csv(output_excluded_csv, index=False)
+            # Save this chunk's results
+            if kept_contacts:
+                pd.DataFrame(kept_contacts, columns=columns).to_csv(output_csv, mode='a', header=False, index=False)
+            if output_excluded_csv and excluded_contacts:
+                pd.DataFrame(excluded_contacts, columns=columns).to_csv(
+                    output_excluded_csv, mode='a' if excluded_written else 'w', header=not excluded_written, index=False
+                )
+                excluded_written = True
+            kept_total += len(kept_contacts)
+            excluded_total += len(excluded_contacts)
         
-        print(f"{bold('[STEP 10]')} Complete: {len(kept_contacts)} kept, {len(excluded_contacts)} excluded from {len(df)} total")
-
+        print(f"{bold('[STEP 10]')} Complete: {kept_total} kept, {excluded_total} excluded from {total} total")
 
 if __name__ == "__main__":
     import argparse
@@ -9,6 +9,7 @@ Input: List of Contact objects from Step 10
 Output: Two lists - contacts_with_emails, contacts_without_emails
 """
 
+import pandas as pd
 from typing import List, Tuple
 from assets.shared.models import Contact
 
@@ -59,6 +60,36 @@ class ContactSplitter:
         print("="*70)
         
         return contacts_with_emails, contacts_without_emails
+    
+    def split_frame(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Split a contacts DataFrame into two groups based on email presence.
+        Same rule as Contact.has_email(), applied as one boolean mask.
+        
+        Args:
+            df: Contacts DataFrame with an 'email' column
+            
+        Returns:
+            Tuple of (df_with_emails, df_without_emails)
+        """
+        print("\n" + "="*70)
+        print("STEP 11: SPLITTING CONTACTS")
+        print("="*70)
+        
+        has_email = df['email'].fillna('').astype(str).str.strip() != ''
+        df_with_emails = df[has_email]
+        df_without_emails = df[~has_email]
+        
+        self.stats['total_contacts'] = len(df)
+        self.stats['contacts_with_emails'] = len(df_with_emails)
+        self.stats['contacts_without_emails'] = len(df_without_emails)
+        
+        print(f"  Total contacts: {self.stats['total_contacts']}")
+        print(f"  Contacts with emails: {self.stats['contacts_with_emails']}")
+        print(f"  Contacts without emails: {self.stats['contacts_without_emails']}")
+        print("="*70)
+        
+        return df_with_emails, df_without_emails
 
 
 if __name__ == "__main__":
@@ -9,15 +9,39 @@ Output: List of Contact objects with emails added where found
 This step is optional and non-blocking - pipeline continues even if enrichment fails.
 """
 
+import asyncio
 import os
 import pandas as pd
 import requests
+import requests.adapters
 import time
 from typing import Optional, Dict, List
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 import re
 from assets.shared.models import Contact
 
+# Try to import aiohttp for concurrent Hunter.io lookups (optional - falls back to sequential requests)
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Try to import pyarrow to load the enrichment CSV as Arrow string columns (optional - falls back to the C parser)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Hunter.io Email Finder allows 15 requests/second but only 500/minute; 8/s (480/min) stays under both
+HUNTER_MAX_QPS = float(os.getenv('HUNTER_MAX_QPS', '8'))
+HUNTER_MAX_CONCURRENCY = int(os.getenv('HUNTER_MAX_CONCURRENCY', '10'))
+# Rate-limited (429) lookups pause the whole limiter this long, then retry (up to HUNTER_429_RETRIES times)
+HUNTER_429_PAUSE = 60
+HUNTER_429_RETRIES = 3
+
 # ANSI escape codes for bold text
 BOLD = '\033[1m'
 RESET = '\033[0m'
@@ -27,6 +51,54 @@ def bold(text: str) -> str:
     return f"{BOLD}{text}{RESET}"
 
 
+def _first_nonempty_text(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """Per row, the first of columns (that exist) with a non-empty value, as stripped strings ('' if none)"""
+    values = pd.Series('', index=df.index, dtype=object)
+    for name in reversed(columns):
+        if name in df.columns:
+            column = df[name].fillna('').astype(str)
+            values = column.where(column != '', values)
+    return values.str.strip()
+
+
+class AsyncTokenBucket:
+    """
+    asyncio token-bucket rate limiter (one event loop only).
+    acquire() waits until a token is available, allowing short bursts up to
+    `burst` requests while holding the long-run rate at `rate` per second.
+    pause() holds every caller (e.g. after a 429) instead of just the one that was limited.
+    """
+    
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+    
+    def pause(self, seconds: float) -> bool:
+        """Stop handing out tokens for `seconds`; returns False if a pause is already running"""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return False
+        self._paused_until = now + seconds
+        return True
+    
+    async def acquire(self):
+        """Take one token, sleeping until one is available (and any pause has ended)"""
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 class HunterIOEnricher:
     """
     Enrich contacts without emails using Hunter.io Email Finder API.
@@ -45,6 +117,20 @@ class HunterIOEnricher:
         self.verify_emails = verify_emails
         self.score_threshold = score_threshold
         self.base_url = "https://api.hunter.io/v2"
+        # Keep-alive session for the sequential lookups (no TLS handshake per request). Transient
+        # 5xx responses are retried with backoff; 429 keeps its own 60s wait in find_email_via_hunter_io.
+        self.session = requests.Session()
+        self.session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False
+            )
+        ))
         self.stats = {
             'contacts_processed': 0,
             'emails_found': 0,
@@ -84,6 +170,32 @@ class HunterIOEnricher:
         except Exception:
             return None
     
+    def _email_from_finder_data(self, data: Dict, log_low_score: bool = True) -> Optional[Dict]:
+        """Pull the email out of an Email Finder 200 response if its score meets the threshold"""
+        if data.get('data') and data['data'].get('email'):
+            email_data = data['data']
+            score = email_data.get('score', 0)
+            
+            # Only return if score meets threshold
+            # Note: We return score for threshold checking, but only email is used/stored
+            if score >= self.score_threshold:
+                return {
+                    'email': email_data['email'],
+                    'score': score  # Only used for threshold check and logging, not stored
+                }
+            if log_low_score:
+                print(f"      {bold('[ENRICH]')} Email score too low ({score} < {self.score_threshold}): {email_data['email']}")
+        return None
+    
+    def _lookup_key(self, contact: Contact) -> Optional[tuple]:
+        """Email Finder request key for a contact, or None if it cannot be looked up"""
+        first_name = str(contact.first_name or '').strip().lower()
+        last_name = str(contact.last_name or '').strip().lower()
+        domain = self.extract_domain_from_url(contact.source_url)
+        if not first_name or not last_name or not domain:
+            return None
+        return (first_name, last_name, domain)
+    
     def find_email_via_hunter_io(
         self,
         first_name: str,
@@ -123,29 +235,11 @@ class HunterIOEnricher:
                 'api_key': self.api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             self.stats['api_calls'] += 1
             
             if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('data') and data['data'].get('email'):
-                    email_data = data['data']
-                    score = email_data.get('score', 0)
-                    
-                    # Only return if score meets threshold
-                    # Note: We return score for threshold checking, but only email is used/stored
-                    if score >= self.score_threshold:
-                        return {
-                            'email': email_data['email'],
-                            'score': score  # Only used for threshold check and logging, not stored
-                        }
-                    else:
-                        print(f"      {bold('[ENRICH]')} Email score too low ({score} < {self.score_threshold}): {email_data['email']}")
-                        return None
-                else:
-                    # Email not found
-                    return None
+                return self._email_from_finder_data(response.json())
                     
             elif response.status_code == 404:
                 # Email not found - this is normal, not an error
@@ -156,20 +250,10 @@ class HunterIOEnricher:
                 print(f"      {bold('[ENRICH]')} Rate limit exceeded, waiting 60 seconds...")
                 time.sleep(60)
                 # Retry once
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 self.stats['api_calls'] += 1
                 if response.status_code == 200:
-                    data = response.json()
-                    if data.get('data') and data['data'].get('email'):
-                        email_data = data['data']
-                        score = email_data.get('score', 0)
-                        # Only return if score meets threshold
-                        # Note: We return score for threshold checking, but only email is used/stored
-                        if score >= self.score_threshold:
-                            return {
-                                'email': email_data['email'],
-                                'score': score  # Only used for threshold check and logging, not stored
-                            }
+                    return self._email_from_finder_data(response.json(), log_low_score=False)
                 return None
                 
             elif response.status_code == 401:
@@ -191,34 +275,121 @@ class HunterIOEnricher:
             self.stats['errors'] += 1
             return None
     
-    def enrich_contact_objects(
+    async def _find_email_async(
         self,
-        contacts: List[Contact],
-        batch_size: int = 10,
-        delay_between_batches: float = 1.0
-    ) -> List[Contact]:
+        session: 'aiohttp.ClientSession',
+        limiter: AsyncTokenBucket,
+        first_name: str,
+        last_name: str,
+        domain: str
+    ) -> Optional[Dict]:
         """
-        Enrich Contact objects without emails using Hunter.io API.
+        aiohttp version of find_email_via_hunter_io (same return value and error handling).
+        Each request first takes a token from the shared limiter. A 429 pauses that limiter for
+        every lookup (HUNTER_429_PAUSE seconds) and the request is retried up to HUNTER_429_RETRIES times.
+        """
+        first_name = str(first_name or '').strip()
+        last_name = str(last_name or '').strip()
+        domain = str(domain or '').strip().lower()
         
-        Args:
-            contacts: List of Contact objects without emails
-            batch_size: Number of contacts to process per batch
-            delay_between_batches: Delay in seconds between batches
+        if not first_name or not last_name or not domain:
+            return None
         
-        Returns:
-            List of Contact objects with emails added where found
-            (Only returns contacts that successfully got emails - skips failed contacts)
-        """
-        print("\n" + "="*70)
-        print("STEP 12: EMAIL ENRICHMENT (Hunter.io)")
-        print("="*70)
+        url = f"{self.base_url}/email-finder"
+        params = {
+            'domain': domain,
+            'first_name': first_name,
+            'last_name': last_name,
+            'api_key': self.api_key
+        }
         
-        if not contacts:
-            print(f"  {bold('[STEP 12]')} No contacts to enrich")
-            return []
+        try:
+            for attempt in range(HUNTER_429_RETRIES + 1):
+                await limiter.acquire()
+                async with session.get(url, params=params) as response:
+                    self.stats['api_calls'] += 1
+                    
+                    if response.status == 200:
+                        return self._email_from_finder_data(await response.json(), log_low_score=(attempt == 0))
+                    if response.status == 404:
+                        # Email not found - this is normal, not an error
+                        return None
+                    if response.status == 429 and attempt < HUNTER_429_RETRIES:
+                        if limiter.pause(HUNTER_429_PAUSE):
+                            print(f"      {bold('[ENRICH]')} Rate limit exceeded, pausing all lookups for {HUNTER_429_PAUSE} seconds...")
+                    elif response.status == 429:
+                        print(f"      {bold('[ENRICH]')} Rate limit still exceeded after {HUNTER_429_RETRIES} retries, skipping")
+                        self.stats['errors'] += 1
+                        return None
+                    elif response.status == 401:
+                        print(f"      {bold('[ENRICH]')} Invalid Hunter.io API key")
+                        self.stats['errors'] += 1
+                        return None
+                    else:
+                        print(f"      {bold('[ENRICH]')} Hunter.io API error: {response.status}")
+                        self.stats['errors'] += 1
+                        return None
+                # Rate limited: the next acquire() waits out the shared pause before retrying
+            return None
+        except asyncio.TimeoutError:
+            print(f"      {bold('[ENRICH]')} Hunter.io API timeout")
+            self.stats['errors'] += 1
+            return None
+        except Exception as e:
+            print(f"      {bold('[ENRICH]')} Hunter.io API error: {str(e)}")
+            self.stats['errors'] += 1
+            return None
+    
+    async def enrich_async(self, contacts: List[Contact]) -> List[Contact]:
+        """
+        Look up all contacts concurrently over one aiohttp session.
+        Requests are paced by a token bucket (HUNTER_MAX_QPS) instead of fixed sleeps, with at most
+        HUNTER_MAX_CONCURRENCY in flight. Returns enriched contacts in input order.
+        """
+        limiter = AsyncTokenBucket(rate=HUNTER_MAX_QPS)
+        sem = asyncio.Semaphore(HUNTER_MAX_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=10)
         
-        print(f"  📧 Processing {len(contacts)} contacts without emails")
+        async def enrich_one(session: 'aiohttp.ClientSession', contact: Contact) -> Optional[Contact]:
+            if not contact.first_name or not contact.last_name:
+                print(f"    [ENRICH] Skipping: missing name")
+                return None
+            
+            domain = self.extract_domain_from_url(contact.source_url)
+            if not domain:
+                print(f"    [ENRICH] Skipping {contact.first_name} {contact.last_name}: invalid domain")
+                return None
+            
+            async with sem:
+                print(f"    🔍 Searching for: {contact.first_name} {contact.last_name} @ {domain}")
+                email_result = await self._find_email_async(
+                    session, limiter, contact.first_name, contact.last_name, domain
+                )
+            self.stats['contacts_processed'] += 1
+            
+            if not email_result:
+                print(f"      ✗ Not found - skipping contact ({contact.first_name} {contact.last_name})")
+                return None
+            
+            # Only extract email - ignore score and sources from Hunter.io
+            email = email_result['email']
+            print(f"      {bold('[ENRICH]')} Found: {email} (score: {email_result.get('score', 0)})")
+            # Update contact with ONLY the email field - no other Hunter.io data
+            contact.email = email
+            self.stats['emails_found'] += 1
+            return contact
         
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(*(enrich_one(session, contact) for contact in contacts))
+        return [contact for contact in results if contact is not None]
+    
+    def _enrich_sequential(
+        self,
+        contacts: List[Contact],
+        batch_size: int,
+        delay_between_batches: float
+    ) -> List[Contact]:
+        """Fallback when aiohttp is unavailable: one request at a time with fixed delays"""
         enriched_contacts = []
         total_batches = (len(contacts) + batch_size - 1) // batch_size
         
@@ -268,6 +439,40 @@ class HunterIOEnricher:
             if batch_idx + batch_size < len(contacts):
                 time.sleep(delay_between_batches)
         
+        return enriched_contacts
+    
+    def enrich_contact_objects(
+        self,
+        contacts: List[Contact],
+        batch_size: int = 10,
+        delay_between_batches: float = 1.0
+    ) -> List[Contact]:
+        """
+        Enrich Contact objects without emails using Hunter.io API.
+        With aiohttp installed all lookups run concurrently under a token-bucket rate limit
+        (batch_size and delay_between_batches only apply to the sequential fallback).
+        
+        Args:
+            contacts: List of Contact objects without emails
+            batch_size: Number of contacts to process per batch
+            delay_between_batches: Delay in seconds between batches
+        
+        Returns:
+            List of Contact objects with emails added where found
+            (Only returns contacts that successfully got emails - skips failed contacts)
+        """
+        print("\n" + "="*70)
+        print("STEP 12: EMAIL ENRICHMENT (Hunter.io)")
+        print("="*70)
+        
+        if not contacts:
+            print(f"  {bold('[STEP 12]')} No contacts to enrich")
+            return []
+        
+        print(f"  📧 Processing {len(contacts)} contacts without emails")
+        
+        enriched_contacts = self._enrich_by_lookup_key(contacts, batch_size, delay_between_batches)
+        
         # Print summary
         print(f"\n" + "="*70)
         print(f"EMAIL ENRICHMENT COMPLETE")
@@ -282,6 +487,39 @@ class HunterIOEnricher:
         
         return enriched_contacts
     
+    def _enrich_by_lookup_key(
+        self,
+        contacts: List[Contact],
+        batch_size: int,
+        delay_between_batches: float
+    ) -> List[Contact]:
+        """
+        Run the Hunter lookups for contacts (concurrently with aiohttp, else sequentially) and
+        return every contact that got an email.
+        """
+        # Hunter's answer depends only on (first name, last name, domain): look each key up once
+        # and copy the email to every contact that shares it
+        contacts_by_key = {}
+        for contact in contacts:
+            contacts_by_key.setdefault(self._lookup_key(contact), []).append(contact)
+        representatives = [group[0] for key, group in contacts_by_key.items() if key is not None]
+        if len(representatives) < len(contacts):
+            print(f"  {len(representatives)} unique lookups ({len(contacts) - len(representatives)} duplicate or unusable contacts not sent)")
+        
+        if HAS_AIOHTTP:
+            print(f"  Concurrent lookups: {HUNTER_MAX_CONCURRENCY} in flight, {HUNTER_MAX_QPS:g} requests/sec")
+            enriched_representatives = asyncio.run(self.enrich_async(representatives))
+        else:
+            enriched_representatives = self._enrich_sequential(representatives, batch_size, delay_between_batches)
+        
+        enriched_contacts = []
+        for representative in enriched_representatives:
+            group = contacts_by_key[self._lookup_key(representative)]
+            for contact in group[1:]:
+                contact.email = representative.email
+            enriched_contacts.extend(group)
+        return enriched_contacts
+    
     def enrich_contacts_with_hunter_io(
         self,
         csv_path: str,
@@ -291,6 +529,8 @@ class HunterIOEnricher:
     ) -> str:
         """
         Enrich contacts without emails using Hunter.io API.
+        Lookups go through the same concurrent path as enrich_contact_objects
+        (batch_size and delay_between_batches only apply to the sequential fallback).
         
         Args:
             csv_path: Path to final CSV from Step 11
@@ -313,8 +553,11 @@ class HunterIOEnricher:
             return csv_path
         
         try:
-            # Read CSV
-            df = pd.read_csv(csv_path)
+            # Read CSV (Arrow string columns with pyarrow; blanks become '' so rows never hold pd.NA)
+            if HAS_PYARROW:
+                df = pd.read_csv(csv_path, engine='pyarrow', dtype='string[pyarrow]').fillna('')
+            else:
+                df = pd.read_csv(csv_path)
             print(f"  {bold('[STEP 12]')} Loaded {len(df)} contacts from CSV")
             
             # Identify contacts without emails
@@ -329,18 +572,14 @@ class HunterIOEnricher:
                 print(f"  {bold('[STEP 12]')} No email column found in CSV, skipping enrichment")
                 return csv_path
             
-            # Find contacts without emails
-            contacts_without_emails = df[
-                df[email_col].isna() | 
-                (df[email_col] == '') | 
-                (df[email_col].str.strip() == '')
-            ].copy()
+            # Find contacts without emails (one pass over the column; only their index is kept)
+            missing_idx = df.index[df[email_col].fillna('').astype(str).str.strip().eq('')]
             
-            if len(contacts_without_emails) == 0:
+            if len(missing_idx) == 0:
                 print(f"  {bold('[STEP 12]')} All contacts already have emails, no enrichment needed")
                 return csv_path
             
-            print(f"  📧 Found {len(contacts_without_emails)} contacts without emails")
+            print(f"  📧 Found {len(missing_idx)} contacts without emails")
             
             # Extract domain from source_url
             source_url_col = None
@@ -353,59 +592,35 @@ class HunterIOEnricher:
                 print(f"  {bold('[STEP 12]')} No source_url column found, cannot extract domains")
                 return csv_path
             
-            # Process contacts in batches
-            enriched_count = 0
-            total_batches = (len(contacts_without_emails) + batch_size - 1) // batch_size
-            
-            for batch_idx in range(0, len(contacts_without_emails), batch_size):
-                batch = contacts_without_emails.iloc[batch_idx:batch_idx + batch_size]
-                batch_num = (batch_idx // batch_size) + 1
-                
-                print(f"\n  Processing batch {batch_num}/{total_batches} ({len(batch)} contacts)...")
-                
-                for idx, row in batch.iterrows():
-                    first_name = str(row.get('first_name', '') or row.get('First Name', '')).strip()
-                    last_name = str(row.get('last_name', '') or row.get('Last Name', '')).strip()
-                    source_url = str(row.get(source_url_col, '')).strip()
-                    
-                    if not first_name or not last_name:
-                        continue
-                    
-                    domain = self.extract_domain_from_url(source_url)
-                    if not domain:
-                        print(f"    [ENRICH] Skipping {first_name} {last_name}: invalid domain")
-                        continue
-                    
-                    print(f"    🔍 Searching for: {first_name} {last_name} @ {domain}")
-                    
-                    email_result = self.find_email_via_hunter_io(first_name, last_name, domain)
-                    self.stats['contacts_processed'] += 1
-                    
-                    if email_result:
-                        # Only extract email - ignore score and sources from Hunter.io
-                        email = email_result['email']
-                        score = email_result.get('score', 0)  # Only for logging
-                        print(f"      {bold('[ENRICH]')} Found: {email} (score: {score})")
-                        
-                        # Update DataFrame with ONLY the email - no other Hunter.io data
-                        df.loc[idx, email_col] = email
-                        enriched_count += 1
-                        self.stats['emails_found'] += 1
-                        
-                        # Optional: Verify email (uses 0.5 credits)
-                        if self.verify_emails:
-                            # Email verification would go here if needed
-                            # For now, we'll skip to save credits
-                            pass
-                    else:
-                        print(f"      ✗ Not found")
-                    
-                    # Small delay between requests to respect rate limits
-                    time.sleep(0.5)
+            # Same lookup path as enrich_contact_objects: concurrent with aiohttp, one request per
+            # distinct name + domain; found emails are written back to their rows afterwards
+            # Columns are pulled out as arrays once; the loop never boxes a row into a Series, and
+            # only the name/source columns of the missing rows are sliced rather than whole rows
+            lookup_cols = [
+                col for col in dict.fromkeys(['first_name', 'First Name', 'last_name', 'Last Name', source_url_col])
+                if col in df.columns
+            ]
+            contacts_without_emails = df.loc[missing_idx, lookup_cols]
+            first_names = _first_nonempty_text(contacts_without_emails, ['first_name', 'First Name']).to_numpy()
+            last_names = _first_nonempty_text(contacts_without_emails, ['last_name', 'Last Name']).to_numpy()
+            source_urls = _first_nonempty_text(contacts_without_emails, [source_url_col]).to_numpy()
+            contacts = []
+            row_indices = []
+            for idx, first_name, last_name, source_url in zip(contacts_without_emails.index, first_names, last_names, source_urls):
+                if not first_name or not last_name:
+                    continue
                 
-                # Delay between batches
-                if batch_idx + batch_size < len(contacts_without_emails):
-                    time.sleep(delay_between_batches)
+                contacts.append(Contact(first_name=first_name, last_name=last_name, source_url=source_url))
+                row_indices.append(idx)
+            
+            row_by_contact = {id(contact): idx for contact, idx in zip(contacts, row_indices)}
+            enriched_contacts = self._enrich_by_lookup_key(contacts, batch_size, delay_between_batches)
+            if enriched_contacts:
+                # Update DataFrame with ONLY the email - no other Hunter.io data (one batched write)
+                df.loc[[row_by_contact[id(contact)] for contact in enriched_contacts], email_col] = [
+                    contact.email for contact in enriched_contacts
+                ]
+            enriched_count = len(enriched_contacts)
             
             # Save enriched CSV
             df.to_csv(output_csv_path, index=False)
@@ -10,6 +10,7 @@ Input:
 Output: Final cleaned CSV with all contacts
 """
 
+import numpy as np
 import pandas as pd
 import re
 from typing import List, Dict, Set, Optional
@@ -19,10 +20,27 @@ import shutil
 from urllib.parse import urlparse
 from assets.shared.models import Contact
 
+# Optional: pyarrow parses the input CSV into contiguous Arrow string columns (falls back to the C parser)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # ANSI escape codes for bold text
 BOLD = '\033[1m'
 RESET = '\033[0m'
 
+# Column order of Contact.to_dict() and of the final CSV
+CONTACT_COLUMNS = ['first_name', 'last_name', 'title', 'email', 'phone', 'school_name', 'source_url']
+
+# Everything clean_email() would drop character by character: non-ASCII (zero-width spaces,
+# BOMs, mis-encoded artifacts) and non-printable ASCII. Kept as a pattern string so Arrow-backed
+# string columns can run it natively.
+_NON_PRINTABLE_ASCII_PATTERN = r'[^\x20-\x7E]'
+# Deletion table for the ASCII control characters clean_email() drops (non-ASCII goes via encode)
+_ASCII_CONTROL_CHARS = str.maketrans('', '', ''.join(map(chr, [*range(32), 127])))
+
 def bold(text: str) -> str:
     """Make text bold in terminal output"""
     return f"{BOLD}{text}{RESET}"
@@ -44,13 +62,26 @@ def _extract_domain_from_url(url: str) -> Optional[str]:
         return None
 
 
+def _nonempty_mask(values: pd.Series) -> pd.Series:
+    """True where a value is present and not just whitespace (one strip pass over the column)"""
+    return values.fillna('').astype(str).str.strip().ne('')
+
+
+def _map_unique(values: pd.Series, transform) -> pd.Series:
+    """Apply transform (Index -> Index) to the distinct values of a string Series only, then expand back to every row"""
+    codes, uniques = pd.factorize(values)
+    return pd.Series(pd.Index(transform(pd.Index(uniques))).take(codes), index=values.index)
+
+
 class FinalCompiler:
     def __init__(self):
         # Email validation pattern
         self.email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        self._email_re = re.compile(self.email_pattern)
         
         # Phone formatting pattern
         self.phone_pattern = r'(\d{3})[-.]?(\d{3})[-.]?(\d{4})'
+        self._nondigit_re = re.compile(r'\D')
         
         # Generic/invalid emails to filter
         self.invalid_emails = [
@@ -58,6 +89,7 @@ class FinalCompiler:
             'noreply@', 'no-reply@', 'hello@', 'support@',
             '@example'  # example.com, example.org, example.net, etc.
         ]
+        self._generic_email_pattern = '|'.join(map(re.escape, self.invalid_emails))
         
         # Generic text patterns that should NOT be names (per meeting notes)
         self.generic_name_patterns = [
@@ -74,6 +106,12 @@ class FinalCompiler:
             'john example', 'jane example', 'test name', 'sample name'
         ]
         
+        # Name checks, compiled once instead of per row; placeholder and generic-text substrings
+        # share one alternation
+        self._title_prefix_re = re.compile(r'^(mr\.|mrs\.|ms\.|dr\.|miss|father|fr\.|rev\.)\s+', re.IGNORECASE)
+        self._letter_re = re.compile(r'[a-zA-Z]')
+        self._bad_name_re = re.compile('|'.join(map(re.escape, self.placeholder_names + self.generic_name_patterns)))
+        
         # NO FILTERING - LLM handles all filtering
         # Removed exclude_keywords - not used anymore
     
@@ -92,47 +130,9 @@ class FinalCompiler:
         
         email = str(email).strip()
         
-        # Handle UTF-8 encoding artifacts like "â€‹" which appears when zero-width space is mis-encoded
-        # Try to decode and re-encode to fix encoding issues
-        try:
-            # If the string contains "â€‹" (common mis-encoding of zero-width space)
-            if 'â€‹' in email:
-                # Try to fix by removing the problematic sequence
-                email = email.replace('â€‹', '')
-            # Also try removing if it's the actual zero-width space character
-            email = email.lstrip('\u200B\u200C\u200D\uFEFF')  # Zero-width space, zero-width non-joiner, etc.
-        except:
-            pass
-        
-        # Remove UTF-8 BOM and other encoding artifacts
-        if email.startswith('\ufeff'):
-            email = email[1:]
-        
-        # Remove any other common encoding artifacts at the start
-        # Remove leading non-printable characters
-        while email and not email[0].isprintable() and email[0] != '@':
-            email = email[1:]
-        
-        # Remove any leading non-ASCII characters that aren't valid email characters
-        # Keep only printable ASCII characters and valid email characters
-        cleaned = ''
-        found_at = False
-        for char in email:
-            # Always keep @ symbol
-            if char == '@':
-                found_at = True
-                cleaned += char
-            # Allow ASCII printable characters and common email characters
-            elif ord(char) < 128 and (char.isprintable() or char in '._-+'):
-                cleaned += char
-            # Skip other non-ASCII characters (but only before @)
-            # After @, we might have internationalized domain names, but for now we'll be strict
-            elif found_at and ord(char) < 128:
-                # After @, allow some non-ASCII if it's part of a valid domain
-                # But for safety, we'll be conservative
-                pass
-        
-        email = cleaned.strip()
+        # Keep only printable ASCII: dropping non-ASCII removes zero-width spaces, BOMs and
+        # mis-encoded artifacts like "â€‹"; the translate table drops ASCII control characters
+        email = email.encode('ascii', 'ignore').decode('ascii').translate(_ASCII_CONTROL_CHARS).strip()
         
         # Basic email format validation - must contain @ and have valid structure
         # This filters out things like "Bobcat Heavy Civil" or "ISAIAH'S PLACE | ASL & EQUINE ASSISTED LEARNING"
@@ -160,7 +160,7 @@ class FinalCompiler:
             return ''  # Emails shouldn't have spaces
         
         # Final regex validation for proper email format
-        if not re.match(self.email_pattern, email):
+        if not self._email_re.match(email):
             return ''
         
         return email.lower()
@@ -183,6 +183,21 @@ class FinalCompiler:
         
         return True
     
+    def _clean_email_column(self, emails: pd.Series) -> pd.Series:
+        """
+        Column-wise clean_email(): blank/missing values pass through unchanged, the rest
+        are cleaned and lowercased ('' if not a valid address).
+        """
+        present = _nonempty_mask(emails)
+        cleaned = emails[present].astype(str).str.replace(_NON_PRINTABLE_ASCII_PATTERN, '', regex=True).str.strip()
+        # email_pattern already implies the single-@, non-empty local part, dotted domain and no-space checks
+        cleaned = cleaned.where(cleaned.str.match(self.email_pattern), '').str.lower()
+        return emails.where(~present, cleaned)
+
+    def _email_valid_mask(self, emails: pd.Series) -> pd.Series:
+        """Validity of already-cleaned emails: blank is valid (kept), generic addresses are not"""
+        return ~(_nonempty_mask(emails) & emails.fillna('').astype(str).str.contains(self._generic_email_pattern))
+    
     # Removed is_admin_role() - NO FILTERING in Python, LLM handles all filtering
     
     def format_phone(self, phone: str) -> str:
@@ -193,7 +208,7 @@ class FinalCompiler:
         phone = str(phone).strip()
         
         # Extract digits
-        digits = re.sub(r'\D', '', phone)
+        digits = self._nondigit_re.sub('', phone)
         
         # Format if 10 digits
         if len(digits) == 10:
@@ -203,6 +218,17 @@ class FinalCompiler:
         else:
             return phone  # Return as-is if can't format
     
+    def _format_phone_column(self, phones: pd.Series) -> pd.Series:
+        """Column-wise format_phone(): same 10/11-digit formatting, other values stripped and kept as-is"""
+        text = phones.fillna('').astype(str).str.strip()
+        digits = text.str.replace(self._nondigit_re.pattern, '', regex=True)
+        length = digits.str.len()
+        ten = length.eq(10)
+        eleven = length.eq(11) & digits.str[:1].eq('1')
+        national = digits.where(ten, digits.str[1:])
+        formatted = '(' + national.str[:3] + ') ' + national.str[3:6] + '-' + national.str[6:]
+        return formatted.where(ten | eleven, text)
+    
     def is_valid_name(self, name: str) -> bool:
         """
         Check if name is valid (not generic page text or placeholder names)
@@ -215,15 +241,9 @@ class FinalCompiler:
         
         name_lower = str(name).strip().lower()
         
-        # Check for placeholder/fake names (exact match or contains)
-        for placeholder in self.placeholder_names:
-            if placeholder == name_lower or placeholder in name_lower:
-                return False
-        
-        # Check for generic text patterns
-        for pattern in self.generic_name_patterns:
-            if pattern in name_lower:
-                return False
+        # Check for placeholder/fake names and generic text patterns (contains)
+        if self._bad_name_re.search(name_lower):
+            return False
         
         # Names should typically be 2-4 words
         parts = name.split()
@@ -231,11 +251,21 @@ class FinalCompiler:
             return False
         
         # Check if it looks like a person name (has letters, not just numbers/symbols)
-        if not re.search(r'[a-zA-Z]', name):
+        if not self._letter_re.search(name):
             return False
         
         return True
     
+    def _name_valid_mask(self, names: pd.Series) -> pd.Series:
+        """Column-wise is_valid_name(): 1-5 words, at least one letter, no placeholder/generic text"""
+        text = names.fillna('').astype(str)
+        word_count = text.str.count(r'\S+')
+        return (
+            word_count.between(1, 5)
+            & text.str.contains(self._letter_re.pattern)
+            & ~text.str.strip().str.lower().str.contains(self._bad_name_re.pattern)
+        )
+    
     def clean_name(self, name: str) -> tuple:
         """
         Split name into first and last name
@@ -249,7 +279,7 @@ class FinalCompiler:
         name = str(name).strip()
         
         # Remove titles
-        name = re.sub(r'^(mr\.|mrs\.|ms\.|dr\.|miss|father|fr\.|rev\.)\s+', '', name, flags=re.IGNORECASE)
+        name = self._title_prefix_re.sub('', name)
         
         parts = name.split()
         
@@ -263,6 +293,16 @@ class FinalCompiler:
             # If more than 2 parts, assume first is first name, rest is last name
             return (parts[0], ' '.join(parts[1:]))
     
+    def _split_name_column(self, names: pd.Series) -> pd.DataFrame:
+        """Column-wise clean_name(): first_name/last_name columns, '' where missing"""
+        text = names.fillna('').astype(str).str.strip().str.replace(self._title_prefix_re.pattern, '', regex=True, case=False)
+        parts = text.str.split(n=1)
+        return pd.DataFrame({
+            'first_name': parts.str[0].fillna(''),
+            # clean_name joins the remaining words with single spaces
+            'last_name': parts.str[1].fillna('').str.replace(r'\s+', ' ', regex=True),
+        }, index=names.index)
+    
     def _fuzzy_name_match(self, name1: str, name2: str, threshold: float = 0.85) -> bool:
         """
         Check if two names are similar using fuzzy matching.
@@ -317,54 +357,44 @@ class FinalCompiler:
         if len(df) == 0:
             return df
         
-        df = df.copy()
-        if 'source_url' not in df.columns and 'Source URL' in df.columns:
-            df['source_url'] = df['Source URL'].fillna('').astype(str)
         if 'source_url' not in df.columns:
-            df['source_url'] = ''
-        df['first_name_n'] = df['first_name'].fillna('').astype(str).str.lower().str.strip()
-        df['last_name_n'] = df['last_name'].fillna('').astype(str).str.lower().str.strip()
-        df['name_n'] = (df['first_name_n'] + ' ' + df['last_name_n']).str.strip()
-        df['school_name_n'] = df['school_name'].fillna('').astype(str).str.lower().str.strip()
-        df['source_url_n'] = df['source_url'].fillna('').astype(str)
-        df['domain'] = df['source_url_n'].apply(_extract_domain_from_url)
+            df = df.assign(source_url=df['Source URL'].fillna('').astype(str) if 'Source URL' in df.columns else '')
+        first_name_n = df['first_name'].fillna('').astype(str).str.lower().str.strip()
+        last_name_n = df['last_name'].fillna('').astype(str).str.lower().str.strip()
+        name_n = (first_name_n + ' ' + last_name_n).str.strip()
+        # School names and source URLs repeat heavily (one school, many contacts): normalize each
+        # distinct value once and broadcast it back through the factorize codes
+        school_name_n = _map_unique(df['school_name'].fillna('').astype(str), lambda names: names.str.lower().str.strip())
+        domain = _map_unique(df['source_url'].fillna('').astype(str), lambda urls: urls.map(_extract_domain_from_url))
+
+        # One keep-mask over the original frame instead of split/sort/concat copies; the first
+        # occurrence of each duplicate wins
+        keep = np.ones(len(df), dtype=bool)
 
         # Deduplicate by email when present (normalize email first: lowercase, strip)
         if 'email' in df.columns:
-            df['email_normalized'] = df['email'].fillna('').astype(str).str.strip().str.lower()
-            has_email = df['email_normalized'] != ''
-            df_email = df[has_email].copy().sort_values(by=['email_normalized']).drop_duplicates(subset=['email_normalized'], keep='first')
-            df_email = df_email.drop(columns=['email_normalized'], errors='ignore')
-            df_no_email = df[~has_email].copy().drop(columns=['email_normalized'], errors='ignore')
+            email_n = df['email'].fillna('').astype(str).str.strip().str.lower()
+            has_email = email_n.ne('')
+            keep &= ~(has_email & email_n.duplicated()).to_numpy()
         else:
-            df_email = pd.DataFrame()
-            df_no_email = df.copy()
+            email_n = pd.Series('', index=df.index)
+            has_email = pd.Series(False, index=df.index)
 
         # For no-email: dedupe by name + domain (or name + school_name if no domain)
-        if len(df_no_email) > 0:
-            def _dedupe_key(r):
-                d = r['domain']
-                s = r['school_name_n']
-                use_d = not (d is None or (isinstance(d, float) and pd.isna(d))) and str(d).strip()
-                return r['name_n'] + '|' + (d if use_d else s)
-            dedupe_keys = df_no_email.apply(_dedupe_key, axis=1)
-            # Ensure we have a Series, not DataFrame
-            if isinstance(dedupe_keys, pd.DataFrame):
-                dedupe_keys = dedupe_keys.iloc[:, 0]
-            df_no_email = df_no_email.copy()
-            df_no_email.loc[:, 'dedupe_key'] = dedupe_keys.values if hasattr(dedupe_keys, 'values') else dedupe_keys
-            df_no_email = df_no_email.sort_values(by=['dedupe_key']).drop_duplicates(subset=['dedupe_key'], keep='first')
-
-        drop_cols = ['first_name_n', 'last_name_n', 'name_n', 'school_name_n', 'source_url_n', 'domain', 'dedupe_key']
-        df_no_email = df_no_email.drop(columns=[c for c in drop_cols if c in df_no_email.columns], errors='ignore')
-
-        if len(df_email) > 0:
-            df_email = df_email.drop(columns=[c for c in drop_cols if c in df_email.columns], errors='ignore')
-            out = pd.concat([df_email, df_no_email], ignore_index=True)
-        else:
-            out = df_no_email
+        # Key is built column-wise (no per-row apply); duplicates are found with one hashed duplicated() pass
+        domain = domain.fillna('').astype(str)
+        domain_or_school = domain.where(domain.str.strip() != '', school_name_n)
+        dedupe_key = (name_n + '|' + domain_or_school).mask(has_email)
+        keep &= (has_email | ~dedupe_key.duplicated()).to_numpy()
 
-        return out.reset_index(drop=True)
+        # Deterministic output order: email rows sorted by email, then no-email rows sorted by key
+        # (survivor keys are unique, so one two-column sort reproduces the per-group sorts)
+        order = pd.DataFrame({
+            'no_email': (~has_email).to_numpy(),
+            'key': email_n.where(has_email, dedupe_key).to_numpy(),
+        })[keep]
+        order = order.sort_values(by=['no_email', 'key'], kind='stable').index
+        return df.iloc[order].reset_index(drop=True)
 
     def deduplicate_contacts_only(
         self,
@@ -416,6 +446,31 @@ class FinalCompiler:
             state: State name for filename generation
             already_deduplicated: If True, skip deduplication (e.g. after deduplicate_contacts_only + enrich)
         """
+        # Combine all contacts
+        all_contacts = contacts_with_emails + contacts_enriched
+        print(f"{bold('[STEP 13]')} Compiling: {len(contacts_with_emails)} with emails, {len(contacts_enriched)} enriched, {len(all_contacts)} total")
+        
+        df = pd.DataFrame([contact.to_dict() for contact in all_contacts], columns=CONTACT_COLUMNS)
+        return self.compile_frame_to_csv(df, output_csv, state, already_deduplicated)
+
+    def compile_frame_to_csv(
+        self,
+        df: pd.DataFrame,
+        output_csv: str = None,
+        state: str = None,
+        already_deduplicated: bool = False
+    ):
+        """
+        Compile a contacts DataFrame (CONTACT_COLUMNS) into final CSV.
+        Same cleaning, validation and deduplication as compile_contacts_to_csv, without
+        building Contact objects first.
+
+        Args:
+            df: Contacts with emails and enriched contacts, one row per contact
+            output_csv: Optional output CSV filename
+            state: State name for filename generation
+            already_deduplicated: If True, skip deduplication (only the safety pass runs)
+        """
         # Generate output filename with state name if not provided
         if not output_csv:
             state_name = (state or 'Texas').title()
@@ -424,43 +479,34 @@ class FinalCompiler:
             state_name = state.title()
             output_csv = f"{state_name} leads.csv"
         
-        # Combine all contacts
-        all_contacts = contacts_with_emails + contacts_enriched
-        print(f"{bold('[STEP 13]')} Compiling: {len(contacts_with_emails)} with emails, {len(contacts_enriched)} enriched, {len(all_contacts)} total")
-        
-        if not all_contacts:
+        if len(df) == 0:
             print(f"  {bold('[STEP 13]')} No contacts to compile")
             # Create empty CSV with headers
-            empty_df = pd.DataFrame(columns=['first_name', 'last_name', 'title', 'email', 'phone', 
-                                            'school_name', 'source_url'])
+            empty_df = pd.DataFrame(columns=CONTACT_COLUMNS)
             empty_df.to_csv(output_csv, index=False)
             return output_csv
         
-        # Convert Contact objects to DataFrame
-        contact_dicts = [contact.to_dict() for contact in all_contacts]
-        df = pd.DataFrame(contact_dicts)
-        
         print(f"\nCleaning and validating...")
         
         # Clean emails
         if 'email' in df.columns:
-            df['email'] = df['email'].apply(lambda x: self.clean_email(x) if (x and not pd.isna(x) and str(x).strip()) else x)
+            df['email'] = self._clean_email_column(df['email'])
         
         # Validate emails (keep empty emails)
         if 'email' in df.columns:
-            df['email_valid'] = df['email'].apply(lambda x: True if (pd.isna(x) or str(x).strip() == '') else self.is_valid_email(x))
+            df['email_valid'] = self._email_valid_mask(df['email'])
             df = df[df['email_valid'] == True]
             print(f"  After email validation: {len(df)}")
         
         # Validate names
         df['name'] = (df['first_name'].fillna('') + ' ' + df['last_name'].fillna('')).str.strip()
-        df['name_valid'] = df['name'].apply(self.is_valid_name)
+        df['name_valid'] = self._name_valid_mask(df['name'])
         df = df[df['name_valid'] == True]
         print(f"  After name validation: {len(df)}")
         
         # Format phones
         if 'phone' in df.columns:
-            df['phone'] = df['phone'].apply(self.format_phone)
+            df['phone'] = self._format_phone_column(df['phone'])
 
         if not already_deduplicated:
             print(f"\nBefore deduplication: {len(df)}")
@@ -491,8 +537,9 @@ class FinalCompiler:
         final_df.to_csv(output_csv, index=False)
         
         # Count contacts with and without emails
-        df_with_emails = final_df[final_df['email'].notna() & (final_df['email'] != '') & (final_df['email'].str.strip() != '')]
-        df_without_emails = final_df[final_df['email'].isna() | (final_df['email'] == '') | (final_df['email'].str.strip() == '')]
+        has_email = _nonempty_mask(final_df['email'])
+        df_with_emails = final_df[has_email]
+        df_without_emails = final_df[~has_email]
         
         print(f"{bold('[STEP 13]')} Saved {len(final_df)} contacts ({len(df_with_emails)} with emails, {len(df_without_emails)} without)")
         
@@ -526,23 +573,23 @@ class FinalCompiler:
                 state_name = state.title()
                 output_csv = f"{state_name} leads.csv"
         
-        # Read parsed contacts
-        df = pd.read_csv(input_csv)
+        # Read parsed contacts. With pyarrow every column is an Arrow string column (no per-cell
+        # PyObjects for the .str passes below); blanks become '' so the scalar helpers never see NA.
+        if HAS_PYARROW:
+            df = pd.read_csv(input_csv, engine='pyarrow', dtype='string[pyarrow]').fillna('')
+        else:
+            df = pd.read_csv(input_csv)
         
         print(f"Initial contacts: {len(df)}")
         
         # Handle different input formats - check if we have 'name' column or 'first_name'/'last_name' columns
         if 'name' in df.columns and ('first_name' not in df.columns or 'last_name' not in df.columns):
             # Old format: split 'name' into first_name and last_name
-            df[['first_name', 'last_name']] = df['name'].apply(
-                lambda x: pd.Series(self.clean_name(x))
-            )
+            df[['first_name', 'last_name']] = self._split_name_column(df['name'])
         elif 'first_name' not in df.columns or 'last_name' not in df.columns:
             # Missing name columns - try to create them
             if 'name' in df.columns:
-                df[['first_name', 'last_name']] = df['name'].apply(
-                    lambda x: pd.Series(self.clean_name(x))
-                )
+                df[['first_name', 'last_name']] = self._split_name_column(df['name'])
             else:
                 # No name column at all - create empty ones
                 df['first_name'] = ''
@@ -559,12 +606,12 @@ class FinalCompiler:
         print("\nCleaning and validating...")
         
         # First, clean all emails to remove special characters and invalid text
-        df['email'] = df['email'].apply(lambda x: self.clean_email(x) if (x and not pd.isna(x) and str(x).strip()) else x)
+        df['email'] = self._clean_email_column(df['email'])
         
         # Validate emails (only format validation, don't filter empty emails)
         # Empty emails are valid - we want to keep contacts without emails
         # Only validate format if email is present
-        df['email_valid'] = df['email'].apply(lambda x: True if (pd.isna(x) or str(x).strip() == '') else self.is_valid_email(x))
+        df['email_valid'] = self._email_valid_mask(df['email'])
         df = df[df['email_valid'] == True]
         print(f"  After email validation: {len(df)} (empty emails kept)")
         
@@ -573,7 +620,7 @@ class FinalCompiler:
         if 'name' not in df.columns:
             # Create combined name for validation
             df['name'] = (df['first_name'].fillna('') + ' ' + df['last_name'].fillna('')).str.strip()
-        df['name_valid'] = df['name'].apply(self.is_valid_name)
+        df['name_valid'] = self._name_valid_mask(df['name'])
         df = df[df['name_valid'] == True]
         print(f"  After name validation (removed generic text): {len(df)}")
         
@@ -590,7 +637,7 @@ class FinalCompiler:
             return
         
         # Format phones
-        df['phone'] = df['phone'].apply(self.format_phone)
+        df['phone'] = self._format_phone_column(df['phone'])
         
         # Deduplicate
         print(f"\nBefore deduplication: {len(df)}")
@@ -614,8 +661,9 @@ class FinalCompiler:
         final_df['Notes'] = ''
         
         # Count contacts with and without emails for summary
-        df_with_emails = final_df[final_df['Email'].notna() & (final_df['Email'] != '') & (final_df['Email'].str.strip() != '')].copy()
-        df_without_emails = final_df[final_df['Email'].isna() | (final_df['Email'] == '') | (final_df['Email'].str.strip() == '')].copy()
+        has_email = _nonempty_mask(final_df['Email'])
+        df_with_emails = final_df[has_email]
+        df_without_emails = final_df[~has_email]
         
         # Save all contacts to single file
         if not final_df.empty:
@@ -628,11 +676,14 @@ class FinalCompiler:
             self._copy_to_downloads(output_csv)
             print(f"{bold('[STEP 13]')} No contacts found")
         
-        # Print summary (using combined data)
-        self._print_summary(final_df, output_csv, df_with_emails, df_without_emails)
+        # Print summary (using combined data); school/title counts are shared with the quality report
+        school_counts, title_counts = self._compute_report_aggregates(final_df)
+        self._print_summary(final_df, output_csv, df_with_emails, df_without_emails,
+                            school_counts=school_counts, title_counts=title_counts)
         
         # Create quality report
-        self._create_quality_report(final_df, output_csv.replace('.csv', '_quality_report.txt'))
+        self._create_quality_report(final_df, output_csv.replace('.csv', '_quality_report.txt'),
+                                    school_counts=school_counts, title_counts=title_counts)
     
     def _copy_to_downloads(self, file_path: str):
         """Copy the final CSV to the user's Downloads folder"""
@@ -648,42 +699,59 @@ class FinalCompiler:
         except Exception as e:
             print(f"  WARNING: Could not copy file to Downloads: {e}")
     
-    def _print_summary(self, df: pd.DataFrame, output_file: str, df_with_emails: pd.DataFrame = None, df_without_emails: pd.DataFrame = None):
-        """Print final summary statistics"""
+    def _compute_report_aggregates(self, df: pd.DataFrame) -> tuple:
+        """Count contacts per school (most first) and per title, for _print_summary and _create_quality_report"""
+        school_counts = df.groupby('School Name', sort=False).size().sort_values(ascending=False)
+        title_counts = df['Title'].value_counts()
+        return school_counts, title_counts
+    
+    def _print_summary(self, df: pd.DataFrame, output_file: str, df_with_emails: pd.DataFrame = None, df_without_emails: pd.DataFrame = None,
+                       school_counts: pd.Series = None, title_counts: pd.Series = None):
+        """Print final summary statistics (school/title counts are computed here unless passed in)"""
+        if school_counts is None or title_counts is None:
+            school_counts, title_counts = self._compute_report_aggregates(df)
         print("\n" + "="*70)
         print("FINAL CSV COMPILATION COMPLETE")
         print("="*70)
+        # Completeness of every summary column in one pass over a single array
+        completeness_cols = ['First Name', 'Last Name', 'Email', 'Phone']
+        complete = dict(zip(completeness_cols, (df[completeness_cols].to_numpy() != '').sum(axis=0)))
         print(f"Total validated contacts: {len(df)}")
-        print(f"  - With emails: {len(df_with_emails) if df_with_emails is not None else df[df['Email'].ne('')].shape[0]}")
-        print(f"  - Without emails: {len(df_without_emails) if df_without_emails is not None else df[df['Email'] == ''].shape[0]}")
-        print(f"Unique schools: {df['School Name'].nunique()}")
+        print(f"  - With emails: {len(df_with_emails) if df_with_emails is not None else complete['Email']}")
+        print(f"  - Without emails: {len(df_without_emails) if df_without_emails is not None else len(df) - complete['Email']}")
+        print(f"Unique schools: {len(school_counts)}")
         print(f"\nData completeness:")
-        print(f"  First Name: {df['First Name'].ne('').sum()} ({df['First Name'].ne('').sum()/len(df)*100:.1f}%)")
-        print(f"  Last Name: {df['Last Name'].ne('').sum()} ({df['Last Name'].ne('').sum()/len(df)*100:.1f}%)")
-        print(f"  Email: {df['Email'].ne('').sum()} ({df['Email'].ne('').sum()/len(df)*100:.1f}%)")
-        print(f"  Phone: {df['Phone'].ne('').sum()} ({df['Phone'].ne('').sum()/len(df)*100:.1f}%)")
-        print(f"\nConfidence scores:")
-        print(f"  High (80-100): {len(df[df['Confidence Score'] >= 80])}")
-        print(f"  Medium (60-79): {len(df[(df['Confidence Score'] >= 60) & (df['Confidence Score'] < 80)])}")
-        print(f"  Low (0-59): {len(df[df['Confidence Score'] < 60])}")
-        print(f"\nAverage confidence: {df['Confidence Score'].mean():.1f}")
+        for col in completeness_cols:
+            print(f"  {col}: {complete[col]} ({complete[col]/len(df)*100:.1f}%)")
+        if 'Confidence Score' in df.columns:
+            # Low/Medium/High bucket of every score from one searchsorted + bincount
+            scores = df['Confidence Score'].dropna().to_numpy()
+            low, medium, high = np.bincount(np.searchsorted([60, 80], scores, side='right'), minlength=3)
+            print(f"\nConfidence scores:")
+            print(f"  High (80-100): {high}")
+            print(f"  Medium (60-79): {medium}")
+            print(f"  Low (0-59): {low}")
+            print(f"\nAverage confidence: {df['Confidence Score'].mean():.1f}")
         print(f"\nOutput file: {output_file}")
         print("="*70)
         
         # Show top schools
         print("\nTop 10 schools by contacts:")
-        top_schools = df.groupby('School Name').size().sort_values(ascending=False).head(10)
+        top_schools = school_counts.head(10)
         for school, count in top_schools.items():
             print(f"  {school[:40]:40} | {count} contacts")
         
         # Show title distribution
         print("\nTop 10 titles:")
-        title_counts = df['Title'].value_counts().head(10)
-        for title, count in title_counts.items():
+        top_titles = title_counts.head(10)
+        for title, count in top_titles.items():
             print(f"  {title[:40]:40} | {count}")
     
-    def _create_quality_report(self, df: pd.DataFrame, report_file: str):
-        """Create detailed quality report"""
+    def _create_quality_report(self, df: pd.DataFrame, report_file: str,
+                               school_counts: pd.Series = None, title_counts: pd.Series = None):
+        """Create detailed quality report (school/title counts are computed here unless passed in)"""
+        if school_counts is None or title_counts is None:
+            school_counts, title_counts = self._compute_report_aggregates(df)
         with open(report_file, 'w') as f:
             f.write("="*70 + "\n")
             f.write("CONTACT DATA QUALITY REPORT\n")
@@ -691,7 +759,7 @@ class FinalCompiler:
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
             f.write(f"Total Contacts: {len(df)}\n")
-            f.write(f"Unique Schools: {df['School Name'].nunique()}\n\n")
+            f.write(f"Unique Schools: {len(school_counts)}\n\n")
             
             f.write("DATA COMPLETENESS\n")
             f.write("-" * 70 + "\n")
@@ -700,23 +768,22 @@ class FinalCompiler:
                 pct = complete / len(df) * 100
                 f.write(f"{col:15} {complete:5} / {len(df):5} ({pct:5.1f}%)\n")
             
-            f.write("\n" + "CONFIDENCE DISTRIBUTION\n")
-            f.write("-" * 70 + "\n")
-            bins = [(90, 100), (80, 89), (70, 79), (60, 69), (0, 59)]
-            for low, high in bins:
-                count = len(df[(df['Confidence Score'] >= low) & (df['Confidence Score'] <= high)])
-                pct = count / len(df) * 100
-                f.write(f"{low:2}-{high:3}: {count:5} ({pct:5.1f}%)\n")
+            if 'Confidence Score' in df.columns:
+                f.write("\n" + "CONFIDENCE DISTRIBUTION\n")
+                f.write("-" * 70 + "\n")
+                bins = [(90, 100), (80, 89), (70, 79), (60, 69), (0, 59)]
+                for low, high in bins:
+                    count = len(df[(df['Confidence Score'] >= low) & (df['Confidence Score'] <= high)])
+                    pct = count / len(df) * 100
+                    f.write(f"{low:2}-{high:3}: {count:5} ({pct:5.1f}%)\n")
             
             f.write("\n" + "SCHOOLS BY CONTACT COUNT\n")
             f.write("-" * 70 + "\n")
-            school_counts = df.groupby('School Name').size().sort_values(ascending=False)
             for school, count in school_counts.items():
                 f.write(f"{school[:50]:50} {count:3}\n")
             
             f.write("\n" + "TITLE DISTRIBUTION\n")
             f.write("-" * 70 + "\n")
-            title_counts = df['Title'].value_counts()
             for title, count in title_counts.items():
                 f.write(f"{title[:50]:50} {count:3}\n")
         
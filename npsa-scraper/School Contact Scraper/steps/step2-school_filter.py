@@ -348,6 +348,37 @@ class LLMSchoolFilter:
         # Return cached result (should now be in cache after processing)
         return self.cache.get(school_name_lower, False)
     
+    def filter_batch(self, schools: List[School]) -> Dict[str, bool]:
+        """
+        Classify many schools with one API call per batch_size names.
+        
+        Args:
+            schools: School objects to check (already through state and pre-filters)
+            
+        Returns:
+            Dict of lowercased, stripped school name -> True if private Christian/Catholic school
+        """
+        self.flush()
+        
+        # One request slot per uncached name (duplicates share the verdict)
+        uncached = {}
+        for school in schools:
+            if not school.name:
+                continue
+            name_key = school.name.lower().strip()
+            if name_key not in self.cache and name_key not in uncached:
+                uncached[name_key] = school
+        
+        to_check = list(uncached.values())
+        for start in range(0, len(to_check), self.batch_size):
+            self.pending_schools = to_check[start:start + self.batch_size]
+            self._process_batch()
+        
+        return {
+            school.name.lower().strip(): self.cache.get(school.name.lower().strip(), False)
+            for school in schools if school.name
+        }
+    
     def flush(self):
         """Process any remaining schools in the batch."""
         if self.pending_schools:
@@ -514,19 +545,20 @@ def filter_schools_generator(schools: list, target_state: str = 'texas',
     Returns:
         List of filtered School objects
     """
-    filtered = []
-    for school in schools:
-        result = filter_school(school, target_state, llm_filter=llm_filter)
-        if isinstance(result, tuple):
-            filtered_school, _ = result
-        else:
-            filtered_school = result
-        if filtered_school:
-            filtered.append(filtered_school)
-    
-    # Flush any pending LLM batches
-    if llm_filter:
-        llm_filter.flush()
+    # Cheap checks first, then every remaining school goes to the LLM in batches of batch_size
+    # (instead of one request per school through filter_school)
+    candidates = [
+        school for school in schools
+        if is_state_school(school, target_state) and passes_pre_filters(school)
+    ]
+    if not llm_filter:
+        return candidates
+    
+    verdicts = llm_filter.filter_batch(candidates)
+    filtered = [
+        school for school in candidates
+        if school.name and verdicts.get(school.name.lower().strip(), False)
+    ]
     
     return filtered
 
@@ -12,7 +12,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import csv
 import time
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional
 import re
 import pandas as pd
 
@@ -26,9 +26,11 @@ def bold(text: str) -> str:
 
 
 class PageDiscoverer:
-    def __init__(self, timeout: int = 10, max_retries: int = 3):
+    def __init__(self, timeout: int = 10, max_retries: int = 3, session: Optional[requests.Session] = None):
         self.timeout = timeout  # 10 second timeout
         self.max_retries = max_retries  # 1 retry only
+        # Shared session keeps TCP/TLS connections alive across requests (pass one in to share with step 4)
+        self.session = session or requests.Session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
@@ -117,7 +119,7 @@ class PageDiscoverer:
                 else:
                     time.sleep(0.3)  # 300ms delay before retries
                 
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                response = self.session.get(url, headers=self.headers, timeout=self.timeout)
                 response.raise_for_status()
                 return response
             except requests.exceptions.Timeout:
@@ -30,11 +30,22 @@ import subprocess
 import gc
 import os
 import threading
+import asyncio
+import queue
+import atexit
 import platform  # For OS detection
-from typing import List, Dict, Set, Optional
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Set, Optional
 import pandas as pd
 from collections import defaultdict
 
+# Try to import aiohttp for concurrent static page fetches (optional - falls back to threaded requests)
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
 # Try to import psutil for process tree killing (optional)
 try:
     import psutil
@@ -51,17 +62,29 @@ urllib3_logger.setLevel(logging.ERROR)  # Only show ERROR level, suppress WARNIN
 BOLD = '\033[1m'
 RESET = '\033[0m'
 
+# ChromeDriver PID of every live collector's driver, keyed by id(collector). Process cleanup skips
+# the trees of other collectors' drivers, so pooled collectors in one worker never kill each other's Chrome
+_DRIVER_PIDS: Dict[int, int] = {}
+_DRIVER_PIDS_LOCK = threading.Lock()
+
 def bold(text: str) -> str:
     """Make text bold in terminal output"""
     return f"{BOLD}{text}{RESET}"
 
 
 class ContentCollector:
-    def __init__(self, timeout: int = 10, max_retries: int = 3, use_selenium: bool = True, chrome_user_data_dir: Optional[str] = None):
+    def __init__(self, timeout: int = 10, max_retries: int = 3, use_selenium: bool = True, chrome_user_data_dir: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 selenium_fetcher: Optional[Callable[[str, bool], Optional[str]]] = None):
         self.timeout = timeout  # HTTP request timeout (10 seconds)
         self.max_retries = max_retries  # 1 retry only
+        # Shared session keeps TCP/TLS connections alive across requests (pass one in to share with step 3)
+        self.session = session or requests.Session()
         self.use_selenium = use_selenium
         self.chrome_user_data_dir = chrome_user_data_dir  # Use volume path to avoid ephemeral storage exhaustion
+        # When set (e.g. BrowserPool.fetch_with_selenium), Selenium fetches are delegated to it and this
+        # collector never starts a driver of its own - static pages then never hold a browser
+        self.selenium_fetcher = selenium_fetcher
         self.driver = None
         
         # Track if selenium was used for current school (for cleanup message)
@@ -74,7 +97,7 @@ class ContentCollector:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        if use_selenium:
+        if use_selenium and selenium_fetcher is None:
             self.driver = self._setup_selenium()
         
         # Email regex pattern (to check if we should try Selenium)
@@ -231,6 +254,7 @@ class ContentCollector:
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass  # Can't verify, but continue anyway
             
+            self._register_driver(driver)
             return driver
         except Exception as e:
             if retry_count < max_retries:
@@ -261,11 +285,55 @@ class ContentCollector:
                 # Page load timeout handled by thread timeout (900s)
                 driver.set_script_timeout(900)  # Script timeout matches unified timeout
                 print(f"    {bold('[SELENIUM]')} Driver created with minimal options")
+                self._register_driver(driver)
                 return driver
             except Exception as e2:
                 print(f"    {bold('[SELENIUM]')} ERROR: Could not create Chrome driver even with minimal options: {e2}")
                 raise
     
+    def _register_driver(self, driver):
+        """Record this collector's ChromeDriver PID so other collectors' cleanup leaves its tree alone"""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        pid = getattr(process, 'pid', None)
+        with _DRIVER_PIDS_LOCK:
+            if pid:
+                _DRIVER_PIDS[id(self)] = pid
+            else:
+                _DRIVER_PIDS.pop(id(self), None)
+    
+    def _unregister_driver(self):
+        with _DRIVER_PIDS_LOCK:
+            _DRIVER_PIDS.pop(id(self), None)
+    
+    def _owned_chrome_candidates(self, current_process) -> list:
+        """
+        Processes this collector may clean up: its own driver's tree when that driver is alive,
+        otherwise the worker's whole process tree minus other collectors' driver trees.
+        """
+        with _DRIVER_PIDS_LOCK:
+            own_pid = _DRIVER_PIDS.get(id(self))
+            sibling_pids = [pid for key, pid in _DRIVER_PIDS.items() if key != id(self)]
+        
+        if own_pid:
+            try:
+                own = psutil.Process(own_pid)
+                return [own] + own.children(recursive=True)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass  # Driver already gone: fall back to the worker tree (its leftovers)
+        
+        protected = set()
+        for pid in sibling_pids:
+            try:
+                sibling = psutil.Process(pid)
+                protected.add(pid)
+                protected.update(child.pid for child in sibling.children(recursive=True))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        try:
+            return [proc for proc in current_process.children(recursive=True) if proc.pid not in protected]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return []
+    
     def _wait_for_driver_ready(self, driver, max_wait=5):
         """Wait for driver to be ready (ChromeDriver fully initialized)"""
         for attempt in range(max_wait):
@@ -354,6 +422,7 @@ class ContentCollector:
             self._kill_orphaned_chrome_processes()
         finally:
             self.driver = None
+            self._unregister_driver()
             
             # Monitor processes after cleanup
             after_zombies, after_orphaned, after_active = self._get_process_counts()
@@ -399,10 +468,12 @@ class ContentCollector:
         """
         PROCESS-SCOPED cleanup of Chrome/Chromium/ChromeDriver processes.
         Kills processes BOTTOM-UP (children first, then parents) to prevent zombies.
-        Only targets processes in the current worker's process tree (not system-wide).
+        Only targets this collector's own driver tree (driver.service.process) - or, when it has
+        no live driver, the worker's process tree minus other collectors' drivers (not system-wide).
         Protects main container processes (waitress-serve, main Python process, PID 1).
         
-        This prevents killing Chrome processes from other concurrent workers/states.
+        This prevents killing Chrome processes from other concurrent workers/states, and from
+        sibling collectors in the same BrowserPool.
         
         Returns:
             int: Number of processes killed
@@ -447,12 +518,12 @@ class ContentCollector:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
             
-            # Collect Chrome processes in worker's process tree ONLY (not system-wide)
+            # Collect Chrome processes owned by this collector ONLY (not system-wide, not siblings)
             chrome_processes = []
             chrome_process_map = {}  # pid -> Process object
             
             try:
-                for child in current_process.children(recursive=True):
+                for child in self._owned_chrome_candidates(current_process):
                     try:
                         # child.name() returns the process name directly (no .info attribute)
                         name = child.name().lower()
@@ -687,7 +758,7 @@ class ContentCollector:
                 else:
                     time.sleep(0.3)  # 300ms delay before retries
                 
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                response = self.session.get(url, headers=self.headers, timeout=self.timeout)
                 response.raise_for_status()
                 return response
             except requests.exceptions.Timeout:
@@ -704,6 +775,38 @@ class ContentCollector:
                     return None  # Return None instead of raising
         return None
     
+    async def fetch_all(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetch static HTML for several URLs concurrently (TIER 1 only, no Selenium).
+        
+        Uses one aiohttp session for all URLs when aiohttp is installed, otherwise
+        runs safe_get() for each URL in worker threads.
+        
+        Returns:
+            Dictionary of url -> HTML text (None if the fetch failed)
+        """
+        if not urls:
+            return {}
+        
+        if not HAS_AIOHTTP:
+            responses = await asyncio.gather(*(asyncio.to_thread(self.safe_get, url) for url in urls))
+            return {url: (response.text if response is not None else None) for url, response in zip(urls, responses)}
+        
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=20)
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector) as session:
+            async def fetch(url: str) -> Optional[str]:
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.text(errors='replace')
+                except Exception:
+                    # Silent failure - collect_page_content() retries via safe_get()/Selenium
+                    return None
+            
+            pages = await asyncio.gather(*(fetch(url) for url in urls))
+        return dict(zip(urls, pages))
+    
     def _get_url_with_timeout(self, driver, url: str, timeout: int = 900) -> bool:
         """
         Wrapper for driver.get() with a hard timeout (default 900 seconds).
@@ -904,7 +1007,13 @@ class ContentCollector:
             # Mark that selenium was used for this school
             self._selenium_used_for_school = True
     
-    def collect_page_content(self, school_name: str, url: str) -> Optional[Dict]:
+    def _fetch_selenium_html(self, url: str) -> Optional[str]:
+        """TIER 2 fetch: through selenium_fetcher when one was given, else this collector's own driver"""
+        if self.selenium_fetcher is not None:
+            return self.selenium_fetcher(url, True)
+        return self.fetch_with_selenium(url, interact=True)
+    
+    def collect_page_content(self, school_name: str, url: str, prefetched_html: Optional[str] = None) -> Optional[Dict]:
         """
         Collect HTML content from a page using OPTIMIZED approach:
         
@@ -913,6 +1022,9 @@ class ContentCollector:
         3. Only process full HTML if page passes initial checks
         4. Hard timeout at 900 seconds - forces cleanup regardless of state
         
+        prefetched_html: static HTML already fetched for this URL (see fetch_all);
+        when given, the TIER 1 request is skipped.
+        
         Returns:
             Dictionary with school_name, url, html_content, fetch_method, email_count
             Returns None if page fetch failed or timed out
@@ -929,7 +1041,7 @@ class ContentCollector:
         def _collect_with_timeout():
             """Inner function that does the actual collection"""
             try:
-                result_container[0] = self._collect_page_content_inner(school_name, url, page_start_time)
+                result_container[0] = self._collect_page_content_inner(school_name, url, page_start_time, prefetched_html)
             except Exception as e:
                 exception_container[0] = e
         
@@ -986,7 +1098,8 @@ class ContentCollector:
         
         return result_container[0]
     
-    def _collect_page_content_inner(self, school_name: str, url: str, page_start_time: float) -> Optional[Dict]:
+    def _collect_page_content_inner(self, school_name: str, url: str, page_start_time: float,
+                                    prefetched_html: Optional[str] = None) -> Optional[Dict]:
         """
         Inner method that does the actual page content collection.
         Called by collect_page_content() which wraps it with a forced timeout.
@@ -996,21 +1109,26 @@ class ContentCollector:
             fetch_method = 'unknown'
             
             # TIER 1: Try Beautiful Soup first (simple HTML scraping)
-            response = self.safe_get(url)
-            if not response:
-                # If requests failed, try Selenium directly (if enabled)
-                if self.use_selenium:
-                    print(f"    WARNING: Requests failed, trying Selenium...")
-                    html_selenium = self.fetch_with_selenium(url, interact=True)
-                    if html_selenium:
-                        html = html_selenium
-                        fetch_method = 'selenium'
-                else:
-                    print(f"    ERROR: Failed to fetch page content")
-                    return None
-            else:
-                html = response.text
+            if prefetched_html:
+                # Static HTML was already fetched concurrently (see fetch_all)
+                html = prefetched_html
                 fetch_method = 'requests'
+            else:
+                response = self.safe_get(url)
+                if not response:
+                    # If requests failed, try Selenium directly (if enabled)
+                    if self.use_selenium:
+                        print(f"    WARNING: Requests failed, trying Selenium...")
+                        html_selenium = self._fetch_selenium_html(url)
+                        if html_selenium:
+                            html = html_selenium
+                            fetch_method = 'selenium'
+                    else:
+                        print(f"    ERROR: Failed to fetch page content")
+                        return None
+                else:
+                    html = response.text
+                    fetch_method = 'requests'
             
             # Timeout is handled by thread timeout (900s) - no need to check here
             
@@ -1075,7 +1193,7 @@ class ContentCollector:
                         print(f"    Found {len(emails)} emails + high-value titles detected, using Selenium for comprehensive extraction...")
                     
                     # TIER 2: Use Selenium for better extraction
-                    html_selenium = self.fetch_with_selenium(url, interact=True)
+                    html_selenium = self._fetch_selenium_html(url)
                     if html_selenium:
                         html = html_selenium
                         fetch_method = 'selenium'
@@ -1219,6 +1337,124 @@ class ContentCollector:
         print(f"{bold('[STEP 4]')} Complete: {len(df)}/{len(pages_df)} pages collected, {schools_with_content}/{schools_processed} schools, {total_emails} emails")
 
 
+
+class BrowserPool:
+    """
+    Pool of pre-warmed ContentCollector instances, each owning one headless Chrome driver.
+    
+    Collectors are checked out with acquire() and returned automatically. A driver is
+    recycled (quit + relaunched) after max_uses pages or when it fails a health check,
+    so long runs don't accumulate Chrome memory.
+    
+    Process cleanup in each collector is scoped to its own driver's process tree, so one
+    collector's cleanup or hard timeout never kills a sibling's Chrome mid-page.
+    
+    Use fetch_with_selenium() as a ContentCollector's selenium_fetcher so a driver is only
+    checked out for the Selenium fetch itself, not while static HTML is being parsed.
+    """
+    
+    def __init__(self, size: int = 1, max_uses: int = 50, timeout: int = 10, max_retries: int = 3,
+                 use_selenium: bool = True, chrome_user_data_dir: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self._collector_kwargs = {'timeout': timeout, 'max_retries': max_retries, 'use_selenium': use_selenium,
+                                  'session': session}
+        self._chrome_user_data_dir = chrome_user_data_dir
+        self._uses: Dict[int, int] = {}
+        self._collectors: List[ContentCollector] = []
+        self._available = queue.Queue()
+        self._closed = False
+        
+        for index in range(self.size):
+            collector = ContentCollector(chrome_user_data_dir=self._user_data_dir_for(index), **self._collector_kwargs)
+            collector._pool_index = index
+            self._uses[index] = 0
+            self._collectors.append(collector)
+            self._available.put(collector)
+        
+        atexit.register(self.close)
+    
+    def _user_data_dir_for(self, index: int) -> Optional[str]:
+        """Chrome refuses to share a profile directory between instances, so give each driver its own"""
+        if not self._chrome_user_data_dir or self.size == 1:
+            return self._chrome_user_data_dir
+        return os.path.join(self._chrome_user_data_dir, f'browser_{index}')
+    
+    @property
+    def primary(self) -> ContentCollector:
+        """First collector in the pool (kept for callers that expect a single ContentCollector)"""
+        return self._collectors[0]
+    
+    @contextmanager
+    def acquire(self):
+        """Check out a collector for the duration of the with-block"""
+        collector = self._available.get()
+        try:
+            yield collector
+        finally:
+            self._release(collector)
+    
+    def fetch_with_selenium(self, url: str, interact: bool = True) -> Optional[str]:
+        """Check out a pooled driver just long enough to fetch url with Selenium"""
+        with self.acquire() as collector:
+            return collector.fetch_with_selenium(url, interact=interact)
+    
+    def _release(self, collector: ContentCollector):
+        """Health-check a returned collector, recycling its driver if needed"""
+        index = collector._pool_index
+        self._uses[index] += 1
+        
+        if collector.use_selenium and not self._closed:
+            if self._uses[index] >= self.max_uses or not self._is_healthy(collector):
+                self._recycle_driver(collector)
+                self._uses[index] = 0
+        
+        self._available.put(collector)
+    
+    def _is_healthy(self, collector: ContentCollector) -> bool:
+        """A driver is healthy if it still answers a trivial script call"""
+        if not collector.driver:
+            return False
+        try:
+            collector.driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+        except Exception:
+            return False
+    
+    def _recycle_driver(self, collector: ContentCollector):
+        """Quit only this collector's driver and launch a replacement"""
+        driver = collector.driver
+        collector.driver = None
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        collector._unregister_driver()
+        try:
+            collector.driver = collector._setup_selenium()
+        except Exception as e:
+            # Leave driver as None - _ensure_driver_healthy() will retry on next use
+            print(f"    {bold('[SELENIUM]')} Could not relaunch pooled driver: {e}")
+    
+    def close(self):
+        """Quit all pooled drivers (registered with atexit)"""
+        if self._closed:
+            return
+        self._closed = True
+        for collector in self._collectors:
+            driver = collector.driver
+            collector.driver = None
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            collector._unregister_driver()
+
 if __name__ == "__main__":
     import argparse
     
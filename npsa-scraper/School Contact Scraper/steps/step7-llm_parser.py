@@ -7,11 +7,14 @@ Input: HTML chunk from Step 6
 Output: CSV text with contacts
 """
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import asyncio
 import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 import re
 
+from assets.shared.llm_cache import LLMCache
+
 # ANSI escape codes for bold text
 BOLD = '\033[1m'
 RESET = '\033[0m'
@@ -80,18 +83,112 @@ IMPORTANT: Extract ALL people with names and titles. Do NOT filter by role - tha
 class LLMParser:
     """Send HTML chunks to LLM and extract contacts."""
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", cache: Optional[LLMCache] = None):
         """
         Initialize LLM parser
         
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini)
+            cache: Response cache (default: shared on-disk LLMCache)
         """
         self.api_key = api_key
         self.model = model
         # Note: timeout removed to avoid "signal only works in main thread" error when running in background threads
         self.client = OpenAI(api_key=api_key)
+        # Async client is created lazily per event loop (its HTTP pool is bound to the loop)
+        self._async_client = None
+        self._async_client_loop = None
+        self.cache = cache if cache is not None else LLMCache()
+    
+    def _build_request(self, html_chunk: str, school_name: str, url: str):
+        """
+        Build chat messages and max_tokens for one HTML chunk
+        
+        Returns:
+            Tuple of (messages, max_tokens)
+        """
+        # Build user message with metadata and HTML chunk only
+        # The full prompt is in the system message (sent once per session, not per chunk)
+        user_message = f"""SCHOOL NAME: {school_name}
+PAGE URL: {url}
+
+HTML CONTENT:
+{html_chunk}"""
+        
+        # Estimate tokens for max_tokens calculation
+        estimated_input_tokens = len(html_chunk) // 4
+        
+        # Safety check: if chunk is still too large, it should have been split earlier
+        # But as a final safeguard, we'll note it (shouldn't happen with improved chunking)
+        if len(html_chunk) > 100000:
+            print(f"      WARNING: HTML chunk still too large ({len(html_chunk):,} chars) - this should have been split earlier!")
+            # Don't truncate - this indicates a bug in chunking logic
+            # Process it anyway but log the issue
+        
+        # Set max_tokens based on input size
+        if estimated_input_tokens > 20000:
+            max_tokens = 32000
+        elif estimated_input_tokens > 10000:
+            max_tokens = 16000
+        else:
+            max_tokens = 8000
+        
+        messages = [
+            {"role": "system", "content": CONTACT_EXTRACTION_PROMPT},
+            {"role": "user", "content": user_message}
+        ]
+        return messages, max_tokens
+    
+    def _cache_key(self, messages: List[Dict]) -> str:
+        """Cache key covers model, system prompt and the full user message"""
+        return self.cache.make_key(self.model, *(m["content"] for m in messages))
+    
+    def _retry_delay(self, e: Exception, attempt: int, max_retries: int):
+        """
+        Decide whether a failed request should be retried
+        
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        error_str = str(e)
+        
+        # Check if it's a timeout error
+        is_timeout = 'timeout' in error_str.lower() or 'timed out' in error_str.lower()
+        if is_timeout:
+            print(f"      {bold('[LLM]')} Request timed out (attempt {attempt + 1}/{max_retries})")
+            return 1.0 if attempt < max_retries - 1 else None
+        
+        # Check if it's a rate limit error (429)
+        is_rate_limit = '429' in error_str or 'rate_limit' in error_str.lower() or 'rate limit' in error_str.lower()
+        
+        if is_rate_limit:
+            # Try to extract wait time from error message
+            wait_seconds = 1.0  # Default wait
+            # Look for "Please try again in Xms" or "Please try again in Xs"
+            wait_match = re.search(r'Please try again in (\d+)(ms|s)', error_str, re.IGNORECASE)
+            if wait_match:
+                wait_value = int(wait_match.group(1))
+                wait_unit = wait_match.group(2).lower()
+                if wait_unit == 'ms':
+                    wait_seconds = (wait_value / 1000.0) + 0.5  # Add 0.5s buffer
+                else:
+                    wait_seconds = wait_value + 0.5  # Add 0.5s buffer
+            
+            # For rate limits, wait longer and retry
+            if attempt < max_retries - 1:
+                print(f"      {bold('[LLM]')} Rate limit hit (attempt {attempt + 1}/{max_retries}), waiting {wait_seconds:.1f}s...")
+                return wait_seconds
+            print(f"      {bold('[LLM]')} Rate limit exceeded after {max_retries} attempts. Skipping this chunk.")
+            return None
+        
+        # For other errors, use exponential backoff
+        if attempt < max_retries - 1:
+            wait_time = 2 ** attempt
+            print(f"      {bold('[LLM]')} Error (attempt {attempt + 1}/{max_retries}): {e}, retrying in {wait_time}s...")
+            return wait_time
+        print(f"      {bold('[LLM]')} Error: {e}")
+        return None
     
     def parse_with_llm(self, html_chunk: str, school_name: str, url: str, max_retries: int = 1) -> str:
         """
@@ -106,95 +203,77 @@ class LLMParser:
         Returns:
             CSV text from LLM (or empty string on error)
         """
+        messages, max_tokens = self._build_request(html_chunk, school_name, url)
+        cache_key = self._cache_key(messages)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         for attempt in range(max_retries):
             try:
-                # Build user message with metadata and HTML chunk only
-                # The full prompt is in the system message (sent once per session, not per chunk)
-                user_message = f"""SCHOOL NAME: {school_name}
-PAGE URL: {url}
-
-HTML CONTENT:
-{html_chunk}"""
-                
-                # Estimate tokens for max_tokens calculation
-                estimated_input_tokens = len(html_chunk) // 4
-                
-                # Safety check: if chunk is still too large, it should have been split earlier
-                # But as a final safeguard, we'll note it (shouldn't happen with improved chunking)
-                if len(html_chunk) > 100000:
-                    print(f"      WARNING: HTML chunk still too large ({len(html_chunk):,} chars) - this should have been split earlier!")
-                    # Don't truncate - this indicates a bug in chunking logic
-                    # Process it anyway but log the issue
-                
-                # Set max_tokens based on input size
-                if estimated_input_tokens > 20000:
-                    max_tokens = 32000
-                elif estimated_input_tokens > 10000:
-                    max_tokens = 16000
-                else:
-                    max_tokens = 8000
-                
                 # Note: Removed signal-based timeout as it doesn't work in background threads
                 # The OpenAI library will handle timeouts internally if needed
                 response = self.client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {"role": "system", "content": CONTACT_EXTRACTION_PROMPT},
-                        {"role": "user", "content": user_message}
-                    ],
+                    messages=messages,
                     temperature=0.0,
                     max_tokens=max_tokens
                 )
                 
                 # Extract response text
                 response_text = response.choices[0].message.content.strip()
-                
+                if response_text:
+                    self.cache.set(cache_key, response_text)
                 return response_text
                 
             except Exception as e:
-                error_str = str(e)
-                
-                # Check if it's a timeout error
-                is_timeout = 'timeout' in error_str.lower() or 'timed out' in error_str.lower()
-                if is_timeout:
-                    print(f"      {bold('[LLM]')} Request timed out (attempt {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        time.sleep(1.0)
-                        continue
+                wait_seconds = self._retry_delay(e, attempt, max_retries)
+                if wait_seconds is None:
                     return ""
+                time.sleep(wait_seconds)
+        
+        return ""
+    
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Return an AsyncOpenAI client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def parse_with_llm_async(self, html_chunk: str, school_name: str, url: str, max_retries: int = 1) -> str:
+        """
+        Async variant of parse_with_llm (uses AsyncOpenAI so chunks can be gathered)
+        
+        Returns:
+            CSV text from LLM (or empty string on error)
+        """
+        messages, max_tokens = self._build_request(html_chunk, school_name, url)
+        cache_key = self._cache_key(messages)
+        # Cache reads/writes are file I/O - keep them off the event loop
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is not None:
+            return cached
+        
+        client = self._get_async_client()
+        for attempt in range(max_retries):
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.0,
+                    max_tokens=max_tokens
+                )
+                response_text = response.choices[0].message.content.strip()
+                if response_text:
+                    await asyncio.to_thread(self.cache.set, cache_key, response_text)
+                return response_text
                 
-                # Check if it's a rate limit error (429)
-                is_rate_limit = '429' in error_str or 'rate_limit' in error_str.lower() or 'rate limit' in error_str.lower()
-                
-                if is_rate_limit:
-                    # Try to extract wait time from error message
-                    wait_seconds = 1.0  # Default wait
-                    # Look for "Please try again in Xms" or "Please try again in Xs"
-                    wait_match = re.search(r'Please try again in (\d+)(ms|s)', error_str, re.IGNORECASE)
-                    if wait_match:
-                        wait_value = int(wait_match.group(1))
-                        wait_unit = wait_match.group(2).lower()
-                        if wait_unit == 'ms':
-                            wait_seconds = (wait_value / 1000.0) + 0.5  # Add 0.5s buffer
-                        else:
-                            wait_seconds = wait_value + 0.5  # Add 0.5s buffer
-                    
-                    # For rate limits, wait longer and retry
-                    if attempt < max_retries - 1:
-                        print(f"      {bold('[LLM]')} Rate limit hit (attempt {attempt + 1}/{max_retries}), waiting {wait_seconds:.1f}s...")
-                        time.sleep(wait_seconds)
-                        continue
-                    else:
-                        print(f"      {bold('[LLM]')} Rate limit exceeded after {max_retries} attempts. Skipping this chunk.")
-                        return ""
-                else:
-                    # For other errors, use exponential backoff
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"      {bold('[LLM]')} Error (attempt {attempt + 1}/{max_retries}): {e}, retrying in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    print(f"      {bold('[LLM]')} Error: {e}")
+            except Exception as e:
+                wait_seconds = self._retry_delay(e, attempt, max_retries)
+                if wait_seconds is None:
                     return ""
+                await asyncio.sleep(wait_seconds)
         
         return ""
@@ -13,6 +13,24 @@ import re
 import pandas as pd
 from typing import List, Dict
 
+# Optional: google-re2 gives linear-time matching on malformed LLM output (falls back to re)
+try:
+    import re2 as _re_engine
+    HAS_RE2 = True
+except ImportError:
+    _re_engine = re
+    HAS_RE2 = False
+
+# Deletion table for ASCII control characters (clean_email keeps printable ASCII only)
+_ASCII_CONTROL_CHARS = str.maketrans('', '', ''.join(map(chr, [*range(32), 127])))
+
+# Final email format check (patterns use inline flags so they compile under both re and re2)
+_EMAIL_RE = _re_engine.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Markdown code fences the LLM sometimes wraps around its CSV
+_FENCE_OPEN_CSV_RE = _re_engine.compile(r'(?m)^```csv\s*')
+_FENCE_OPEN_RE = _re_engine.compile(r'(?m)^```\s*')
+_FENCE_CLOSE_RE = _re_engine.compile(r'(?m)\s*```$')
+
 
 class CSVParser:
     """Parse CSV response from LLM and clean email addresses."""
@@ -32,47 +50,9 @@ class CSVParser:
         
         email = str(email).strip()
         
-        # Handle UTF-8 encoding artifacts like "â€‹" which appears when zero-width space is mis-encoded
-        # Try to decode and re-encode to fix encoding issues
-        try:
-            # If the string contains "â€‹" (common mis-encoding of zero-width space)
-            if 'â€‹' in email:
-                # Try to fix by removing the problematic sequence
-                email = email.replace('â€‹', '')
-            # Also try removing if it's the actual zero-width space character
-            email = email.lstrip('\u200B\u200C\u200D\uFEFF')  # Zero-width space, zero-width non-joiner, etc.
-        except:
-            pass
-        
-        # Remove UTF-8 BOM and other encoding artifacts
-        if email.startswith('\ufeff'):
-            email = email[1:]
-        
-        # Remove any other common encoding artifacts at the start
-        # Remove leading non-printable characters
-        while email and not email[0].isprintable() and email[0] != '@':
-            email = email[1:]
-        
-        # Remove any leading non-ASCII characters that aren't valid email characters
-        # Keep only printable ASCII characters and valid email characters
-        cleaned = ''
-        found_at = False
-        for char in email:
-            # Always keep @ symbol
-            if char == '@':
-                found_at = True
-                cleaned += char
-            # Allow ASCII printable characters and common email characters
-            elif ord(char) < 128 and (char.isprintable() or char in '._-+'):
-                cleaned += char
-            # Skip other non-ASCII characters (but only before @)
-            # After @, we might have internationalized domain names, but for now we'll be strict
-            elif found_at and ord(char) < 128:
-                # After @, allow some non-ASCII if it's part of a valid domain
-                # But for safety, we'll be conservative
-                pass
-        
-        email = cleaned.strip()
+        # Keep only printable ASCII: dropping non-ASCII removes zero-width spaces, BOMs and
+        # mis-encoded artifacts like "â€‹"; the translate table drops ASCII control characters
+        email = email.encode('ascii', 'ignore').decode('ascii').translate(_ASCII_CONTROL_CHARS).strip()
         
         # Basic email format validation - must contain @ and have valid structure
         # This filters out things like "Bobcat Heavy Civil" or "ISAIAH'S PLACE | ASL & EQUINE ASSISTED LEARNING"
@@ -100,8 +80,7 @@ class CSVParser:
             return ''  # Emails shouldn't have spaces
         
         # Final regex validation for proper email format
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        if not _EMAIL_RE.match(email):
             return ''
         
         return email.lower()
@@ -119,9 +98,9 @@ class CSVParser:
         contacts = []
         
         # Clean up response (remove markdown code blocks if present)
-        csv_text = re.sub(r'^```csv\s*', '', csv_text, flags=re.MULTILINE)
-        csv_text = re.sub(r'^```\s*', '', csv_text, flags=re.MULTILINE)
-        csv_text = re.sub(r'\s*```$', '', csv_text, flags=re.MULTILINE)
+        csv_text = _FENCE_OPEN_CSV_RE.sub('', csv_text)
+        csv_text = _FENCE_OPEN_RE.sub('', csv_text)
+        csv_text = _FENCE_CLOSE_RE.sub('', csv_text)
         csv_text = csv_text.strip()
         
         # Parse CSV